@@ -0,0 +1,140 @@
+import asyncio
+import time
+from urllib.parse import urlparse
+import aiohttp
+
+import fetch
+import metrics
+import replay
+from fetch import BACKOFF_FACTOR, MAX_RETRIES, RETRY_STATUSES
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+# Politeness limits, applied separately to each domain
+PER_DOMAIN_CONCURRENCY = 4   # requests in flight at once
+RATE_PER_SECOND = 4.0        # sustained request rate
+BURST = 2                    # requests allowed back-to-back before rate limiting kicks in
+
+TIMEOUT = 30
+
+class TokenBucket:
+    """Token-bucket rate limiter: allows short bursts, then a steady rate"""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+class AsyncFetcher:
+    """Fetch many pages concurrently with per-domain concurrency and rate limits"""
+
+    def __init__(self, headers=None, concurrency=PER_DOMAIN_CONCURRENCY,
+                 rate=RATE_PER_SECOND, burst=BURST, timeout=TIMEOUT):
+        self.headers = headers or DEFAULT_HEADERS
+        self.concurrency = concurrency
+        self.rate = rate
+        self.burst = burst
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self._semaphores = {}
+        self._buckets = {}
+
+    def _limits(self, url):
+        domain = urlparse(url).netloc.lower()
+        if domain not in self._semaphores:
+            self._semaphores[domain] = asyncio.Semaphore(self.concurrency)
+            self._buckets[domain] = TokenBucket(self.rate, self.burst)
+        return self._semaphores[domain], self._buckets[domain]
+
+    async def fetch(self, session, url):
+        """Return the response body for url, or None if the request failed"""
+        with metrics.span('fetch', url=url) as info:
+            if replay.mode == 'replay':
+                body = replay.replay_body(url)
+                info['source'] = 'replay'
+                metrics.count('replayed', 1 if body is not None else 0)
+            else:
+                body = await self._fetch(session, url)
+                if replay.mode == 'record' and body is not None:
+                    replay.record_body(url, 200, body)
+            info['bytes'] = len(body) if body is not None else 0
+        return body
+
+    async def _fetch(self, session, url):
+        semaphore, bucket = self._limits(url)
+
+        # Revalidate against the shared on-disk cache used by fetch.get
+        cache = fetch.cache
+        cached = cache.lookup(url) if cache else None
+        request_headers = cache.conditional_headers(cached[0]) if cached else {}
+
+        async with semaphore:
+            for attempt in range(MAX_RETRIES + 1):
+                await bucket.acquire()
+                try:
+                    print(f"  Fetching: {url}")
+                    async with session.get(url, headers=request_headers) as response:
+                        if response.status == 304 and cached:
+                            cache.refresh(url, cached[0])
+                            metrics.count('cache_hits')
+                            return cached[1]
+
+                        if response.status not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                            response.raise_for_status()
+                            body = await response.read()
+                            metrics.count('bytes_fetched', len(body))
+                            if cache and response.status == 200:
+                                cache.store(url, response.headers, body)
+                            return body
+
+                        status = response.status
+                        retry_after = response.headers.get('Retry-After', '')
+                except Exception as e:
+                    print(f"  Error fetching {url}: {e}")
+                    return None
+
+                # Same backoff as the shared requests session in fetch.py
+                delay = float(retry_after) if retry_after.isdigit() else BACKOFF_FACTOR * (2 ** attempt)
+                metrics.count('retries')
+                print(f"  Got {status} for {url}, retrying in {delay:.0f}s")
+                await asyncio.sleep(delay)
+
+    async def fetch_all(self, urls, on_page=None):
+        """Fetch every URL and return {url: body or None}.
+
+        on_page(url, body), if given, is called as each page arrives rather than
+        after the whole batch, so callers can save progress page by page.
+        """
+        urls = list(dict.fromkeys(urls))
+
+        async def fetch_one(session, url):
+            body = await self.fetch(session, url)
+            if on_page is not None:
+                on_page(url, body)
+            return body
+
+        async with aiohttp.ClientSession(headers=self.headers, timeout=self.timeout) as session:
+            bodies = await asyncio.gather(*(fetch_one(session, url) for url in urls))
+
+        return dict(zip(urls, bodies))
+
+def fetch_all(urls, headers=None, on_page=None, **kwargs):
+    """Synchronous entry point for scripts: fetch every URL concurrently"""
+    fetcher = AsyncFetcher(headers=headers, **kwargs)
+    return asyncio.run(fetcher.fetch_all(urls, on_page))
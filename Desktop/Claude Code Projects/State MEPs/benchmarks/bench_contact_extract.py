@@ -0,0 +1,82 @@
+"""Micro-benchmark: contact_extract.extract_contacts vs the old inline regex path.
+
+Run from the State MEPs folder:  python benchmarks/bench_contact_extract.py [repeats]
+"""
+import glob
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from contact_extract import extract_contacts
+from html_parse import make_soup
+
+def legacy_contacts(soup):
+    """The phone/mobile/email code extract_profile_details used before contact_extract"""
+    phone = ""
+    mobile = ""
+    email = ""
+
+    phone_links = soup.find_all('a', href=re.compile(r'tel:'))
+    if phone_links:
+        for link in phone_links:
+            phone_text = link.get_text(strip=True)
+            if 'mobile' in link.get('title', '').lower() or 'cell' in link.get('title', '').lower():
+                mobile = phone_text
+            elif not phone:
+                phone = phone_text
+
+    email_links = soup.find_all('a', href=re.compile(r'mailto:'))
+    if email_links:
+        email_href = email_links[0].get('href', '')
+        email = email_href.replace('mailto:', '')
+
+    page_text = soup.get_text()
+
+    if not phone or not mobile:
+        phone_pattern = r'Phone:\s*\(?(\d{3})\)?[-.\s]?(\d{3})[-.\s]?(\d{4})'
+        mobile_pattern = r'(?:Mobile|Cell):\s*\(?(\d{3})\)?[-.\s]?(\d{3})[-.\s]?(\d{4})'
+
+        phone_match = re.search(phone_pattern, page_text)
+        if phone_match and not phone:
+            phone = f"({phone_match.group(1)}) {phone_match.group(2)}-{phone_match.group(3)}"
+
+        mobile_match = re.search(mobile_pattern, page_text)
+        if mobile_match and not mobile:
+            mobile = f"({mobile_match.group(1)}) {mobile_match.group(2)}-{mobile_match.group(3)}"
+
+    if not email:
+        email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
+        email_match = re.search(email_pattern, page_text)
+        if email_match:
+            email = email_match.group(0)
+
+    return phone, mobile, email
+
+def new_contacts(soup):
+    contacts = extract_contacts(soup)
+    return contacts['Phone'], contacts['Mobile'], contacts['Email']
+
+if __name__ == "__main__":
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+    pages = sorted(glob.glob('*.html'))
+    if not pages:
+        print("No HTML snapshots found - run this from the State MEPs folder")
+        sys.exit(1)
+
+    soups = [(path, make_soup(open(path, 'rb').read())) for path in pages]
+
+    print(f"{'Page':<28} {'old (ms)':>10} {'new (ms)':>10} {'speedup':>8}  same result")
+    total_old = total_new = 0.0
+    for path, soup in soups:
+        old = min(timeit.repeat(lambda: legacy_contacts(soup), number=1, repeat=repeats)) * 1000
+        new = min(timeit.repeat(lambda: new_contacts(soup), number=1, repeat=repeats)) * 1000
+        total_old += old
+        total_new += new
+        same = legacy_contacts(soup) == new_contacts(soup)
+        print(f"{path:<28} {old:>10.3f} {new:>10.3f} {old / new:>7.1f}x  {'yes' if same else 'no'}")
+
+    print(f"{'TOTAL':<28} {total_old:>10.3f} {total_new:>10.3f} {total_old / total_new:>7.1f}x")
@@ -0,0 +1,38 @@
+"""Benchmark: normalize.normalize_staff on a large frame built from the scraped CSVs.
+
+Run from the State MEPs folder:  python benchmarks/bench_normalize.py [rows]
+"""
+import glob
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from normalize import normalize_emails, normalize_names, normalize_phones, normalize_staff
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+
+    paths = glob.glob('*_staff_*.csv')
+    if not paths:
+        print("No staff CSVs found - run this from the State MEPs folder")
+        sys.exit(1)
+
+    sample = pd.concat([pd.read_csv(path, dtype=str) for path in paths], ignore_index=True)
+    df = pd.concat([sample] * (rows // len(sample) + 1), ignore_index=True).head(rows)
+    print(f"{len(df)} rows built from {len(sample)} scraped records\n")
+
+    for label, fn, column in [('Name', normalize_names, 'Name'),
+                              ('Phone', normalize_phones, 'Phone'),
+                              ('Mobile', normalize_phones, 'Mobile'),
+                              ('Email', normalize_emails, 'Email')]:
+        start = time.perf_counter()
+        fn(df[column])
+        print(f"  {label:<8} {(time.perf_counter() - start) * 1000:8.1f} ms")
+
+    start = time.perf_counter()
+    normalize_staff(df)
+    print(f"\n  {'Total':<8} {(time.perf_counter() - start) * 1000:8.1f} ms")
@@ -0,0 +1,171 @@
+"""Benchmark: each state's extraction run offline against the saved HTML snapshots.
+
+Reports parse time, extraction time, peak memory and record count per snapshot,
+and compares them with the saved baseline so parser/extractor regressions show
+up as numbers.
+
+Run from the State MEPs folder:
+    python benchmarks/bench_snapshots.py [repeats]          compare against the baseline
+    python benchmarks/bench_snapshots.py [repeats] --save   record a new baseline
+"""
+import contextlib
+import io
+import json
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config_scraper import compiled_config, has_config
+from contact_extract import extract_contacts
+from html_parse import make_soup, make_state_soup
+from scrape_alabama_full import extract_alabama_staff
+from scrape_alaska_final import extract_alaska_staff
+from scrape_arizona_final import extract_arizona_staff
+from scrape_arkansas_staff import extract_team_list
+from scrape_colorado_simple import extract_colorado_staff
+from scrape_delaware_final import extract_delaware_staff
+from scrape_state import extract_staff_list
+
+BASELINE = os.path.join('benchmarks', 'snapshot_baselines.json')
+
+# A snapshot is flagged when it gets this much slower than its baseline...
+SLOWDOWN_THRESHOLD = 1.25
+# ...and by at least this many ms (sub-millisecond pages are mostly timer noise)
+MIN_SLOWDOWN_MS = 0.5
+
+# (state, snapshot, kind): 'roster' pages list staff, 'profile' pages describe one person.
+# Only pages the state's scraper actually extracts from; the other saved pages
+# (alaska_page, delaware_page/about/board, the Georgia 403s) have no extractor to time.
+SNAPSHOTS = [
+    ('AL', 'alabama_page.html', 'roster'),
+    ('AK', 'alaska_about.html', 'roster'),
+    ('AZ', 'arizona_page.html', 'roster'),
+    ('AZ', 'arizona_rendered.html', 'roster'),
+    ('AR', 'arkansas_page.html', 'roster'),
+    ('CA', 'california_page.html', 'roster'),
+    ('CO', 'colorado_page.html', 'roster'),
+    ('CT', 'connecticut_page.html', 'roster'),
+    ('CT', 'ct_sample_profile.html', 'profile'),
+    ('DE', 'delaware_contact.html', 'roster'),
+    ('FL', 'florida_page.html', 'roster'),
+]
+
+# Roster extractors of the states scraped by their own script rather than a config
+BESPOKE = {
+    'AL': (lambda html: make_state_soup('AL', html), lambda soup: extract_alabama_staff(soup)[0]),
+    'AK': (make_soup, extract_alaska_staff),
+    'AZ': (make_soup, extract_arizona_staff),
+    'AR': (make_soup, extract_team_list),
+    'CO': (make_soup, extract_colorado_staff),
+    'DE': (make_soup, extract_delaware_staff),
+}
+
+def extractor_for(state, kind):
+    """Return (parse, extract) for a snapshot, using the same code path the scrapers use"""
+    if kind == 'profile':
+        if has_config(state) and compiled_config(state).profile_fields:
+            fields = compiled_config(state).profile_fields
+            # Same as CompiledConfig.extract_profile, split so parsing is timed separately
+            return make_soup, lambda soup: [{column: extract(soup) for column, extract in fields.items()}]
+        return make_soup, lambda soup: [extract_contacts(soup)]
+
+    if has_config(state):
+        compiled = compiled_config(state)
+        return compiled.parse, compiled.extract_list
+
+    if state in BESPOKE:
+        return BESPOKE[state]
+
+    return make_soup, lambda soup: extract_staff_list(soup, '')[0]
+
+def best_ms(fn, repeats):
+    return min(timeit.repeat(fn, number=1, repeat=repeats)) * 1000
+
+def run_snapshot(state, path, kind, repeats):
+    with open(path, 'rb') as f:
+        html = f.read()
+    parse, extract = extractor_for(state, kind)
+
+    # The extractors print progress; keep it out of the report
+    with contextlib.redirect_stdout(io.StringIO()):
+        soup = parse(html)
+        parse_ms = best_ms(lambda: parse(html), repeats)
+        extract_ms = best_ms(lambda: extract(soup), repeats)
+
+        tracemalloc.start()
+        records = extract(parse(html))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return {
+        'state': state,
+        'kind': kind,
+        'bytes': len(html),
+        'parse_ms': round(parse_ms, 3),
+        'extract_ms': round(extract_ms, 3),
+        'peak_kb': round(peak / 1024, 1),
+        'records': len(records),
+    }
+
+def regressions(result, baseline):
+    """Describe how result got worse than its baseline entry (empty list if it didn't)"""
+    problems = []
+    for key in ('parse_ms', 'extract_ms'):
+        old, new = baseline[key], result[key]
+        if new > old * SLOWDOWN_THRESHOLD and new - old > MIN_SLOWDOWN_MS:
+            problems.append(f"{key} {old:.2f} -> {new:.2f}")
+    if result['peak_kb'] > baseline['peak_kb'] * SLOWDOWN_THRESHOLD:
+        problems.append(f"peak_kb {baseline['peak_kb']:.0f} -> {result['peak_kb']:.0f}")
+    if result['records'] != baseline['records']:
+        problems.append(f"records {baseline['records']} -> {result['records']}")
+    return problems
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    save = '--save' in sys.argv
+    repeats = int(args[0]) if args else 5
+
+    snapshots = [(state, path, kind) for state, path, kind in SNAPSHOTS if os.path.exists(path)]
+    if not snapshots:
+        print("No HTML snapshots found - run this from the State MEPs folder")
+        sys.exit(1)
+
+    baseline = {}
+    if os.path.exists(BASELINE) and not save:
+        with open(BASELINE, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    print(f"{'Snapshot':<26} {'State':<5} {'KB':>6} {'parse ms':>9} {'extract ms':>11} {'peak KB':>8} {'records':>8}  vs baseline")
+    results = {}
+    flagged = 0
+    for state, path, kind in snapshots:
+        result = run_snapshot(state, path, kind, repeats)
+        results[path] = result
+
+        note = ''
+        if path in baseline:
+            problems = regressions(result, baseline[path])
+            flagged += bool(problems)
+            note = 'REGRESSED: ' + ', '.join(problems) if problems else 'ok'
+        elif baseline:
+            note = 'new'
+
+        print(f"{path:<26} {state:<5} {result['bytes'] / 1024:>6.0f} {result['parse_ms']:>9.2f} "
+              f"{result['extract_ms']:>11.2f} {result['peak_kb']:>8.0f} {result['records']:>8}  {note}")
+
+    total_parse = sum(r['parse_ms'] for r in results.values())
+    total_extract = sum(r['extract_ms'] for r in results.values())
+    print(f"{'TOTAL':<26} {'':<5} {'':>6} {total_parse:>9.2f} {total_extract:>11.2f}")
+
+    if save or not baseline:
+        with open(BASELINE, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nSaved baseline to {BASELINE}")
+    elif flagged:
+        print(f"\n{flagged} snapshot(s) regressed against {BASELINE}")
+        sys.exit(1)
+    else:
+        print(f"\nNo regressions against {BASELINE}")
@@ -0,0 +1,136 @@
+from html_parse import make_soup
+
+# Clicks every trigger inside the page, waits for the site's own handler to fill
+# the modal, reads the requested fields, closes it and moves on. Everything runs
+# in the browser, so the whole roster comes back in one WebDriver round-trip.
+MODAL_FIELDS_JS = """
+const triggers = arguments[0];
+const fields = arguments[1];
+const closeSelector = arguments[2];
+const itemTimeout = arguments[3];
+const done = arguments[arguments.length - 1];
+
+const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+const read = (selector, attr) => {
+    const el = document.querySelector(selector);
+    if (!el) return '';
+    if (attr === 'text') return (el.innerText || el.textContent || '').trim();
+    if (attr === 'html') return el.innerHTML;
+    return (el.getAttribute(attr) || '').trim();
+};
+const keySpec = Object.values(fields)[0];
+
+(async () => {
+    const results = [];
+    let previous = read(keySpec[0], keySpec[1]);
+
+    for (const trigger of triggers) {
+        trigger.click();
+
+        const deadline = Date.now() + itemTimeout;
+        let current = read(keySpec[0], keySpec[1]);
+        while ((!current || current === previous) && Date.now() < deadline) {
+            await sleep(50);
+            current = read(keySpec[0], keySpec[1]);
+        }
+
+        if (current && current !== previous) {
+            const record = {};
+            for (const [name, spec] of Object.entries(fields)) {
+                record[name] = read(spec[0], spec[1]);
+            }
+            results.push(record);
+            previous = current;
+        }
+
+        if (closeSelector) {
+            const close = document.querySelector(closeSelector);
+            if (close) close.dispatchEvent(new MouseEvent('click', {bubbles: true}));
+        }
+    }
+    return results;
+})().then(done, (e) => done({error: String(e)}));
+"""
+
+# Same idea for sites where we don't know the modal's field ids: return each
+# visible modal's HTML and let BeautifulSoup pick it apart afterwards.
+MODAL_HTML_JS = """
+const triggers = arguments[0];
+const modalSelectors = arguments[1];
+const closeSelector = arguments[2];
+const itemTimeout = arguments[3];
+const done = arguments[arguments.length - 1];
+
+const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+const visibleModal = () => {
+    for (const selector of modalSelectors) {
+        for (const el of document.querySelectorAll(selector)) {
+            if (el.offsetParent !== null || el.getClientRects().length) return el;
+        }
+    }
+    return null;
+};
+
+(async () => {
+    const results = [];
+    for (const trigger of triggers) {
+        trigger.click();
+
+        const deadline = Date.now() + itemTimeout;
+        let modal = visibleModal();
+        while (!modal && Date.now() < deadline) {
+            await sleep(50);
+            modal = visibleModal();
+        }
+        results.push(modal ? modal.innerHTML : '');
+
+        if (closeSelector) {
+            for (const close of document.querySelectorAll(closeSelector)) {
+                if (close.offsetParent !== null) { close.dispatchEvent(new MouseEvent('click', {bubbles: true})); break; }
+            }
+        }
+        while (visibleModal() && Date.now() < deadline) {
+            await sleep(50);
+        }
+    }
+    return results;
+})().then(done, (e) => done({error: String(e)}));
+"""
+
+def _run(driver, script, triggers, spec, close_selector, item_timeout):
+    # Give the in-page loop enough time to work through every trigger
+    driver.set_script_timeout(item_timeout * max(len(triggers), 1) + 10)
+    result = driver.execute_async_script(script, triggers, spec, close_selector, int(item_timeout * 1000))
+
+    if isinstance(result, dict) and 'error' in result:
+        print(f"Bulk extraction failed in page: {result['error']}")
+        return []
+    return result or []
+
+def extract_modal_fields(driver, trigger_selector, fields, close_selector=None, item_timeout=5):
+    """Open every modal in-page and read the given fields in a single execute_script call.
+
+    fields maps output keys to (css_selector, attribute) pairs, where attribute is
+    'text', 'html' or an attribute name. The first field identifies the person and
+    is used to tell when the modal has been refilled.
+    """
+    try:
+        triggers = driver.find_elements('css selector', trigger_selector)
+        if not triggers:
+            return []
+        spec = {name: list(field) for name, field in fields.items()}
+        return _run(driver, MODAL_FIELDS_JS, triggers, spec, close_selector, item_timeout)
+    except Exception as e:
+        print(f"Bulk extraction error: {e}")
+        return []
+
+def extract_modal_html(driver, triggers, modal_selectors, close_selector=None, item_timeout=5):
+    """Open every modal in-page and return each one's parsed HTML (BeautifulSoup) in one call"""
+    try:
+        if not triggers:
+            return []
+        html_list = _run(driver, MODAL_HTML_JS, triggers, list(modal_selectors), close_selector, item_timeout)
+        return [make_soup(html) for html in html_list if html]
+    except Exception as e:
+        print(f"Bulk extraction error: {e}")
+        return []
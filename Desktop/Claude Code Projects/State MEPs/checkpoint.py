@@ -0,0 +1,89 @@
+import json
+import os
+import shutil
+import threading
+import time
+
+CHECKPOINT_DIR = '.checkpoints'
+
+# Checkpoints older than this belong to an abandoned run, not one worth resuming
+MAX_CHECKPOINT_AGE = 24 * 60 * 60
+
+def _write_json(path, data):
+    # Write-then-rename so a crash mid-write never leaves a torn checkpoint
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+class StateCheckpoint:
+    """Per-unit progress for one state: one JSON line per finished profile/person"""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def records(self):
+        """Return {key: record} for every unit finished so far, in the order they finished"""
+        done = {}
+        if not os.path.exists(self.path):
+            return done
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # The last line may be half-written if the process died mid-append
+                    continue
+                done[entry['key']] = entry['record']
+        return done
+
+    def save(self, key, record):
+        """Record one finished unit; durable before returning"""
+        line = json.dumps({'key': key, 'record': record}) + '\n'
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+
+class Checkpoint:
+    """Checkpoints for one named run under .checkpoints/<name>/.
+
+    <STATE>.json holds a finished state's records; <STATE>.units.jsonl holds the
+    profiles/people finished so far in a state that was interrupted.
+    """
+
+    def __init__(self, name, root=CHECKPOINT_DIR, max_age=MAX_CHECKPOINT_AGE):
+        self.path = os.path.join(root, name)
+        if self._age() > max_age:
+            print(f"Discarding checkpoints older than {max_age // 3600}h in {self.path}")
+            self.clear()
+        os.makedirs(self.path, exist_ok=True)
+
+    def _age(self):
+        if not os.path.isdir(self.path):
+            return 0
+        mtimes = [os.path.getmtime(os.path.join(self.path, name)) for name in os.listdir(self.path)]
+        return time.time() - max(mtimes) if mtimes else 0
+
+    def completed(self, state):
+        """Records saved for a finished state, or None if it still needs scraping"""
+        path = os.path.join(self.path, f"{state}.json")
+        if not os.path.exists(path):
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def complete(self, state, records):
+        _write_json(os.path.join(self.path, f"{state}.json"), records)
+        # The finished state supersedes its partial progress
+        units = os.path.join(self.path, f"{state}.units.jsonl")
+        if os.path.exists(units):
+            os.remove(units)
+
+    def state(self, state):
+        return StateCheckpoint(os.path.join(self.path, f"{state}.units.jsonl"))
+
+    def clear(self):
+        shutil.rmtree(self.path, ignore_errors=True)
@@ -0,0 +1,264 @@
+import functools
+import glob
+import json
+import os
+import re
+import sys
+from urllib.parse import urljoin
+
+import pandas as pd
+import soupsieve
+from bs4 import SoupStrainer
+
+import fetch
+from async_fetch import fetch_all
+from html_parse import class_token, make_soup, parse_many
+from staff_store import save_staff
+from workbook_writer import COLUMNS, WorkbookWriter
+
+# One JSON file per state, named by abbreviation (state_configs/FL.json)
+CONFIG_DIR = 'state_configs'
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+def config_path(state_abbrev):
+    return os.path.join(CONFIG_DIR, f"{state_abbrev.upper()}.json")
+
+def has_config(state_abbrev):
+    return os.path.exists(config_path(state_abbrev))
+
+def load_config(state_abbrev):
+    with open(config_path(state_abbrev), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def available_states():
+    return sorted(os.path.splitext(os.path.basename(path))[0]
+                  for path in glob.glob(os.path.join(CONFIG_DIR, '*.json')))
+
+def compile_field(spec):
+    """Turn a field spec into a function(element) -> str.
+
+    A spec is either a CSS selector string (text of the first match) or a dict:
+      selector   CSS selector relative to the element (default: the element itself)
+      next       tag name (or list of names, followed in turn) to jump to with find_next()
+      attr       attribute to read instead of the text (e.g. "href")
+      all        join the values of every match with a space
+      min_length / exclude   (with all) skip short matches / matches whose HTML matches this regex
+      regex      keep only the regex match (group 1 if it has one); index picks the nth match
+      remove     regex whose matches are deleted from the value (e.g. "^mailto:")
+      format     wrap a non-empty value, e.g. "LinkedIn: {}"
+    """
+    if isinstance(spec, str):
+        spec = {'selector': spec}
+
+    selector = soupsieve.compile(spec['selector']) if spec.get('selector') else None
+    next_tags = spec.get('next') or []
+    if isinstance(next_tags, str):
+        next_tags = [next_tags]
+    attr = spec.get('attr')
+    join_all = spec.get('all', False)
+    min_length = spec.get('min_length', 0)
+    exclude = re.compile(spec['exclude']) if spec.get('exclude') else None
+    pattern = re.compile(spec['regex']) if spec.get('regex') else None
+    index = spec.get('index', 0)
+    remove = re.compile(spec['remove']) if spec.get('remove') else None
+    template = spec.get('format')
+
+    def read(element):
+        if attr:
+            return (element.get(attr) or '').strip()
+        return element.get_text(' ', strip=True)
+
+    def extract(element):
+        for tag in next_tags:
+            element = element.find_next(tag)
+            if element is None:
+                return ''
+
+        if selector is None:
+            matches = [element]
+        elif join_all:
+            matches = selector.select(element)
+        else:
+            match = selector.select_one(element)
+            matches = [match] if match is not None else []
+
+        values = []
+        for match in matches:
+            value = read(match)
+            if len(value) < min_length or (exclude and exclude.search(str(match))):
+                continue
+            values.append(value)
+            if not join_all:
+                break
+        value = ' '.join(values)
+
+        if pattern:
+            found = list(pattern.finditer(value))
+            if len(found) <= index:
+                return ''
+            match = found[index]
+            value = match.group(1) if match.groups() else match.group(0)
+        if remove:
+            value = remove.sub('', value)
+        value = ' '.join(value.split())
+        if value and template:
+            value = template.format(value)
+        return value
+
+    return extract
+
+def compile_fields(specs):
+    return {column: compile_field(spec) for column, spec in (specs or {}).items()}
+
+class CompiledConfig:
+    """A state config with every selector and regex compiled once up front"""
+
+    def __init__(self, config):
+        self.config = config
+        self.abbrev = config['abbrev']
+        self.url = config['url']
+        self.render = config.get('render', 'static')
+
+        region = dict(config.get('region') or {})
+        if 'class' in region:
+            classes = region.pop('class')
+            region['class_'] = class_token(*([classes] if isinstance(classes, str) else classes))
+        self.region = region or None
+
+        self.container = soupsieve.compile(config['container']) if config.get('container') else None
+        self.fields = compile_fields(config.get('fields'))
+
+        profile = config.get('profile') or {}
+        self.profile_link = soupsieve.compile(profile['link']) if profile.get('link') else None
+        self.profile_fields = compile_fields(profile.get('fields'))
+
+    def parse(self, html):
+        parse_only = SoupStrainer(**self.region) if self.region else None
+        return make_soup(html, parse_only=parse_only)
+
+    def _links(self, element):
+        urls = []
+        for link in self.profile_link.select(element):
+            href = link.get('href')
+            if href:
+                url = urljoin(self.url, href)
+                if url not in urls:
+                    urls.append(url)
+        return urls
+
+    def extract_list(self, soup):
+        """Return [(record, profile_url or None)] from the roster page in one pass"""
+        results = []
+
+        if self.container is None:
+            # Roster page only links out; every profile page is one person
+            if self.profile_link:
+                results = [({}, url) for url in self._links(soup)]
+            return results
+
+        for element in self.container.select(soup):
+            record = {column: extract(element) for column, extract in self.fields.items()}
+            links = self._links(element) if self.profile_link else []
+            results.append((record, links[0] if links else None))
+        return results
+
+    def extract_profile(self, html):
+        soup = make_soup(html)
+        return {column: extract(soup) for column, extract in self.profile_fields.items()}
+
+@functools.lru_cache(maxsize=None)
+def compiled_config(state_abbrev):
+    """Compile a state's config once per process"""
+    return CompiledConfig(load_config(state_abbrev))
+
+def _parse_profile(state_abbrev, html):
+    # Module-level so parse_many can ship it to worker processes
+    return compiled_config(state_abbrev).extract_profile(html)
+
+def fetch_rendered(compiled):
+    """Load the roster page in a pooled browser and return the rendered HTML"""
+    from driver_pool import get_pool
+    from waits import scroll_to_bottom, timeout_for, wait_for_count_stable, wait_for_network_idle
+
+    timeout = timeout_for(compiled.abbrev)
+    pool = get_pool(size=1)
+    driver = pool.acquire()
+    try:
+        pool.get(driver, compiled.url)
+        wait_for_network_idle(driver, timeout)
+        if compiled.config.get('container'):
+            wait_for_count_stable(driver, compiled.config['container'], timeout)
+        scroll_to_bottom(driver, timeout=timeout)
+        return driver.page_source
+    finally:
+        pool.release(driver)
+
+def scrape_config(state_abbrev):
+    """Scrape a state entirely from its config; returns staff records"""
+    compiled = compiled_config(state_abbrev)
+    print(f"Scraping {state_abbrev} from {config_path(state_abbrev)}: {compiled.url}")
+
+    if compiled.render == 'selenium':
+        html = fetch_rendered(compiled)
+    else:
+        response = fetch.get(compiled.url, headers=HEADERS)
+        response.raise_for_status()
+        html = response.content
+
+    entries = compiled.extract_list(compiled.parse(html))
+    print(f"Found {len(entries)} staff entries")
+
+    profile_urls = [url for _, url in entries if url]
+    if profile_urls and compiled.profile_fields:
+        print(f"Fetching {len(profile_urls)} profile pages...")
+        pages = fetch_all(profile_urls, HEADERS)
+        fetched = [url for url in profile_urls if pages.get(url) is not None]
+        details = dict(zip(fetched, parse_many(functools.partial(_parse_profile, state_abbrev),
+                                               [pages[url] for url in fetched])))
+
+        for record, url in entries:
+            # Profile values fill in whatever the roster page didn't have
+            for column, value in details.get(url, {}).items():
+                if value and not record.get(column):
+                    record[column] = value
+
+    staff_data = []
+    for record, _ in entries:
+        row = {column: record.get(column, '') for column in COLUMNS}
+        if row['Name']:
+            staff_data.append(row)
+            print(f"  {row['Name']} - {row['Title']}")
+
+    print(f"Extracted {len(staff_data)} staff members")
+    return staff_data
+
+if __name__ == "__main__":
+    # Usage: python config_scraper.py [XX ...]   (no arguments = every config)
+    states = [arg.upper() for arg in sys.argv[1:]] or available_states()
+
+    writer = WorkbookWriter()
+    for state_abbrev in states:
+        try:
+            staff_data = scrape_config(state_abbrev)
+        except Exception as e:
+            print(f"Error processing {state_abbrev}: {e}")
+            import traceback
+            traceback.print_exc()
+            continue
+
+        if staff_data:
+            csv_filename = f"{state_abbrev.lower()}_staff_temp.csv"
+            pd.DataFrame(staff_data).to_csv(csv_filename, index=False)
+            print(f"Saved to {csv_filename}")
+            save_staff(state_abbrev, staff_data)
+            writer.add(state_abbrev, staff_data)
+
+    try:
+        updated = writer.flush()
+        print(f"\nUpdated tabs: {', '.join(updated) or 'none'}")
+    except Exception as e:
+        print(f"Error updating Excel: {e}")
+        print("Please close the Excel file and try again.")
@@ -0,0 +1,84 @@
+import re
+
+LABELS = r'Phone|Tel|Office|Mobile|Cell'
+
+# One pass over the text finds labelled phone numbers and bare emails together.
+# get_text() glues "...@demep.org" onto a following "Phone:", so the email's
+# top-level domain stops short of a label instead of swallowing it.
+CONTACT_RE = re.compile(
+    rf'(?P<label>{LABELS}):\s*\(?(?P<area>\d{{3}})\)?[-.\s]?(?P<prefix>\d{{3}})[-.\s]?(?P<line>\d{{4}})'
+    rf'|(?P<email>[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{{2,}}?)(?=(?:{LABELS}):|[^a-zA-Z]|$)'
+)
+
+MOBILE_LABELS = ('Mobile', 'Cell')
+MOBILE_HINTS = ('mobile', 'cell')
+
+NON_DIGITS = re.compile(r'\D')
+
+def normalize_phone(phone):
+    """Return a US number in E.164 form (+15551234567), or "" if it isn't 10/11 digits"""
+    digits = NON_DIGITS.sub('', phone or '')
+    if len(digits) == 11 and digits.startswith('1'):
+        digits = digits[1:]
+    return f"+1{digits}" if len(digits) == 10 else ''
+
+def normalize_email(email):
+    return (email or '').strip().lower()
+
+def _contacts(phone, mobile, email):
+    return {
+        'Phone': phone,
+        'Mobile': mobile,
+        'Email': email,
+        'normalized': {
+            'Phone': normalize_phone(phone),
+            'Mobile': normalize_phone(mobile),
+            'Email': normalize_email(email),
+        },
+    }
+
+def extract_contacts(element, text=None):
+    """Find phone, mobile and email in a soup/tag in one pass.
+
+    tel: and mailto: links are read from a single walk over the anchors;
+    anything still missing comes from one scan of the text (pass text if the
+    caller already has element.get_text()). Returns {'Phone', 'Mobile', 'Email',
+    'normalized': {...}} with "" for anything not found.
+    """
+    phone = mobile = email = ''
+
+    for link in element.find_all('a', href=True):
+        href = link['href'].strip()
+        scheme = href[:7].lower()
+        if scheme.startswith('tel:'):
+            # Some sites put placeholder text ("*PHONE NUMBER") in the link
+            number = link.get_text(strip=True)
+            if not any(ch.isdigit() for ch in number):
+                number = href[4:].strip()
+            hint = (link.get('title') or '').lower()
+            if any(word in hint for word in MOBILE_HINTS):
+                mobile = mobile or number
+            elif not phone:
+                phone = number
+        elif scheme == 'mailto:' and not email:
+            email = href[7:].split('?')[0].strip()
+
+    if phone and mobile and email:
+        return _contacts(phone, mobile, email)
+
+    if text is None:
+        text = element.get_text()
+
+    for match in CONTACT_RE.finditer(text):
+        if match.group('email'):
+            email = email or match.group('email')
+        else:
+            number = f"({match.group('area')}) {match.group('prefix')}-{match.group('line')}"
+            if match.group('label') in MOBILE_LABELS:
+                mobile = mobile or number
+            else:
+                phone = phone or number
+        if phone and mobile and email:
+            break
+
+    return _contacts(phone, mobile, email)
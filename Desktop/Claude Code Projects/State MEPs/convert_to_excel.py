@@ -19,24 +19,25 @@ state_abbrev = {
     'Wisconsin': 'WI', 'Wyoming': 'WY', 'Puerto Rico': 'PR'
 }
 
-# Read the CSV file
-df = pd.read_csv('state meps.csv')
+if __name__ == "__main__":
+    # Read the CSV file
+    df = pd.read_csv('state meps.csv')
 
-# Remove any completely empty rows
-df = df.dropna(how='all')
+    # Remove any completely empty rows
+    df = df.dropna(how='all')
 
-# Create Excel writer object
-with pd.ExcelWriter('state_meps.xlsx', engine='openpyxl') as writer:
-    # First, create the master list sheet with all data
-    df.to_excel(writer, sheet_name='Master List', index=False)
-    print("Created sheet: Master List (all states)")
+    # Create Excel writer object
+    with pd.ExcelWriter('state_meps.xlsx', engine='openpyxl') as writer:
+        # First, create the master list sheet with all data
+        df.to_excel(writer, sheet_name='Master List', index=False)
+        print("Created sheet: Master List (all states)")
 
-    # Then create a sheet for each state
-    for state in df['State'].unique():
-        if pd.notna(state) and state in state_abbrev:
-            state_data = df[df['State'] == state]
-            sheet_name = state_abbrev[state]
-            state_data.to_excel(writer, sheet_name=sheet_name, index=False)
-            print(f"Created sheet: {sheet_name} for {state}")
+        # Then create a sheet for each state
+        for state in df['State'].unique():
+            if pd.notna(state) and state in state_abbrev:
+                state_data = df[df['State'] == state]
+                sheet_name = state_abbrev[state]
+                state_data.to_excel(writer, sheet_name=sheet_name, index=False)
+                print(f"Created sheet: {sheet_name} for {state}")
 
-print("\nExcel file 'state_meps.xlsx' created successfully!")
+    print("\nExcel file 'state_meps.xlsx' created successfully!")
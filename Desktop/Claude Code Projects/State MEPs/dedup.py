@@ -0,0 +1,197 @@
+import re
+import sys
+from difflib import SequenceMatcher
+
+import pandas as pd
+
+from normalize import CREDENTIALS_RE
+from staff_store import load_staff
+from workbook_writer import COLUMNS
+
+OUTPUT_CSV = 'cross_mep_staff.csv'
+
+# Names in the same block at least this similar, but not matched outright, are flagged for review
+NAME_SIMILARITY = 0.85
+
+# Leading titles dropped before matching ('Dr. Rachel Anderson' -> 'rachel anderson')
+HONORIFICS = {'dr', 'mr', 'mrs', 'ms', 'miss', 'mx', 'prof'}
+
+_credentials = re.compile(CREDENTIALS_RE)
+_non_letters = re.compile(r'[^a-z ]+')
+_non_digits = re.compile(r'\D+')
+
+def normalize_name(name):
+    """Lowercase, honorifics, credentials and punctuation stripped: 'Dr. Nicholas Loyd, PhD' -> 'nicholas loyd'"""
+    name = _credentials.sub('', ' '.join((name or '').split())).rstrip(' ,')
+    parts = _non_letters.sub(' ', name.lower()).split()
+    while len(parts) > 1 and parts[0] in HONORIFICS:
+        parts = parts[1:]
+    return ' '.join(parts)
+
+# Shared mailboxes say nothing about who a record is
+GENERIC_MAILBOXES = {'info', 'contact', 'admin', 'office', 'hello', 'team', 'sales', 'staff', 'mep', 'support'}
+
+def email_key(email):
+    """Normalized email for matching; "" for missing or shared (info@, contact@...) addresses"""
+    email = (email or '').strip().lower()
+    if email.startswith('mailto:'):
+        email = email[7:]
+    if '@' not in email or email.split('@', 1)[0] in GENERIC_MAILBOXES:
+        return ''
+    return email
+
+def name_block(name, state=None):
+    """Blocking key (last name, first initial, state); None if the name has no usable parts"""
+    parts = normalize_name(name).split()
+    if not parts:
+        return None
+    return (parts[-1], parts[0][0], state)
+
+def _phone_key(phone):
+    return _non_digits.sub('', phone or '')[-10:]
+
+def _title_key(title):
+    return ' '.join((title or '').lower().split())
+
+def same_person(a, b):
+    """True if two records in the same block are one person: the same normalized first name.
+
+    A shared personal email is matched before blocking; anything weaker (a
+    matching title or phone under a different first name) is only a possible
+    duplicate - 'Dan Lee' and 'Don Lee', both Project Managers, stay apart.
+    """
+    return normalize_name(a.get('Name')).split()[0] == normalize_name(b.get('Name')).split()[0]
+
+def possible_duplicate(a, b):
+    """True if two records that aren't merged look close enough to report"""
+    if SequenceMatcher(None, normalize_name(a.get('Name')), normalize_name(b.get('Name'))).ratio() >= NAME_SIMILARITY:
+        return True
+    for key, column in ((_title_key, 'Title'), (_phone_key, 'Phone')):
+        value = key(a.get(column))
+        if value and value == key(b.get(column)):
+            return True
+    return False
+
+def merge_into(target, record):
+    """Fill target's empty fields from record; longer bios win"""
+    for column in COLUMNS:
+        value = record.get(column) or ''
+        if not target.get(column):
+            target[column] = value
+        elif column == 'Bio' and len(value) > len(target[column]):
+            target[column] = value
+    return target
+
+class StaffIndex:
+    """Hash indexes on normalized email and (last name, first initial, state).
+
+    Each new record is only compared against the handful of records sharing
+    its email or name block, so building the index is near-linear.
+    """
+
+    def __init__(self, per_state=True):
+        self.per_state = per_state
+        self.records = []
+        self.states = []
+        self.by_email = {}
+        self.by_block = {}
+        # (existing id, record) pairs that look alike but weren't merged
+        self.near_matches = []
+
+    def _block(self, record, state):
+        return name_block(record.get('Name'), state if self.per_state else None)
+
+    def find(self, record, state=None):
+        """Return the id of a record already indexed as the same person, or None"""
+        email = email_key(record.get('Email'))
+        if email and email in self.by_email:
+            return self.by_email[email]
+
+        near = None
+        for candidate in self.by_block.get(self._block(record, state), []):
+            other = email_key(self.records[candidate].get('Email'))
+            # Two different emails means two different people, however close the names
+            if email and other and email != other:
+                continue
+            if same_person(record, self.records[candidate]):
+                return candidate
+            if near is None and possible_duplicate(record, self.records[candidate]):
+                near = candidate
+
+        if near is not None:
+            self.near_matches.append((near, dict(record)))
+        return None
+
+    def _index(self, record_id, record, state):
+        email = email_key(record.get('Email'))
+        if email:
+            self.by_email.setdefault(email, record_id)
+        block = self._block(record, state)
+        if block and record_id not in self.by_block.setdefault(block, []):
+            self.by_block[block].append(record_id)
+
+    def add(self, record, state=None):
+        """Index a record, merging it into a matching one; returns (id, is_new)"""
+        record_id = self.find(record, state)
+        if record_id is None:
+            record_id = len(self.records)
+            self.records.append(dict(record))
+            self.states.append(state)
+            self._index(record_id, record, state)
+            return record_id, True
+
+        merge_into(self.records[record_id], record)
+        # The merged record may have gained an email; index it too
+        self._index(record_id, self.records[record_id], state)
+        return record_id, False
+
+def merge_records(staff_data, state=None):
+    """Collapse duplicate people in one roster (e.g. detailed + basic phases), keeping first-seen order"""
+    index = StaffIndex()
+    for record in staff_data:
+        index.add(record, state)
+    for record_id, record in index.near_matches:
+        print(f"  Possible duplicate, not merged: {index.records[record_id]['Name']} / {record['Name']}")
+    return index.records
+
+def cross_mep_people(rosters):
+    """Find people listed under more than one MEP.
+
+    rosters maps state abbreviation -> staff records. Returns a list of
+    (person record, [states]) for every person matched in two or more states.
+    """
+    index = StaffIndex(per_state=False)
+    seen_in = {}
+    for state, staff_data in rosters.items():
+        for record in staff_data:
+            record_id, _ = index.add(record, state)
+            seen_in.setdefault(record_id, [])
+            if state not in seen_in[record_id]:
+                seen_in[record_id].append(state)
+
+    for record_id, record in index.near_matches:
+        print(f"  Possible match, not merged: {index.records[record_id]['Name']} / {record['Name']}")
+
+    return [(index.records[record_id], states)
+            for record_id, states in seen_in.items() if len(states) > 1]
+
+if __name__ == "__main__":
+    # Usage: python dedup.py   - flags people who appear under more than one MEP in the store
+    rosters = {}
+    for record in load_staff():
+        rosters.setdefault(record.pop('State'), []).append(record)
+
+    total = sum(len(staff_data) for staff_data in rosters.values())
+    print(f"Checking {total} staff across {len(rosters)} states...")
+
+    people = cross_mep_people(rosters)
+    if not people:
+        print("No one is listed under more than one MEP")
+        sys.exit(0)
+
+    for record, states in people:
+        print(f"  {record['Name']} ({record['Email'] or 'no email'}): {', '.join(states)}")
+
+    rows = [dict(record, States=', '.join(states)) for record, states in people]
+    pd.DataFrame(rows, columns=['States'] + COLUMNS).to_csv(OUTPUT_CSV, index=False)
+    print(f"\n{len(people)} people listed under more than one MEP - saved to {OUTPUT_CSV}")
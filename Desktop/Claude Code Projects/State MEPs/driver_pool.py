@@ -0,0 +1,136 @@
+import atexit
+import queue
+import threading
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+import metrics
+import replay
+
+# Number of Chrome instances started up front
+POOL_SIZE = 2
+
+# Restart a browser after this many page loads to cap memory growth
+MAX_PAGES_PER_DRIVER = 50
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+def make_driver(headless=True, performance_log=False):
+    """Start Chrome, falling back to a visible browser if headless mode fails.
+
+    performance_log=True records DevTools network events for driver.get_log('performance').
+    Under SCRAPE_REPLAY=replay no browser starts; recorded pages are served instead.
+    """
+    if replay.mode == 'replay':
+        return replay.ReplayDriver()
+
+    chrome_options = Options()
+    if headless:
+        chrome_options.add_argument('--headless')
+        chrome_options.add_argument('--disable-gpu')
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--window-size=1920,1080')
+    chrome_options.add_argument(f'--user-agent={USER_AGENT}')
+    if performance_log:
+        chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+
+    try:
+        with metrics.span('browser_start', headless=headless):
+            driver = webdriver.Chrome(options=chrome_options)
+        return replay.RecordingDriver(driver) if replay.mode == 'record' else driver
+    except Exception as e:
+        if not headless:
+            raise
+        print(f"Headless mode failed ({e}), trying with visible browser...")
+        return make_driver(headless=False, performance_log=performance_log)
+
+class DriverPool:
+    """A fixed set of Chrome browsers handed out per state/page and reused"""
+
+    def __init__(self, size=POOL_SIZE, max_pages=MAX_PAGES_PER_DRIVER):
+        self.max_pages = max_pages
+        self._idle = queue.Queue()
+        self._pages = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+        print(f"Starting {size} Chrome WebDriver(s)...")
+        for _ in range(size):
+            self._add(make_driver())
+
+    def _add(self, driver):
+        with self._lock:
+            self._pages[id(driver)] = 0
+        self._idle.put(driver)
+
+    def acquire(self, timeout=None):
+        """Check out a browser, waiting for one to come back if all are busy"""
+        return self._idle.get(timeout=timeout)
+
+    def get(self, driver, url):
+        """Load url in driver, counting it towards the driver's page limit"""
+        with self._lock:
+            self._pages[id(driver)] = self._pages.get(id(driver), 0) + 1
+        with metrics.span('page_load', url=url):
+            driver.get(url)
+
+    def release(self, driver):
+        """Reset a browser and return it to the pool, recycling it if it's worn out"""
+        with self._lock:
+            pages = self._pages.pop(id(driver), 0)
+
+        if self._closed:
+            self._quit(driver)
+            return
+
+        if pages >= self.max_pages or not self._reset(driver):
+            print(f"Recycling Chrome WebDriver after {pages} pages...")
+            self._quit(driver)
+            driver = make_driver()
+            pages = 0
+
+        with self._lock:
+            self._pages[id(driver)] = pages
+        self._idle.put(driver)
+
+    def _reset(self, driver):
+        # Clear state left by the previous page so the next user starts clean
+        try:
+            try:
+                driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+            except Exception:
+                pass
+            driver.delete_all_cookies()
+            driver.get('about:blank')
+            return True
+        except Exception as e:
+            print(f"Error resetting Chrome WebDriver: {e}")
+            return False
+
+    def _quit(self, driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def close(self):
+        """Quit every idle browser; browsers still checked out quit when released"""
+        self._closed = True
+        while True:
+            try:
+                self._quit(self._idle.get_nowait())
+            except queue.Empty:
+                break
+
+_pool = None
+_pool_lock = threading.Lock()
+
+def get_pool(size=POOL_SIZE):
+    """Return the process-wide pool, starting it on first use"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = DriverPool(size=size)
+            atexit.register(_pool.close)
+        return _pool
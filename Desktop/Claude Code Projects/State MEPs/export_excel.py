@@ -0,0 +1,169 @@
+import csv
+import glob
+import os
+import sys
+from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, Side
+from openpyxl.utils import get_column_letter
+
+from convert_to_excel import state_abbrev
+from staff_store import DB_PATH, load_staff
+from workbook_writer import START_ROW, WORKBOOK, staff_row
+
+STATE_PAGES_CSV = 'state meps.csv'
+
+# Same header look pandas gave the workbook: bold, thin border, centered
+_thin = Side(style='thin')
+HEADER_FONT = Font(bold=True)
+HEADER_BORDER = Border(left=_thin, right=_thin, top=_thin, bottom=_thin)
+HEADER_ALIGNMENT = Alignment(horizontal='center', vertical='top')
+
+def header_row(sheet, values):
+    cells = []
+    for value in values:
+        cell = WriteOnlyCell(sheet, value=value)
+        cell.font = HEADER_FONT
+        cell.border = HEADER_BORDER
+        cell.alignment = HEADER_ALIGNMENT
+        cells.append(cell)
+    return cells
+
+def _blank_to_none(values):
+    return [value if value != "" else None for value in values]
+
+def load_state_pages(csv_path=STATE_PAGES_CSV):
+    """Return (column names, rows) from the master CSV, skipping completely empty rows"""
+    with open(csv_path, 'r', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        columns = next(reader)
+        rows = [row for row in reader if any(value.strip() for value in row)]
+    return columns, rows
+
+def csv_state(filename):
+    """Map a scraper CSV name (al_staff_temp.csv, arkansas_staff_temp.csv) to its abbreviation"""
+    prefix = os.path.basename(filename).split('_staff')[0]
+    if prefix.upper() in state_abbrev.values():
+        return prefix.upper()
+    return state_abbrev.get(prefix.replace('_', ' ').title())
+
+def iter_csv_staff(csv_path):
+    with open(csv_path, 'r', encoding='utf-8') as f:
+        yield from csv.DictReader(f)
+
+def find_staff_csvs():
+    """Return {abbrev: csv path} for the newest scraper CSV of each state"""
+    found = {}
+    for path in glob.glob('*_staff_*.csv'):
+        abbrev = csv_state(path)
+        if not abbrev:
+            continue
+        if abbrev not in found or os.path.getmtime(path) > os.path.getmtime(found[abbrev]):
+            found[abbrev] = path
+    return found
+
+def staff_for_state(abbrev, use_store, staff_csvs):
+    """Rows for one state tab: the store's latest roster, falling back to the scraper CSV"""
+    if use_store:
+        staff_data = load_staff(abbrev)
+        if staff_data:
+            return staff_data
+    if abbrev in staff_csvs:
+        return iter_csv_staff(staff_csvs[abbrev])
+    return []
+
+def existing_sheets(path):
+    """Sheet names of a workbook already on disk ([] if there isn't one)"""
+    if not os.path.exists(path):
+        return []
+    wb = load_workbook(path, read_only=True)
+    try:
+        return wb.sheetnames
+    finally:
+        wb.close()
+
+def export_workbook(output=WORKBOOK, use_store=True, csv_path=STATE_PAGES_CSV, force=False):
+    """Regenerate the workbook in one pass: Master List, then one tab per state.
+
+    Every sheet is a write-only sheet, so rows stream to disk as they're
+    produced. State tabs keep the usual layout: header in row 1, the state's
+    MEP center row(s) from row 2, staff in columns A-F from row 4.
+
+    Returns False without replacing output if the export would drop any of its
+    existing tabs (e.g. a master-list row with an unrecognized State); force
+    replaces it anyway.
+    """
+    use_store = use_store and os.path.exists(DB_PATH)
+    staff_csvs = find_staff_csvs()
+    columns, rows = load_state_pages(csv_path)
+    state_col = columns.index('State')
+
+    wb = Workbook(write_only=True)
+
+    master = wb.create_sheet('Master List')
+    for idx, column in enumerate(columns):
+        width = max([len(column)] + [len(row[idx]) for row in rows if idx < len(row)])
+        master.column_dimensions[get_column_letter(idx + 1)].width = width + 2
+    master.append(header_row(master, columns))
+    for row in rows:
+        master.append(_blank_to_none(row))
+    print("Created sheet: Master List (all states)")
+
+    states = {}
+    for row in rows:
+        state = row[state_col].strip()
+        if state in state_abbrev:
+            states.setdefault(state, []).append(row)
+        else:
+            print(f"Warning: skipping master-list row with unrecognized State {state!r}: {row[:3]}")
+
+    exported = {state_abbrev[state] for state in states}
+    for abbrev, path in sorted(staff_csvs.items()):
+        if abbrev not in exported:
+            print(f"Warning: no {abbrev} tab in the export, so {path} is left out")
+
+    for state, center_rows in states.items():
+        abbrev = state_abbrev[state]
+        sheet = wb.create_sheet(abbrev)
+        sheet.append(header_row(sheet, columns))
+        for row in center_rows:
+            sheet.append(_blank_to_none(row))
+
+        # Pad down to the staff block
+        for _ in range(len(center_rows) + 1, START_ROW - 1):
+            sheet.append([])
+
+        count = 0
+        for staff in staff_for_state(abbrev, use_store, staff_csvs):
+            sheet.append(_blank_to_none(staff_row(staff)))
+            count += 1
+        print(f"Created sheet: {abbrev} for {state} ({count} staff)")
+
+    # Write next to the target and swap in, so a failed export never leaves a half-written workbook
+    tmp_path = output + '.tmp'
+    wb.save(tmp_path)
+
+    missing = [name for name in existing_sheets(output) if name not in wb.sheetnames]
+    if missing and not force:
+        print(f"\nNot replacing {output}: the export has no {', '.join(missing)} tab(s).")
+        print(f"New workbook left at {tmp_path}; fix the master list or rerun with --force.")
+        return False
+
+    os.replace(tmp_path, output)
+    print(f"\nExcel file '{output}' exported successfully!")
+    return True
+
+if __name__ == "__main__":
+    # Usage: python export_excel.py [output.xlsx] [--csv] [--force]
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    output = args[0] if args else WORKBOOK
+    use_store = '--csv' not in sys.argv
+
+    try:
+        if not export_workbook(output, use_store=use_store, force='--force' in sys.argv):
+            sys.exit(1)
+    except Exception as e:
+        print(f"Error exporting Excel: {e}")
+        print("Please close the Excel file and try again.")
+        import traceback
+        traceback.print_exc()
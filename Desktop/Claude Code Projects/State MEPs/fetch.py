@@ -0,0 +1,141 @@
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util.retry import Retry
+
+import metrics
+import replay
+from http_cache import ResponseCache
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+# (connect, read) timeout in seconds, so one slow host can't hang a run
+TIMEOUT = (10, 30)
+
+# Retry policy for rate limiting and server errors
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 1  # waits 1s, 2s, 4s between retries (or the server's Retry-After)
+
+# Keep-alive connection pool sizes
+POOL_CONNECTIONS = 20  # number of hosts kept in the pool
+POOL_MAXSIZE = 10      # connections kept open per host
+
+_local = threading.local()
+
+# Shared on-disk response cache; set to None to always fetch in full
+cache = ResponseCache()
+
+def new_session(headers=None):
+    """Create a requests.Session with keep-alive pooling and the retry policy"""
+    retry = Retry(
+        total=MAX_RETRIES,
+        backoff_factor=BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=('GET', 'HEAD'),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, max_retries=retry)
+
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers.update(headers or DEFAULT_HEADERS)
+    return session
+
+def get_session():
+    """Return this thread's shared session (sessions aren't safe to share across threads)"""
+    if not hasattr(_local, 'session'):
+        _local.session = new_session()
+    return _local.session
+
+def cached_response(url, meta, body):
+    """Build a 200 requests.Response from a cache entry"""
+    response = requests.Response()
+    response.status_code = 200
+    response.reason = 'OK'
+    response.url = url
+    response._content = body
+    response.headers = CaseInsensitiveDict({'Content-Type': meta.get('content_type', '')})
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    response.from_cache = True
+    return response
+
+def get(url, headers=None, timeout=TIMEOUT, **kwargs):
+    """GET url through the shared pooled session, with a timeout by default.
+
+    Cached pages are revalidated with If-None-Match / If-Modified-Since, and a
+    304 is served straight from disk so only changed pages are downloaded.
+    Under SCRAPE_REPLAY the response is recorded to / served from the fixture archive.
+    """
+    with metrics.span('fetch', url=url) as info:
+        if replay.mode == 'replay':
+            response = replay.replay_response('GET', url, kwargs.get('params'))
+        else:
+            response = _live_get(url, headers, timeout, **kwargs)
+            if replay.mode == 'record':
+                replay.record_response('GET', url, response, kwargs.get('params'))
+        record_fetch_metrics(info, response, streamed=kwargs.get('stream'))
+    return response
+
+def read_start(response, limit):
+    """First limit bytes of a response body, without downloading the rest of a streamed one"""
+    # Recorded and replayed responses already hold the whole body
+    if response.raw is None or response._content_consumed:
+        return response.content[:limit]
+    return response.raw.read(limit, decode_content=True)
+
+def record_fetch_metrics(info, response, streamed=False):
+    """Attach status/timing to a fetch span and bump the byte, cache-hit, replay and retry counters"""
+    info['status'] = response.status_code
+    if getattr(response, 'replayed', False):
+        # Served from the fixture archive, not the HTTP cache
+        info['source'] = 'replay'
+        metrics.count('replayed')
+        return
+    if getattr(response, 'from_cache', False):
+        metrics.count('cache_hits')
+        return
+
+    # Time from sending the request to the response headers (connect + server wait)
+    info['wait_ms'] = round(response.elapsed.total_seconds() * 1000, 3)
+    if not streamed:
+        info['bytes'] = len(response.content)
+        metrics.count('bytes_fetched', info['bytes'])
+    retries = getattr(getattr(response.raw, 'retries', None), 'history', ())
+    metrics.count('retries', len(retries))
+
+def _live_get(url, headers, timeout, **kwargs):
+    if cache is None or kwargs.get('params') or kwargs.get('stream'):
+        return get_session().get(url, headers=headers, timeout=timeout, **kwargs)
+
+    request_headers = dict(headers or {})
+    cached = cache.lookup(url)
+    if cached:
+        request_headers.update(cache.conditional_headers(cached[0]))
+
+    response = get_session().get(url, headers=request_headers, timeout=timeout, **kwargs)
+
+    if response.status_code == 304 and cached:
+        meta, body = cached
+        cache.refresh(url, meta)
+        return cached_response(url, meta, body)
+
+    if response.status_code == 200:
+        cache.store(url, response.headers, response.content)
+
+    return response
+
+def head(url, headers=None, timeout=TIMEOUT, **kwargs):
+    """HEAD url through the shared pooled session, with a timeout by default"""
+    if replay.mode == 'replay':
+        return replay.replay_response('HEAD', url)
+
+    response = get_session().head(url, headers=headers, timeout=timeout, **kwargs)
+    if replay.mode == 'record':
+        replay.record_response('HEAD', url, response)
+    return response
@@ -1,22 +1,78 @@
 import csv
-import requests
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin, urlparse
+import fetch
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from html_parse import make_soup
+from urllib.parse import quote, urljoin, urlparse
 import time
 import re
 
+# Centers researched at the same time
+MAX_WORKERS = 16
+
+# Shared pool for candidate-page probes across all centers
+PROBE_WORKERS = 32
+
+# Requests allowed in flight against any one host at a time
+PER_HOST_LIMIT = 2
+
+# Search engine requests are serialized and spaced out instead
+SEARCH_DELAY = 1.0
+
+# Probes read at most this much of a page (ranged GET) to judge it
+PROBE_BYTES = 64 * 1024
+PROBE_TIMEOUT = 5
+
+STAFF_KEYWORDS = ['staff', 'team', 'people', 'director', 'manager']
+LINK_KEYWORDS = ['team', 'staff', 'our team', 'our staff', 'people', 'meet the team']
+
+# A page whose main content mentions this many distinct staff keywords is taken
+# once every more likely candidate has been ruled out
+HIGH_CONFIDENCE = 3
+
+# Site chrome that mentions "team"/"staff" on every page, so it says nothing about this one
+CHROME_TAGS = ['nav', 'header', 'footer', 'aside', 'script', 'style', 'noscript']
+CHROME_ROLES = ['navigation', 'banner', 'contentinfo']
+
+_host_limits = {}
+_host_limits_lock = threading.Lock()
+
+_probe_pool = None
+_probe_pool_lock = threading.Lock()
+
+def get_probe_pool():
+    """Return the shared candidate-probe pool, starting it on first use"""
+    global _probe_pool
+    with _probe_pool_lock:
+        if _probe_pool is None:
+            _probe_pool = ThreadPoolExecutor(max_workers=PROBE_WORKERS)
+        return _probe_pool
+
+def host_limit(url, limit=PER_HOST_LIMIT):
+    """Return the shared semaphore that limits concurrent requests to url's host"""
+    host = urlparse(url).netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+
+    with _host_limits_lock:
+        if host not in _host_limits:
+            _host_limits[host] = threading.Semaphore(limit)
+        return _host_limits[host]
+
 def search_for_mep_website(mep_name):
     """Search for the MEP organization's main website"""
     search_query = f"{mep_name} manufacturing extension partnership"
-    search_url = f"https://www.google.com/search?q={requests.utils.quote(search_query)}"
+    search_url = f"https://www.google.com/search?q={quote(search_query)}"
 
     headers = {
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
     }
 
     try:
-        response = requests.get(search_url, headers=headers, timeout=10)
-        soup = BeautifulSoup(response.text, 'html.parser')
+        with host_limit(search_url, limit=1):
+            response = fetch.get(search_url, headers=headers, timeout=10)
+            time.sleep(SEARCH_DELAY)
+        soup = make_soup(response.text)
 
         # Look for first organic search result
         for link in soup.find_all('a'):
@@ -30,6 +86,83 @@ def search_for_mep_website(mep_name):
 
     return None
 
+def probe_page(url, headers):
+    """Cheaply check a candidate page; returns (final url, start of its text) or None.
+
+    A HEAD request rules out missing pages without downloading anything, then a
+    ranged GET reads just the first PROBE_BYTES to check for staff content.
+    Candidates that redirect to the site root (a common soft 404) are rejected.
+    """
+    with host_limit(url):
+        try:
+            response = fetch.head(url, headers=headers, timeout=PROBE_TIMEOUT, allow_redirects=True)
+            # Plenty of servers don't implement HEAD; only trust a clear "not found"
+            if response.status_code in (404, 410) or _redirected_home(url, response.url):
+                return None
+
+            ranged = dict(headers, Range=f'bytes=0-{PROBE_BYTES - 1}')
+            response = fetch.get(url, headers=ranged, timeout=PROBE_TIMEOUT, stream=True)
+            try:
+                if response.status_code not in (200, 206) or _redirected_home(url, response.url):
+                    return None
+                # Servers that ignore Range send the whole page; stop reading early anyway
+                body = fetch.read_start(response, PROBE_BYTES)
+            finally:
+                response.close()
+        except Exception:
+            return None
+
+    try:
+        text = body.decode(response.encoding or 'utf-8', errors='replace')
+    except LookupError:
+        # Bogus charset in the Content-Type header
+        text = body.decode('utf-8', errors='replace')
+    return response.url, text
+
+def _redirected_home(url, final_url):
+    return urlparse(url).path.strip('/') != '' and urlparse(final_url or url).path.strip('/') == ''
+
+def staff_score(html):
+    """Number of distinct staff keywords in a page's main content (nav, header and footer removed)"""
+    soup = make_soup(html)
+    for tag in soup.find_all(CHROME_TAGS):
+        tag.decompose()
+    for tag in soup.find_all(attrs={'role': CHROME_ROLES}):
+        tag.decompose()
+    main = soup.find('main') or soup.find(attrs={'role': 'main'}) or soup
+    text = main.get_text().lower()
+    return sum(1 for keyword in STAFF_KEYWORDS if keyword in text)
+
+def best_candidate(urls, headers, min_score=1):
+    """Probe candidate URLs concurrently and return the best staff page, or None.
+
+    The earliest candidate (in the order given) scoring HIGH_CONFIDENCE wins, and
+    is returned as soon as every candidate before it has been ruled out; failing
+    that, the earliest candidate that scored at least min_score.
+    """
+    futures = {get_probe_pool().submit(probe_page, url, headers): i for i, url in enumerate(urls)}
+    scores = {}
+    settled = 0
+
+    try:
+        for future in as_completed(futures):
+            result = future.result()
+            scores[futures[future]] = (staff_score(result[1]), result[0]) if result else (-1, None)
+
+            # Walk forward over finished candidates; stop at one still in flight
+            while settled in scores:
+                score, final_url = scores[settled]
+                if score >= HIGH_CONFIDENCE:
+                    return final_url
+                settled += 1
+    finally:
+        # Anything still queued is no longer needed
+        for future in futures:
+            future.cancel()
+
+    hits = [final_url for _, (score, final_url) in sorted(scores.items()) if score >= min_score]
+    return hits[0] if hits else None
+
 def find_staff_page(base_url):
     """Given a base URL, try to find the staff/team page"""
     if not base_url:
@@ -39,105 +172,95 @@ def find_staff_page(base_url):
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
     }
 
-    # Common staff page patterns
+    # Common staff page patterns, most likely first
     staff_patterns = [
         '/team', '/our-team', '/staff', '/our-staff', '/about/team',
         '/about/staff', '/people', '/about/people', '/leadership',
         '/about-us/team', '/about-us/staff', '/meet-the-team'
     ]
 
-    # First, try direct patterns
-    for pattern in staff_patterns:
-        try:
-            test_url = urljoin(base_url, pattern)
-            response = requests.get(test_url, headers=headers, timeout=5)
-            if response.status_code == 200:
-                # Check if page actually contains staff content
-                soup = BeautifulSoup(response.text, 'html.parser')
-                text = soup.get_text().lower()
-                if any(keyword in text for keyword in ['staff', 'team', 'people', 'director', 'manager']):
-                    return test_url
-        except:
-            continue
-        time.sleep(0.5)
-
-    # If direct patterns don't work, scrape the homepage for links
+    # First, probe every direct pattern at once
+    staff_url = best_candidate([urljoin(base_url, pattern) for pattern in staff_patterns], headers)
+    if staff_url:
+        return staff_url
+
+    # If direct patterns don't work, probe the homepage's staff/team links the same way
     try:
-        response = requests.get(base_url, headers=headers, timeout=10)
-        soup = BeautifulSoup(response.text, 'html.parser')
+        with host_limit(base_url):
+            response = fetch.get(base_url, headers=headers, timeout=10)
+        soup = make_soup(response.text)
 
+        links = []
         for link in soup.find_all('a', href=True):
             text = link.get_text().lower()
-            href = link['href']
-
-            # Look for links with staff/team related text
-            if any(keyword in text for keyword in ['team', 'staff', 'our team', 'our staff', 'people', 'meet the team']):
-                full_url = urljoin(base_url, href)
-                # Verify it's a valid page
-                try:
-                    test_response = requests.get(full_url, headers=headers, timeout=5)
-                    if test_response.status_code == 200:
-                        return full_url
-                except:
-                    continue
-
-            time.sleep(0.3)
+            if any(keyword in text for keyword in LINK_KEYWORDS):
+                links.append(urljoin(base_url, link['href']))
+
+        # The link text already says "team"/"staff", so any page that loads will do
+        return best_candidate(list(dict.fromkeys(links)), headers, min_score=0)
     except:
         pass
 
     return None
 
-def process_mep_centers(input_csv, output_csv):
-    """Process all MEP centers and find their staff pages"""
-    results = []
+def research_center(row):
+    """Fill in row['Staff Page'] for one center; returns the row"""
+    state = row['State']
+    mep_name = row['Program Name (MEP Center)']
+
+    # Search for main website
+    base_url = search_for_mep_website(mep_name)
+
+    if base_url:
+        print(f"  {state}: found website {base_url}, looking for staff page...")
+        staff_url = find_staff_page(base_url)
+
+        if staff_url:
+            print(f"  {state}: [OK] Found staff page: {staff_url}")
+            row['Staff Page'] = staff_url
+        else:
+            print(f"  {state}: [X] No staff page found, using main site")
+            row['Staff Page'] = base_url
+    else:
+        print(f"  {state}: [X] Could not find website")
+        row['Staff Page'] = ''
 
+    return row
+
+def process_mep_centers(input_csv, output_csv, max_workers=MAX_WORKERS):
+    """Process all MEP centers and find their staff pages"""
     with open(input_csv, 'r', encoding='utf-8') as f:
         reader = csv.DictReader(f)
         rows = list(reader)
 
-    for i, row in enumerate(rows):
-        state = row['State']
-        mep_name = row['Program Name (MEP Center)']
+    pending = []
+    for row in rows:
         existing_url = row.get('Staff Page', '').strip()
-
-        print(f"\nProcessing {i+1}/{len(rows)}: {state} - {mep_name}")
-
         if existing_url:
-            print(f"  Already has URL: {existing_url}")
+            print(f"{row['State']}: already has URL: {existing_url}")
             row['Staff Page'] = existing_url
-            results.append(row)
-            continue
-
-        # Search for main website
-        print(f"  Searching for website...")
-        base_url = search_for_mep_website(mep_name)
-
-        if base_url:
-            print(f"  Found website: {base_url}")
-            print(f"  Looking for staff page...")
-            staff_url = find_staff_page(base_url)
-
-            if staff_url:
-                print(f"  [OK] Found staff page: {staff_url}")
-                row['Staff Page'] = staff_url
-            else:
-                print(f"  [X] No staff page found, using main site")
-                row['Staff Page'] = base_url
         else:
-            print(f"  [X] Could not find website")
-            row['Staff Page'] = ''
+            pending.append(row)
 
-        results.append(row)
+    print(f"\nResearching {len(pending)} centers with {max_workers} workers...")
 
-        # Be polite with delays
-        time.sleep(2)
+    # Rows are updated in place, so results keep the input order
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(research_center, row): row for row in pending}
+        for future in as_completed(futures):
+            row = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                print(f"Error processing {row['State']}: {e}")
+                row['Staff Page'] = ''
 
     # Write results
     with open(output_csv, 'w', newline='', encoding='utf-8') as f:
         fieldnames = ['State', 'Program Name (MEP Center)', 'Host Organization', 'Staff Page']
         writer = csv.DictWriter(f, fieldnames=fieldnames)
         writer.writeheader()
-        writer.writerows(results)
+        writer.writerows(rows)
 
     print(f"\n[COMPLETE] Results saved to {output_csv}")
 
@@ -146,6 +269,5 @@ if __name__ == "__main__":
     output_file = "state meps_updated.csv"
 
     print("Starting MEP staff page search...")
-    print("This will take several minutes due to rate limiting...")
 
     process_mep_centers(input_file, output_file)
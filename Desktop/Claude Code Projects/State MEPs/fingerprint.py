@@ -0,0 +1,29 @@
+import hashlib
+import re
+
+# Markup that changes on every request without the roster changing
+_VOLATILE = [
+    re.compile(r'<(script|style|noscript|template)\b.*?</\1\s*>', re.I | re.S),
+    re.compile(r'<!--.*?-->', re.S),
+    re.compile(r'<input\b[^>]*type=["\']?hidden["\']?[^>]*>', re.I),
+    re.compile(r'<meta\b[^>]*(?:csrf|nonce|token)[^>]*>', re.I),
+    re.compile(r'\s(?:nonce|data-nonce|integrity|data-csrf|data-timestamp)=(?:"[^"]*"|\'[^\']*\')', re.I),
+    # Cache-busting query strings on assets (?ver=6.4.2, ?v=123)
+    re.compile(r'\?(?:ver|v|_|cb|t)=[\w.-]+', re.I),
+    # ISO timestamps and Unix epochs (seconds or milliseconds)
+    re.compile(r'\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?(?:Z|[+-]\d{2}:?\d{2})?'),
+    re.compile(r'\b1[5-9]\d{8}(?:\d{3})?\b'),
+]
+_WHITESPACE = re.compile(r'\s+')
+
+def normalize_page(html):
+    """Strip scripts, comments, nonces, hidden tokens and timestamps from a page"""
+    if isinstance(html, bytes):
+        html = html.decode('utf-8', errors='replace')
+    for pattern in _VOLATILE:
+        html = pattern.sub(' ', html)
+    return _WHITESPACE.sub(' ', html).strip()
+
+def page_fingerprint(html):
+    """SHA-256 of the normalized page; equal fingerprints mean nothing worth re-parsing changed"""
+    return hashlib.sha256(normalize_page(html).encode('utf-8')).hexdigest()
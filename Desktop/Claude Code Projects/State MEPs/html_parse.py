@@ -0,0 +1,97 @@
+import atexit
+import os
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from bs4 import BeautifulSoup, SoupStrainer
+
+import metrics
+
+try:
+    import lxml  # noqa: F401 - only checking it's installed
+    DEFAULT_PARSER = 'lxml'
+except ImportError:
+    DEFAULT_PARSER = 'html.parser'
+
+FALLBACK_PARSER = 'html.parser'
+
+# Worker processes used by parse_many
+PARSE_WORKERS = max(1, (os.cpu_count() or 2) - 1)
+
+# Below this many pages a process pool costs more than it saves
+MIN_PARALLEL_PAGES = 4
+
+def make_soup(markup, parse_only=None, parser=DEFAULT_PARSER):
+    """Parse HTML with lxml, falling back to html.parser if lxml fails or loses the page"""
+    with metrics.span('parse', bytes=len(markup or '')):
+        if parser != FALLBACK_PARSER:
+            try:
+                soup = BeautifulSoup(markup, parser, parse_only=parse_only)
+                # lxml gives up silently on some badly broken markup (an empty
+                # result is expected when a strainer simply matched nothing)
+                if soup.contents or not markup or parse_only is not None:
+                    return soup
+            except Exception as e:
+                print(f"{parser} could not parse page ({e}), falling back to {FALLBACK_PARSER}")
+        return BeautifulSoup(markup, FALLBACK_PARSER, parse_only=parse_only)
+
+def class_token(*names):
+    """Match elements carrying any of the given CSS classes.
+
+    While parsing, the strainer sees the raw class attribute ("item h-100"), so
+    a plain class_='item' would miss multi-class elements.
+    """
+    return re.compile(r'(^|\s)(%s)(\s|$)' % '|'.join(re.escape(name) for name in names))
+
+# Page regions each state's scraper actually reads (SoupStrainer arguments).
+# Only these subtrees get built; navigation, scripts and footers are skipped.
+STATE_REGIONS = {
+    'AL': {'name': 'div', 'class_': class_token('tab-pane', 'item')},
+    'CA': {'name': 'div', 'class_': class_token('team-member')},
+    'FL': {'name': 'div', 'id': 'MainCopy_ContentWrapper'},
+}
+
+def make_state_soup(state_abbrev, markup):
+    """Parse only the regions declared for state_abbrev in STATE_REGIONS (whole page if none)"""
+    region = STATE_REGIONS.get(state_abbrev)
+    if not region:
+        return make_soup(markup)
+
+    soup = make_soup(markup, parse_only=SoupStrainer(**region))
+    if soup.contents:
+        return soup
+
+    # Region not on the page (layout changed?) - hand back the full page
+    print(f"No {state_abbrev} region {region} found, parsing full page")
+    return make_soup(markup)
+
+_pool = None
+_pool_lock = threading.Lock()
+
+def get_parse_pool():
+    """Return the process-wide parse pool, starting it on first use"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=PARSE_WORKERS)
+            atexit.register(_pool.shutdown)
+        return _pool
+
+def parse_many(parse_fn, pages):
+    """Run parse_fn(content) over many pages on the process pool; returns results in order.
+
+    parse_fn must be a module-level function that returns plain data (dicts,
+    strings) - soups don't cross process boundaries cheaply. Callers must be
+    importable without side effects (scripts need an if __name__ == "__main__" guard).
+    """
+    pages = list(pages)
+    with metrics.span('parse_many', pages=len(pages)):
+        if len(pages) < MIN_PARALLEL_PAGES or PARSE_WORKERS == 1:
+            return [parse_fn(content) for content in pages]
+
+        try:
+            chunksize = max(1, len(pages) // (PARSE_WORKERS * 4))
+            return list(get_parse_pool().map(parse_fn, pages, chunksize=chunksize))
+        except Exception as e:
+            print(f"Parallel parse failed ({e}), parsing in this process...")
+            return [parse_fn(content) for content in pages]
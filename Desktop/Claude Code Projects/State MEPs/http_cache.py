@@ -0,0 +1,145 @@
+import hashlib
+import json
+import os
+import threading
+import time
+
+# Where cached responses live, relative to the working directory
+CACHE_DIR = '.http_cache'
+
+# Limits: oldest entries are evicted once the cache grows past MAX_CACHE_BYTES,
+# and entries older than MAX_AGE_DAYS are refetched in full
+MAX_CACHE_BYTES = 500 * 1024 * 1024
+MAX_AGE_DAYS = 30
+
+class ResponseCache:
+    """On-disk response cache keyed by URL, revalidated with ETag/Last-Modified"""
+
+    def __init__(self, cache_dir=CACHE_DIR, max_bytes=MAX_CACHE_BYTES, max_age_days=MAX_AGE_DAYS):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.max_age = max_age_days * 24 * 60 * 60
+        self.lock = threading.Lock()
+        self.total_bytes = None  # computed on first store
+
+    def _paths(self, url):
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        base = os.path.join(self.cache_dir, key[:2], key)
+        return base + '.json', base + '.body'
+
+    def lookup(self, url):
+        """Return (meta, body) for a fresh cached entry, or None"""
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            if time.time() - meta['stored_at'] > self.max_age:
+                self.remove(url)
+                return None
+            with open(body_path, 'rb') as f:
+                body = f.read()
+            return meta, body
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def conditional_headers(self, meta):
+        """Build If-None-Match / If-Modified-Since headers from a cached entry"""
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+
+    def store(self, url, headers, body):
+        """Save a 200 response; only responses with a validator are worth keeping"""
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+
+        meta = {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'content_type': headers.get('Content-Type', ''),
+            'stored_at': time.time(),
+            'size': len(body),
+        }
+
+        meta_path, body_path = self._paths(url)
+        os.makedirs(os.path.dirname(meta_path), exist_ok=True)
+
+        with self.lock:
+            old_size = self._entry_size(body_path)
+            self._write(body_path, body, 'wb')
+            self._write(meta_path, json.dumps(meta), 'w')
+
+            if self.total_bytes is None:
+                self.total_bytes = self._scan_size()
+            else:
+                self.total_bytes += len(body) - old_size
+
+            if self.total_bytes > self.max_bytes:
+                self._evict()
+
+    def refresh(self, url, meta):
+        """Mark a cached entry as revalidated (after a 304) so its age restarts"""
+        meta_path, _ = self._paths(url)
+        meta['stored_at'] = time.time()
+        try:
+            self._write(meta_path, json.dumps(meta), 'w')
+        except OSError:
+            pass
+
+    def remove(self, url):
+        for path in self._paths(url):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _write(self, path, data, mode):
+        # Write then rename so a crash never leaves a half-written entry
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, mode, **({} if 'b' in mode else {'encoding': 'utf-8'})) as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _entry_size(self, body_path):
+        try:
+            return os.path.getsize(body_path)
+        except OSError:
+            return 0
+
+    def _bodies(self):
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if name.endswith('.body'):
+                    path = os.path.join(root, name)
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue
+                    yield path, stat.st_size, stat.st_mtime
+
+    def _scan_size(self):
+        return sum(size for _, size, _ in self._bodies())
+
+    def _evict(self):
+        """Drop the least recently written entries until the cache fits again"""
+        entries = sorted(self._bodies(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes * 0.9
+
+        for body_path, size, _ in entries:
+            if total <= target:
+                break
+            for path in (body_path, body_path[:-len('.body')] + '.json'):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            total -= size
+
+        self.total_bytes = total
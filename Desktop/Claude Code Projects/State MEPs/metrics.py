@@ -0,0 +1,156 @@
+import json
+import os
+import sys
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# Every span and counter is appended here as one JSON object per line
+METRICS_FILE = os.environ.get('SCRAPE_METRICS', 'metrics.jsonl')
+
+# Set SCRAPE_METRICS=off to skip writing the file (in-memory totals are still kept)
+ENABLED = METRICS_FILE.lower() != 'off'
+
+RUN_ID = f"{time.strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:6]}"
+
+# Open spans as ((name, tags), ...); a ContextVar so concurrent asyncio fetches don't share a stack
+_open_spans = ContextVar('open_spans', default=())
+_lock = threading.Lock()
+_file = None
+
+# In-memory totals for the end-of-run summary: {(name, state): [count, total_ms]} and {(name, state): value}
+_span_totals = {}
+_counters = {}
+
+def _inherited_tags():
+    # Counters and child spans pick up state/url from the spans they run inside
+    open_spans = _open_spans.get()
+    return dict(open_spans[-1][1]) if open_spans else {}
+
+def _emit(event):
+    global _file
+    if not ENABLED:
+        return
+    line = json.dumps(event, default=str) + '\n'
+    with _lock:
+        if _file is None:
+            _file = open(METRICS_FILE, 'a', encoding='utf-8')
+        _file.write(line)
+        _file.flush()
+
+@contextmanager
+def span(name, **tags):
+    """Time a block: with span('fetch', url=url): ...
+
+    Tags from enclosing spans (e.g. state) are inherited. Yields a dict; keys
+    added to it inside the block are written with the span (e.g. bytes, status).
+    """
+    tags = {**_inherited_tags(), **tags}
+    extra = {}
+    parent = _open_spans.get()
+    token = _open_spans.set(parent + ((name, tags),))
+    start = time.perf_counter()
+    try:
+        yield extra
+    finally:
+        ms = (time.perf_counter() - start) * 1000
+        _open_spans.reset(token)
+        key = (name, tags.get('state'))
+        with _lock:
+            totals = _span_totals.setdefault(key, [0, 0.0])
+            totals[0] += 1
+            totals[1] += ms
+        _emit({'run': RUN_ID, 'type': 'span', 'name': name, 'ms': round(ms, 3),
+               'parent': parent[-1][0] if parent else None, 'thread': threading.current_thread().name,
+               **tags, **extra})
+
+def count(name, value=1, **tags):
+    """Add to a counter (bytes_fetched, cache_hits, retries, records_extracted...)"""
+    if not value:
+        return
+    tags = {**_inherited_tags(), **tags}
+    key = (name, tags.get('state'))
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + value
+    _emit({'run': RUN_ID, 'type': 'counter', 'name': name, 'value': value, **tags})
+
+def _rank(totals, top):
+    return sorted(totals.items(), key=lambda item: item[1], reverse=True)[:top]
+
+def summarize(span_totals, counters, top=10):
+    """Print the slowest states and stages and the counter totals"""
+    by_state, by_stage = {}, {}
+    for (name, state), (calls, ms) in span_totals.items():
+        if name == 'state' and state:
+            by_state[state] = by_state.get(state, 0.0) + ms
+        elif name != 'state':
+            calls_ms = by_stage.setdefault(name, [0, 0.0])
+            calls_ms[0] += calls
+            calls_ms[1] += ms
+
+    if by_state:
+        print(f"\n{'Slowest states':<24} {'seconds':>10}")
+        for state, ms in _rank(by_state, top):
+            print(f"  {state:<22} {ms / 1000:>10.2f}")
+
+    if by_stage:
+        # Stage time is summed across threads, so it can exceed the wall-clock run time
+        print(f"\n{'Slowest stages':<24} {'calls':>8} {'total s':>10} {'avg ms':>10}")
+        for name, (calls, ms) in sorted(by_stage.items(), key=lambda item: item[1][1], reverse=True)[:top]:
+            print(f"  {name:<22} {calls:>8} {ms / 1000:>10.2f} {ms / calls:>10.1f}")
+
+    totals = {}
+    for (name, _), value in counters.items():
+        totals[name] = totals.get(name, 0) + value
+    if totals:
+        print(f"\n{'Counters':<24} {'total':>12}")
+        for name, value in sorted(totals.items()):
+            print(f"  {name:<22} {value:>12,}")
+
+def summary(top=10):
+    """Print this run's summary table"""
+    with _lock:
+        span_totals = {key: list(value) for key, value in _span_totals.items()}
+        counters = dict(_counters)
+    summarize(span_totals, counters, top)
+    if ENABLED and _file is not None:
+        print(f"\nMetrics for run {RUN_ID} written to {METRICS_FILE}")
+
+def load_run(path=METRICS_FILE, run_id=None):
+    """Rebuild (span_totals, counters) for one run in a metrics file (the latest by default)"""
+    events = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                events.append(json.loads(line))
+            except ValueError:
+                continue
+    if not events:
+        return None, {}, {}
+
+    run_id = run_id or events[-1]['run']
+    span_totals, counters = {}, {}
+    for event in events:
+        if event.get('run') != run_id:
+            continue
+        key = (event['name'], event.get('state'))
+        if event['type'] == 'span':
+            totals = span_totals.setdefault(key, [0, 0.0])
+            totals[0] += 1
+            totals[1] += event['ms']
+        elif event['type'] == 'counter':
+            counters[key] = counters.get(key, 0) + event['value']
+    return run_id, span_totals, counters
+
+if __name__ == "__main__":
+    # Usage: python metrics.py [metrics.jsonl] [run_id]   - summary table for a recorded run
+    path = sys.argv[1] if len(sys.argv) > 1 else METRICS_FILE
+    if not os.path.exists(path):
+        print(f"No metrics file at {path}")
+        sys.exit(1)
+
+    run_id, span_totals, counters = load_run(path, sys.argv[2] if len(sys.argv) > 2 else None)
+    print(f"Run {run_id} from {path}")
+    summarize(span_totals, counters)
@@ -0,0 +1,188 @@
+import json
+import os
+import re
+import sys
+
+import fetch
+from driver_pool import make_driver
+from waits import DEFAULT_TIMEOUT, scroll_to_bottom, wait_for_network_idle
+
+# Discovered roster endpoints, keyed by state abbreviation
+ENDPOINTS_FILE = 'staff_endpoints.json'
+
+# Keys that suggest a JSON record describes a person
+STAFF_KEYS = {
+    'name', 'full_name', 'first_name', 'last_name', 'firstname', 'lastname',
+    'email', 'phone', 'telephone', 'mobile', 'cell',
+    'title', 'position', 'job_title', 'jobtitle', 'role',
+    'bio', 'biography', 'description',
+}
+
+# Candidate keys for each output column, in priority order
+FIELD_KEYS = {
+    'Name': ['name', 'full_name', 'fullname', 'title.rendered', 'post_title'],
+    'Title': ['position', 'job_title', 'jobtitle', 'role', 'acf.position', 'acf.title', 'title'],
+    'Phone': ['phone', 'telephone', 'office_phone', 'acf.phone'],
+    'Mobile': ['mobile', 'cell', 'mobile_phone', 'acf.mobile'],
+    'Email': ['email', 'email_address', 'acf.email'],
+    'Bio': ['bio', 'biography', 'description', 'content.rendered', 'acf.bio'],
+}
+
+TAG_RE = re.compile(r'<[^>]+>')
+
+def _flatten(record, prefix=''):
+    """Flatten nested dicts into dotted lowercase keys (e.g. title.rendered)"""
+    flat = {}
+    for key, value in record.items():
+        full_key = f"{prefix}{str(key).lower()}"
+        if isinstance(value, dict):
+            flat.update(_flatten(value, full_key + '.'))
+        else:
+            flat[full_key] = value
+    return flat
+
+def _staff_key_hits(records):
+    keys = set()
+    for record in records[:20]:
+        for key in _flatten(record):
+            keys.add(key.rsplit('.', 1)[-1])
+            keys.add(key.split('.', 1)[0])
+    return len(keys & STAFF_KEYS)
+
+def find_staff_records(data):
+    """Return the list of dicts in a JSON payload that looks most like a staff roster"""
+    best, best_score = [], 0
+
+    def visit(node):
+        nonlocal best, best_score
+        if isinstance(node, list):
+            records = [item for item in node if isinstance(item, dict)]
+            if len(records) >= 2:
+                hits = _staff_key_hits(records)
+                score = hits * len(records) if hits >= 2 else 0
+                if score > best_score:
+                    best, best_score = records, score
+            for item in node:
+                visit(item)
+        elif isinstance(node, dict):
+            for value in node.values():
+                visit(value)
+
+    visit(data)
+    return best
+
+def records_to_staff(records):
+    """Map JSON staff records onto the Name/Title/Phone/Mobile/Email/Bio columns"""
+    staff_data = []
+    for record in records:
+        flat = _flatten(record)
+        row = {}
+        for column, keys in FIELD_KEYS.items():
+            value = ''
+            for key in keys:
+                if flat.get(key):
+                    value = flat[key]
+                    break
+            row[column] = TAG_RE.sub(' ', str(value)).strip() if value else ''
+            row[column] = ' '.join(row[column].split())
+
+        if not row['Name']:
+            first = flat.get('first_name') or flat.get('firstname') or ''
+            last = flat.get('last_name') or flat.get('lastname') or ''
+            row['Name'] = f"{first} {last}".strip()
+
+        # 'title' is the job title unless it's the only name we have
+        if row['Title'] == row['Name']:
+            row['Title'] = ''
+
+        if row['Name']:
+            staff_data.append(row)
+    return staff_data
+
+def capture_json_responses(driver, url, timeout=DEFAULT_TIMEOUT):
+    """Load url and return [(response_url, parsed_json)] for every JSON response seen"""
+    driver.get_log('performance')  # discard anything logged before this page
+    driver.get(url)
+    wait_for_network_idle(driver, timeout)
+    scroll_to_bottom(driver, timeout=timeout)
+
+    responses = []
+    for entry in driver.get_log('performance'):
+        try:
+            message = json.loads(entry['message'])['message']
+        except (KeyError, ValueError):
+            continue
+        if message.get('method') != 'Network.responseReceived':
+            continue
+
+        params = message['params']
+        response = params['response']
+        mime_type = response.get('mimeType', '')
+        if 'json' not in mime_type and params.get('type') not in ('XHR', 'Fetch'):
+            continue
+
+        try:
+            body = driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': params['requestId']})
+            responses.append((response['url'], json.loads(body['body'])))
+        except Exception:
+            continue
+
+    return responses
+
+def discover_staff_endpoint(state_abbrev, url, timeout=DEFAULT_TIMEOUT):
+    """Record a page's network traffic and save the JSON endpoint that carries its roster"""
+    print(f"Recording network requests for {state_abbrev}: {url}")
+    driver = make_driver(performance_log=True)
+    try:
+        responses = capture_json_responses(driver, url, timeout)
+    finally:
+        driver.quit()
+
+    print(f"Captured {len(responses)} JSON responses")
+
+    best = None
+    for response_url, data in responses:
+        records = find_staff_records(data)
+        if records:
+            print(f"  {len(records)} staff-like records: {response_url}")
+            if best is None or len(records) > best['record_count']:
+                best = {'url': response_url, 'record_count': len(records), 'page': url}
+
+    if best:
+        endpoints = load_endpoints()
+        endpoints[state_abbrev] = best
+        with open(ENDPOINTS_FILE, 'w', encoding='utf-8') as f:
+            json.dump(endpoints, f, indent=2)
+        print(f"Saved {state_abbrev} endpoint to {ENDPOINTS_FILE}: {best['url']}")
+    else:
+        print("No JSON staff feed found - this state still needs the browser")
+
+    return best
+
+def load_endpoints():
+    if not os.path.exists(ENDPOINTS_FILE):
+        return {}
+    with open(ENDPOINTS_FILE, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def fetch_staff_from_endpoint(state_abbrev):
+    """Fetch a state's roster straight from its saved JSON endpoint (no browser); [] if none"""
+    endpoint = load_endpoints().get(state_abbrev)
+    if not endpoint:
+        return []
+
+    try:
+        print(f"Fetching {state_abbrev} roster from JSON endpoint: {endpoint['url']}")
+        response = fetch.get(endpoint['url'])
+        response.raise_for_status()
+        return records_to_staff(find_staff_records(response.json()))
+    except Exception as e:
+        print(f"Error fetching {state_abbrev} endpoint: {e}")
+        return []
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Usage: python network_capture.py <state_abbrev> <staff_url>")
+        sys.exit(1)
+
+    discover_staff_endpoint(sys.argv[1].upper(), sys.argv[2])
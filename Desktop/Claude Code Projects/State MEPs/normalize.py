@@ -0,0 +1,113 @@
+import sys
+import time
+
+import pandas as pd
+
+from staff_store import load_staff
+from workbook_writer import COLUMNS
+
+OUTPUT_CSV = 'all_staff_normalized.csv'
+
+# Optional +1/1, 10 digits in any punctuation, optional extension ("256.734.4796 ext. 3")
+PHONE_RE = (r'^\D*?(?:\+?1\D*)?(\d{3})\D{0,3}(\d{3})\D{0,3}(\d{4})'
+            r'(?:\s*(?:ext\.?|extension|x)\s*(\d{1,6}))?\D*$')
+
+EMAIL_RE = r'([a-zA-Z0-9._%+-]+@[a-zA-Z0-9-]+(?:\.[a-zA-Z0-9-]+)*\.[a-zA-Z]{2,})'
+
+# Degrees and certifications that follow a name ("Nicholas Loyd, PhD", "Jane Doe, P.E., CPA")
+CREDENTIALS = [
+    'PhD', 'EdD', 'MD', 'JD', 'MBA', 'MPA', 'MS', 'MSc', 'MA', 'MEng', 'BS', 'BA', 'PE',
+    'CPA', 'PMP', 'CMfgE', 'CPIM', 'CSCP', 'CQE', 'CQA', 'CSSBB', 'CSSGB', 'LSSBB', 'LSSGB',
+    'SHRM-CP', 'SHRM-SCP', 'SPHR', 'PHR', 'CEcD', 'CFA', 'CFP', 'CMA', 'CISSP', 'CMRP',
+    'CSP', 'CIH', 'Esq',
+]
+# Dotted spellings too: "Ph.D.", "P.E."
+_credential_patterns = [r'\.?'.join(credential) if credential.isalpha() else credential
+                        for credential in CREDENTIALS]
+CREDENTIALS_RE = r'(?:\s*,?\s*\b(?:%s)\b\.?)+\s*$' % '|'.join(_credential_patterns)
+_CREDENTIAL_TOKENS = {credential.lower() for credential in CREDENTIALS}
+
+def _on_nonempty(raw, fn):
+    # Most Mobile/Phone cells are blank; only run the regex work on the rest
+    mask = raw != ''
+    if mask.all():
+        return fn(raw)
+    return fn(raw[mask])
+
+def normalize_phones(series):
+    """Vectorized phone cleanup; returns (display, e164, extension) Series.
+
+    Handles "334.844.4271", "(870) 680-8275", "954-253-7289", raw tel: hrefs
+    ("%2018605133200") and trailing extensions. Anything that isn't a 10-digit
+    US number keeps its original text and gets no E.164.
+    """
+    raw = series.fillna('').astype(str).str.strip()
+    display = raw.copy()
+    e164 = pd.Series('', index=raw.index)
+    extension = pd.Series('', index=raw.index)
+
+    parts = _on_nonempty(raw, lambda values: values.str.replace('%20', ' ', regex=False)
+                                                   .str.extract(PHONE_RE))
+    parts = parts.dropna(subset=[0])
+    if len(parts):
+        ext = parts[3].fillna('')
+        formatted = '(' + parts[0] + ') ' + parts[1] + '-' + parts[2]
+        display[parts.index] = formatted.where(ext == '', formatted + ' ext. ' + ext)
+        e164[parts.index] = '+1' + parts[0] + parts[1] + parts[2]
+        extension[parts.index] = ext
+    return display, e164, extension
+
+def normalize_emails(series):
+    """Lowercase and validate emails; returns (email, is_valid) Series ("" when invalid)"""
+    raw = series.fillna('').astype(str).str.strip().str.replace(r'(?i)^mailto:', '', regex=True)
+    email = raw.str.extract(EMAIL_RE, expand=False).fillna('').str.lower()
+    return email, email != ''
+
+def normalize_names(series):
+    """Strip trailing credentials ("Nicholas Loyd, PhD" -> "Nicholas Loyd") and tidy whitespace"""
+    names = series.fillna('').astype(str).str.replace(r'\s+', ' ', regex=True).str.strip()
+
+    # Cheap hash lookup on the last word first; the credential regex only runs on likely hits
+    last_word = names.str.rsplit(' ', n=1).str[-1].str.replace(r'[.,]', '', regex=True).str.lower()
+    mask = names.str.contains(',', regex=False) | last_word.isin(_CREDENTIAL_TOKENS)
+    if mask.any():
+        names[mask] = names[mask].str.replace(CREDENTIALS_RE, '', regex=True).str.rstrip(' ,')
+    return names
+
+def normalize_staff(df):
+    """Normalize a combined staff frame column-by-column (no per-row Python).
+
+    Adds 'Phone E164', 'Mobile E164' and 'Email Valid'; Phone/Mobile become the
+    (XXX) XXX-XXXX display form, Email is lowercased, Name loses credentials.
+    """
+    df = df.copy()
+    for column in COLUMNS:
+        if column not in df.columns:
+            df[column] = ''
+
+    df['Name'] = normalize_names(df['Name'])
+    df['Phone'], df['Phone E164'], _ = normalize_phones(df['Phone'])
+    df['Mobile'], df['Mobile E164'], _ = normalize_phones(df['Mobile'])
+    df['Email'], df['Email Valid'] = normalize_emails(df['Email'])
+    return df
+
+def load_combined():
+    """Every state's current roster from the store as one frame (State column included)"""
+    return pd.DataFrame(load_staff(), columns=['State'] + COLUMNS)
+
+if __name__ == "__main__":
+    # Usage: python normalize.py [staff.csv ...]   (no arguments = everything in the store)
+    if len(sys.argv) > 1:
+        df = pd.concat([pd.read_csv(path, dtype=str) for path in sys.argv[1:]], ignore_index=True)
+    else:
+        df = load_combined()
+
+    start = time.perf_counter()
+    df = normalize_staff(df)
+    elapsed = time.perf_counter() - start
+
+    df.to_csv(OUTPUT_CSV, index=False)
+    print(f"Normalized {len(df)} rows in {elapsed * 1000:.1f} ms")
+    print(f"  Phones with E.164: {(df['Phone E164'] != '').sum()}")
+    print(f"  Valid emails: {df['Email Valid'].sum()}")
+    print(f"Saved to {OUTPUT_CSV}")
@@ -0,0 +1,105 @@
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import metrics
+from checkpoint import Checkpoint
+from dedup import merge_records
+from run_all_states import MAX_WORKERS, load_state_pages, run_state
+from staff_store import save_staff
+from workbook_writer import COLUMNS, WORKBOOK, WorkbookWriter
+
+# Stages. Each yields (state, records, resumed) so states flow through one at a time.
+
+def extract_stage(states, checkpoint, max_workers=MAX_WORKERS):
+    """Fetch, parse and extract each state; finished states are replayed from the checkpoint"""
+    pending = []
+    for state_name, abbrev, staff_url in states:
+        records = checkpoint.completed(abbrev)
+        if records is not None:
+            print(f"{state_name}: resumed {len(records)} staff from checkpoint")
+            yield abbrev, records, True
+        else:
+            pending.append((state_name, abbrev, staff_url))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(run_state, state_name, abbrev, staff_url, checkpoint.state(abbrev)): (state_name, abbrev)
+            for state_name, abbrev, staff_url in pending
+        }
+
+        for future in as_completed(futures):
+            state_name, abbrev = futures[future]
+            try:
+                yield abbrev, future.result() or [], False
+            except Exception as e:
+                print(f"Error processing {state_name}: {e}")
+
+def normalize_stage(stream):
+    """Tidy each roster: trim fields, drop nameless rows, merge duplicate people"""
+    for abbrev, records, resumed in stream:
+        if not resumed:
+            cleaned = []
+            for record in records:
+                row = {column: ' '.join(str(record.get(column) or '').split()) for column in COLUMNS}
+                if row['Name']:
+                    cleaned.append(row)
+            records = merge_records(cleaned, abbrev)
+        yield abbrev, records, resumed
+
+def persist_stage(stream, checkpoint, writer):
+    """Save each state to the store and checkpoint it as soon as it arrives"""
+    for abbrev, records, resumed in stream:
+        # Nothing extracted usually means a failed fetch, so leave the state for a resume to retry
+        if records:
+            if not resumed:
+                save_staff(abbrev, records)
+                checkpoint.complete(abbrev, records)
+            writer.add(abbrev, records)
+        yield abbrev, records
+
+def run_pipeline(states, name='run_all_states', workbook_path=WORKBOOK, resume=True):
+    """Stream states through extract -> normalize -> persist; returns {abbrev: records}.
+
+    Progress is checkpointed per state and per profile, so an interrupted run
+    picks up where it stopped. Checkpoints are cleared once the workbook is saved.
+    """
+    checkpoint = Checkpoint(name)
+    if not resume:
+        checkpoint.clear()
+        checkpoint = Checkpoint(name)
+
+    writer = WorkbookWriter(workbook_path)
+    stream = extract_stage(states, checkpoint)
+    stream = normalize_stage(stream)
+    stream = persist_stage(stream, checkpoint, writer)
+
+    results = {}
+    for abbrev, records in stream:
+        results[abbrev] = records
+        print(f"  {abbrev}: {len(records)} staff ({len(results)}/{len(states)} states done)")
+
+    try:
+        updated = writer.flush()
+        print(f"\nUpdated {len(updated)} tabs in {workbook_path}")
+    except Exception as e:
+        print(f"Error updating Excel: {e}")
+        print(f"Checkpoints kept in {checkpoint.path}; rerun to retry the save without re-scraping.")
+        return results
+
+    checkpoint.clear()
+    return results
+
+if __name__ == "__main__":
+    # Usage: python pipeline.py [--fresh] [AL AK ...]   (--fresh ignores an interrupted run's checkpoints)
+    args = sys.argv[1:]
+    resume = '--fresh' not in args
+    only = {arg.upper() for arg in args if not arg.startswith('--')}
+
+    states = load_state_pages(only=only)
+    print(f"Running pipeline for {len(states)} states with {MAX_WORKERS} workers...")
+
+    start = time.time()
+    results = run_pipeline(states, resume=resume)
+    print(f"\nFinished {len(results)} states in {time.time() - start:.1f}s")
+    metrics.summary()
@@ -0,0 +1,382 @@
+import atexit
+import hashlib
+import json
+import os
+import runpy
+import sys
+import threading
+import zipfile
+from http import HTTPStatus
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# SCRAPE_REPLAY=record captures every HTTP response and rendered page into the
+# fixture archive; SCRAPE_REPLAY=replay serves them back with no network or Chrome.
+mode = os.environ.get('SCRAPE_REPLAY', '').lower() or None
+FIXTURES = os.environ.get('SCRAPE_FIXTURES', 'fixtures.zip')
+
+INDEX = 'index.json'
+
+# Response headers worth keeping; the rest vary per request and bloat the archive
+KEPT_HEADERS = ('Content-Type', 'ETag', 'Last-Modified', 'X-WP-Total', 'X-WP-TotalPages')
+
+class FixtureArchive:
+    """Responses, page sources and script results keyed by request, in one deflated zip.
+
+    index.json maps each key to its metadata; bodies are stored once per distinct
+    content under bodies/<sha1>.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.index = {}
+        self.bodies = {}
+        self._zip = None
+        self._lock = threading.Lock()
+        self._dirty = False
+
+        if os.path.exists(path):
+            self._zip = zipfile.ZipFile(path)
+            self.index = json.loads(self._zip.read(INDEX))
+
+    def __contains__(self, key):
+        return key in self.index
+
+    def get(self, key):
+        """Return (meta, body) for a recorded key, or None"""
+        meta = self.index.get(key)
+        if meta is None:
+            return None
+        body = None
+        if meta.get('body'):
+            with self._lock:
+                body = self.bodies.get(meta['body'])
+                if body is None:
+                    body = self.bodies[meta['body']] = self._zip.read(f"bodies/{meta['body']}")
+        return meta, body
+
+    def put(self, key, meta, body=None):
+        meta = dict(meta)
+        with self._lock:
+            if body is not None:
+                digest = hashlib.sha1(body).hexdigest()
+                self.bodies.setdefault(digest, body)
+                meta['body'] = digest
+            self.index[key] = meta
+            self._dirty = True
+
+    def save(self):
+        """Write the archive (earlier recordings plus this run's) and swap it into place"""
+        with self._lock:
+            if not self._dirty:
+                return
+            needed = {meta['body'] for meta in self.index.values() if meta.get('body')}
+            tmp_path = f"{self.path}.tmp"
+            with zipfile.ZipFile(tmp_path, 'w', compression=zipfile.ZIP_DEFLATED) as out:
+                out.writestr(INDEX, json.dumps(self.index, indent=1))
+                for digest in sorted(needed):
+                    body = self.bodies.get(digest)
+                    if body is None:
+                        body = self._zip.read(f"bodies/{digest}")
+                    out.writestr(f"bodies/{digest}", body)
+            if self._zip:
+                self._zip.close()
+            os.replace(tmp_path, self.path)
+            self._zip = zipfile.ZipFile(self.path)
+            self._dirty = False
+        print(f"Saved {len(self.index)} recorded responses to {self.path}")
+
+_archive = None
+_archive_lock = threading.Lock()
+
+def archive():
+    """Return the process-wide fixture archive, opening it on first use"""
+    global _archive
+    with _archive_lock:
+        if _archive is None:
+            _archive = FixtureArchive(FIXTURES)
+            if mode == 'record':
+                atexit.register(_archive.save)
+        return _archive
+
+def set_mode(new_mode, path=None):
+    """Switch record/replay on (or off with None) from code rather than the environment"""
+    global mode, FIXTURES, _archive
+    mode = new_mode
+    if path:
+        FIXTURES = path
+    _archive = None
+
+def request_key(method, url, params=None):
+    if params:
+        url = requests.Request(method, url, params=params).prepare().url
+    return f"{method} {url}"
+
+# HTTP (fetch.get / fetch.head / async_fetch)
+
+def record_response(method, url, response, params=None):
+    headers = {name: response.headers[name] for name in KEPT_HEADERS if name in response.headers}
+    meta = {'status': response.status_code, 'url': response.url or url, 'headers': headers}
+    archive().put(request_key(method, url, params), meta, None if method == 'HEAD' else response.content)
+
+def replay_response(method, url, params=None):
+    """Rebuild a recorded requests.Response; raises ConnectionError if it was never recorded"""
+    fixture = archive().get(request_key(method, url, params))
+    if fixture is None:
+        raise requests.ConnectionError(f"No recorded response for {method} {url} in {FIXTURES}")
+    meta, body = fixture
+
+    response = requests.Response()
+    response.status_code = meta['status']
+    try:
+        response.reason = HTTPStatus(meta['status']).phrase
+    except ValueError:
+        response.reason = ''
+    response.url = meta['url']
+    response._content = body or b''
+    response.headers = CaseInsensitiveDict(meta['headers'])
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    response.replayed = True
+    return response
+
+def record_body(url, status, body):
+    archive().put(request_key('GET', url), {'status': status, 'url': url, 'headers': {}}, body)
+
+def replay_body(url):
+    """Recorded body for an async fetch, or None (treated like a failed request)"""
+    fixture = archive().get(request_key('GET', url))
+    if fixture is None or fixture[0]['status'] >= 400:
+        return None
+    return fixture[1]
+
+# WebDriver (driver_pool.make_driver)
+
+def _script_key(url, script, count):
+    return f"JS {url} {hashlib.sha1(script.encode('utf-8')).hexdigest()[:12]} {count}"
+
+def _not_recorded(message):
+    from selenium.common.exceptions import WebDriverException
+    return WebDriverException(f"{message} - not in {FIXTURES}; record this run again")
+
+class RecordingDriver:
+    """Wraps a real Chrome driver, recording page sources and script results per page load.
+
+    The DOM is snapshotted after each get() and before the first element lookup
+    following a get() or a script, so replayed lookups see the page the scraper saw.
+    """
+
+    def __init__(self, driver):
+        self._driver = driver
+        self._url = None
+        self._reads = {}
+        self._stale = False
+
+    def __getattr__(self, name):
+        return getattr(self._driver, name)
+
+    def get(self, url):
+        self._url = url
+        self._reads = {}
+        result = self._driver.get(url)
+        self._snapshot()
+        return result
+
+    def _count(self, key):
+        self._reads[key] = self._reads.get(key, 0) + 1
+        return self._reads[key]
+
+    def _snapshot(self):
+        html = self._driver.page_source
+        key = f"DOM {self._url} {self._count('DOM')}"
+        archive().put(key, {'url': self._url}, html.encode('utf-8'))
+        self._stale = False
+        return html
+
+    @property
+    def page_source(self):
+        return self._snapshot()
+
+    def find_elements(self, *args, **kwargs):
+        if self._stale:
+            self._snapshot()
+        return self._driver.find_elements(*args, **kwargs)
+
+    def find_element(self, *args, **kwargs):
+        if self._stale:
+            self._snapshot()
+        return self._driver.find_element(*args, **kwargs)
+
+    def _record_script(self, script, result):
+        meta = {'live': True}
+        try:
+            meta = {'value': json.dumps(result)}
+        except (TypeError, ValueError):
+            # WebElements and other live objects can't be replayed
+            pass
+        archive().put(_script_key(self._url, script, self._count(script)), meta)
+        self._stale = True
+        return result
+
+    def execute_script(self, script, *args):
+        return self._record_script(script, self._driver.execute_script(script, *args))
+
+    def execute_async_script(self, script, *args):
+        return self._record_script(script, self._driver.execute_async_script(script, *args))
+
+class ReplayElement:
+    """Just enough of a WebElement over a recorded DOM node for the scrapers and waits"""
+
+    def __init__(self, tag):
+        self._tag = tag
+
+    @property
+    def text(self):
+        return '\n'.join(self._tag.stripped_strings)
+
+    @property
+    def tag_name(self):
+        return self._tag.name
+
+    def get_attribute(self, name):
+        value = self._tag.get(name)
+        return ' '.join(value) if isinstance(value, list) else value
+
+    def is_displayed(self):
+        return True
+
+    def click(self):
+        pass
+
+    def send_keys(self, *keys):
+        pass
+
+    def find_elements(self, by='css selector', value=None):
+        return _select(self._tag, by, value)
+
+    def find_element(self, by='css selector', value=None):
+        return _first(self._tag, by, value)
+
+_CSS_FOR = {
+    'id': lambda value: f'[id="{value}"]',
+    'class name': lambda value: f'.{value}',
+    'tag name': lambda value: value,
+    'name': lambda value: f'[name="{value}"]',
+    'css selector': lambda value: value,
+}
+
+def _select(root, by, value):
+    if by == 'link text':
+        return [ReplayElement(a) for a in root.find_all('a') if a.get_text(strip=True) == value]
+    if by not in _CSS_FOR:
+        return []
+    return [ReplayElement(tag) for tag in root.select(_CSS_FOR[by](value))]
+
+def _first(root, by, value):
+    elements = _select(root, by, value)
+    if not elements:
+        from selenium.common.exceptions import NoSuchElementException
+        raise NoSuchElementException(f"No recorded element for {by}={value!r}")
+    return elements[0]
+
+class ReplayDriver:
+    """Stands in for Chrome during replay: serves recorded page sources and script results.
+
+    Anything the recording doesn't have raises WebDriverException rather than
+    coming back empty, so a stale archive fails loudly instead of yielding no staff.
+    """
+
+    replaying = True
+
+    def __init__(self):
+        self.current_url = None
+        self._reads = {}
+        self._soups = {}
+        self._stale = False
+
+    def __getattr__(self, name):
+        # Browser housekeeping (timeouts, window size, cookies...) has nothing to replay
+        return lambda *args, **kwargs: None
+
+    def get(self, url):
+        # Mirrors RecordingDriver: each load is snapshotted straight away
+        self.current_url = url
+        self._reads = {'DOM': 1}
+        self._soups = {}
+        self._stale = False
+
+    def _count(self, key):
+        self._reads[key] = self._reads.get(key, 0) + 1
+        return self._reads[key]
+
+    def _recorded_source(self, count):
+        # A script may read the page more times than the recording did; use the nearest earlier one
+        while count > 1 and f"DOM {self.current_url} {count}" not in archive():
+            count -= 1
+        fixture = archive().get(f"DOM {self.current_url} {count}")
+        if fixture is None:
+            raise _not_recorded(f"No recorded page for {self.current_url}")
+        return count, fixture[1].decode('utf-8')
+
+    @property
+    def page_source(self):
+        self._stale = False
+        return self._recorded_source(self._count('DOM'))[1]
+
+    def _dom(self):
+        # Element lookups see the page as of the latest snapshot
+        if self._stale:
+            self._count('DOM')
+            self._stale = False
+        count, html = self._recorded_source(max(self._reads.get('DOM', 0), 1))
+        if count not in self._soups:
+            from html_parse import make_soup
+            self._soups[count] = make_soup(html)
+        return self._soups[count]
+
+    def find_elements(self, by='css selector', value=None):
+        return _select(self._dom(), by, value)
+
+    def find_element(self, by='css selector', value=None):
+        return _first(self._dom(), by, value)
+
+    def execute_script(self, script, *args):
+        fixture = archive().get(_script_key(self.current_url, script, self._count(script)))
+        if fixture is None:
+            raise _not_recorded(f"No recorded script result on {self.current_url}")
+        self._stale = True
+        if fixture[0].get('live'):
+            raise _not_recorded(f"Script on {self.current_url} returned live elements, which can't be replayed")
+        return json.loads(fixture[0]['value'])
+
+    execute_async_script = execute_script
+
+    def get_log(self, log_type):
+        return []
+
+if __name__ == "__main__":
+    # Usage: python replay.py record|replay <script.py> [args...]   or   python replay.py list
+    if len(sys.argv) >= 2 and sys.argv[1] == 'list':
+        fixtures = archive()
+        kinds = {}
+        for key in fixtures.index:
+            kinds[key.split(' ', 1)[0]] = kinds.get(key.split(' ', 1)[0], 0) + 1
+        print(f"{FIXTURES}: {len(fixtures.index)} entries, {os.path.getsize(FIXTURES) / 1024:.0f} KB")
+        for kind, count in sorted(kinds.items()):
+            print(f"  {kind}: {count}")
+        sys.exit(0)
+
+    if len(sys.argv) < 3 or sys.argv[1] not in ('record', 'replay'):
+        print("Usage: python replay.py record|replay <script.py> [args...]")
+        print("       python replay.py list")
+        sys.exit(1)
+
+    if sys.argv[1] == 'replay' and not os.path.exists(FIXTURES):
+        print(f"No fixture archive at {FIXTURES} - record a run first")
+        sys.exit(1)
+
+    # The script imports this module afresh as 'replay', so hand the mode over via the environment
+    os.environ['SCRAPE_REPLAY'] = sys.argv[1]
+    script = sys.argv[2]
+    sys.argv = sys.argv[2:]
+    runpy.run_path(script, run_name='__main__')
@@ -0,0 +1,154 @@
+import csv
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlparse
+
+import metrics
+from config_scraper import has_config, scrape_config
+from convert_to_excel import state_abbrev
+from network_capture import fetch_staff_from_endpoint
+from scrape_state import scrape_state_staff
+from staff_store import save_staff
+from workbook_writer import WORKBOOK, WorkbookWriter
+
+# Number of states scraped at the same time
+MAX_WORKERS = 8
+
+# Number of states allowed to hit the same host at the same time.
+# Each state crawls its own site sequentially, so keeping this at 1 means
+# a parallel run never hits any single site harder than a normal run.
+PER_HOST_LIMIT = 1
+
+_host_limits = {}
+_host_limits_lock = threading.Lock()
+
+def host_limit(url):
+    """Return the shared semaphore that limits concurrent runs against url's host"""
+    host = urlparse(url).netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+
+    with _host_limits_lock:
+        if host not in _host_limits:
+            _host_limits[host] = threading.Semaphore(PER_HOST_LIMIT)
+        return _host_limits[host]
+
+def load_state_pages(csv_path='state meps.csv', only=None):
+    """Read (state name, abbreviation, staff URL) for every row in the master CSV"""
+    states = []
+
+    with open(csv_path, 'r', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            state_name = (row.get('State') or '').strip()
+            staff_url = (row.get('Staff Page') or '').strip()
+
+            if state_name not in state_abbrev:
+                print(f"Skipping row with unknown state: {state_name!r} ({row.get('Program Name (MEP Center)', '')})")
+                continue
+            if not staff_url:
+                print(f"Skipping {state_name}: no Staff Page URL")
+                continue
+
+            abbrev = state_abbrev[state_name]
+            if only and abbrev not in only:
+                continue
+
+            states.append((state_name, abbrev, staff_url))
+
+    return states
+
+def run_state(state_name, abbrev, staff_url, checkpoint=None):
+    """Scrape one state while holding its host's politeness slot.
+
+    checkpoint (a checkpoint.StateCheckpoint) lets an interrupted run skip profiles it already finished.
+    """
+    slot = host_limit(staff_url)
+    with metrics.span('state', state=abbrev) as info:
+        with metrics.span('host_wait'):
+            slot.acquire()
+        try:
+            # States with a discovered JSON roster feed skip HTML scraping entirely
+            staff_data = fetch_staff_from_endpoint(abbrev)
+            if staff_data:
+                print(f"{state_name}: {len(staff_data)} staff from JSON endpoint")
+                info['source'] = 'endpoint'
+            elif has_config(abbrev):
+                # States with a config in state_configs/ use the config engine
+                staff_data = scrape_config(abbrev)
+                info['source'] = 'config'
+            else:
+                staff_data = scrape_state_staff(state_name, staff_url, checkpoint=checkpoint)
+                info['source'] = 'generic'
+        finally:
+            slot.release()
+
+        metrics.count('records_extracted', len(staff_data or []))
+        return staff_data
+
+def run_all_states(states, max_workers=MAX_WORKERS):
+    """Scrape every state on a bounded worker pool and return {abbrev: staff_data}"""
+    results = {}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(run_state, state_name, abbrev, staff_url): (state_name, abbrev)
+            for state_name, abbrev, staff_url in states
+        }
+
+        for future in as_completed(futures):
+            state_name, abbrev = futures[future]
+            try:
+                results[abbrev] = future.result()
+            except Exception as e:
+                print(f"Error processing {state_name}: {e}")
+                results[abbrev] = []
+
+    return results
+
+def write_results(results, workbook_path=WORKBOOK):
+    """Write every state's results into the workbook with a single load and save"""
+    try:
+        writer = WorkbookWriter(workbook_path)
+        for abbrev, staff_data in results.items():
+            if staff_data:
+                writer.add(abbrev, staff_data)
+
+        updated = writer.flush()
+        print(f"\nSuccessfully updated {len(updated)} tabs in {workbook_path}: {', '.join(updated)}")
+        return True
+
+    except Exception as e:
+        print(f"Error updating Excel: {e}")
+        print("Please close the Excel file and try again.")
+        import traceback
+        traceback.print_exc()
+        return False
+
+if __name__ == "__main__":
+    # Optional list of state abbreviations to limit the run, e.g. AL AK AZ
+    only = {arg.upper() for arg in sys.argv[1:]}
+
+    states = load_state_pages(only=only)
+    print(f"Scraping {len(states)} states with {MAX_WORKERS} workers...")
+
+    start = time.time()
+    results = run_all_states(states)
+    elapsed = time.time() - start
+
+    print(f"\n{'='*60}")
+    print(f"Finished {len(results)} states in {elapsed:.1f}s")
+    print(f"{'='*60}")
+    for abbrev, staff_data in sorted(results.items()):
+        print(f"  {abbrev}: {len(staff_data)} staff")
+
+    if any(results.values()):
+        for abbrev, staff_data in sorted(results.items()):
+            if staff_data:
+                save_staff(abbrev, staff_data)
+        write_results(results)
+    else:
+        print("\nNo data to update")
+
+    metrics.summary()
@@ -1,7 +1,8 @@
-import requests
-from bs4 import BeautifulSoup
+import fetch
+from html_parse import make_soup
 import pandas as pd
-from openpyxl import load_workbook
+from workbook_writer import write_state_tab
+from staff_store import save_staff
 import re
 
 headers = {
@@ -11,10 +12,10 @@ headers = {
 url = "https://www.atn.org/about-atn/team-members/"
 
 print(f"Fetching Alabama staff page...")
-response = requests.get(url, headers=headers)
+response = fetch.get(url, headers=headers)
 response.raise_for_status()
 
-soup = BeautifulSoup(response.content, 'html.parser')
+soup = make_soup(response.content)
 
 # Find all tab-pane divs that contain the full staff details
 tab_panes = soup.find_all('div', class_='tab-pane')
@@ -84,24 +85,11 @@ print(f"\n\nSuccessfully extracted {len(staff_data)} staff members")
 df = pd.DataFrame(staff_data)
 df.to_csv('al_staff_temp.csv', index=False)
 print("Saved to al_staff_temp.csv")
+save_staff('AL', staff_data)
 
 # Update Excel
 print("\nUpdating AL tab in Excel...")
-wb = load_workbook('state_meps.xlsx')
-al_sheet = wb['AL']
-
-start_row = 4
-
-for idx, staff in enumerate(staff_data):
-    current_row = start_row + idx
-    al_sheet[f'A{current_row}'] = staff['Name']
-    al_sheet[f'B{current_row}'] = staff['Title']
-    al_sheet[f'C{current_row}'] = staff['Phone']
-    al_sheet[f'D{current_row}'] = staff['Mobile']
-    al_sheet[f'E{current_row}'] = staff['Email']
-    al_sheet[f'F{current_row}'] = staff['Bio']
-
-wb.save('state_meps.xlsx')
-print(f"Successfully updated AL tab in state_meps.xlsx!")
+if write_state_tab('AL', staff_data):
+    print(f"Successfully updated AL tab in state_meps.xlsx!")
 print(f"\nNote: Phone, Mobile, Email, and Bio are not available on this page.")
 print("The Alabama site uses JavaScript to load detailed profiles dynamically.")
@@ -1,7 +1,8 @@
-import requests
-from bs4 import BeautifulSoup
+import fetch
+from html_parse import make_soup
 import pandas as pd
-from openpyxl import load_workbook
+from workbook_writer import write_state_tab
+from staff_store import save_staff
 import re
 
 headers = {
@@ -11,10 +12,10 @@ headers = {
 url = "https://www.alaska-mep.org/team"
 
 print(f"Fetching Alaska MEP team page...")
-response = requests.get(url, headers=headers)
+response = fetch.get(url, headers=headers)
 response.raise_for_status()
 
-soup = BeautifulSoup(response.content, 'html.parser')
+soup = make_soup(response.content)
 
 # Save for analysis
 with open('alaska_page.html', 'w', encoding='utf-8') as f:
@@ -139,26 +140,13 @@ if staff_data:
     df = pd.DataFrame(staff_data)
     df.to_csv('ak_staff_temp.csv', index=False)
     print("Saved to ak_staff_temp.csv")
+    save_staff('AK', staff_data)
 
     # Update Excel
     print("\nUpdating AK tab in Excel...")
     try:
-        wb = load_workbook('state_meps.xlsx')
-        ak_sheet = wb['AK']
-
-        start_row = 4
-
-        for idx, staff in enumerate(staff_data):
-            current_row = start_row + idx
-            ak_sheet[f'A{current_row}'] = staff['Name']
-            ak_sheet[f'B{current_row}'] = staff['Title']
-            ak_sheet[f'C{current_row}'] = staff['Phone']
-            ak_sheet[f'D{current_row}'] = staff['Mobile']
-            ak_sheet[f'E{current_row}'] = staff['Email']
-            ak_sheet[f'F{current_row}'] = staff['Bio']
-
-        wb.save('state_meps.xlsx')
-        print(f"Successfully updated AK tab with {len(staff_data)} staff members!")
+        if write_state_tab('AK', staff_data):
+            print(f"Successfully updated AK tab with {len(staff_data)} staff members!")
     except Exception as e:
         print(f"Error updating Excel: {e}")
         print("Please close the Excel file and run update separately.")
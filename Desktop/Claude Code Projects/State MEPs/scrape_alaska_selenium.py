@@ -1,52 +1,39 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-import time
 import pandas as pd
-from openpyxl import load_workbook
+from workbook_writer import write_state_tab
+from staff_store import save_staff
 import re
 
-print("Setting up Chrome WebDriver...")
+from driver_pool import get_pool
+from html_parse import make_soup
+from waits import scroll_to_bottom, timeout_for, wait_for_count_stable
+
+TIMEOUT = timeout_for('AK')
 
-chrome_options = Options()
-chrome_options.add_argument('--headless')
-chrome_options.add_argument('--disable-gpu')
-chrome_options.add_argument('--no-sandbox')
-chrome_options.add_argument('--disable-dev-shm-usage')
-chrome_options.add_argument('--window-size=1920,1080')
+print("Setting up Chrome WebDriver...")
 
-try:
-    driver = webdriver.Chrome(options=chrome_options)
-except:
-    print("Headless mode failed, trying with visible browser...")
-    chrome_options = Options()
-    driver = webdriver.Chrome(options=chrome_options)
+# Reuse a browser from the shared pool instead of starting a fresh Chrome
+pool = get_pool(size=1)
+driver = pool.acquire()
 
 url = "https://www.alaska-mep.org/team"
 print(f"Loading page: {url}")
-driver.get(url)
+pool.get(driver, url)
 
-# Wait for page to fully load
-time.sleep(5)
+# Wait until the email links have rendered
+wait_for_count_stable(driver, "a[href^='mailto:']", TIMEOUT)
 
 staff_data = []
 
 # Scroll through page to ensure all content loads
-driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-time.sleep(2)
-driver.execute_script("window.scrollTo(0, 0);")
-time.sleep(1)
+scroll_to_bottom(driver, "a[href^='mailto:']", TIMEOUT)
 
 # Get page source after JavaScript rendering
 html = driver.page_source
-soup_after_js = BeautifulSoup(html, 'html.parser')
+soup_after_js = make_soup(html)
 
 # Find all sections that might contain staff
 # Look for email links
-from bs4 import BeautifulSoup
-
 email_links = driver.find_elements(By.CSS_SELECTOR, "a[href^='mailto:']")
 
 print(f"\nFound {len(email_links)} email links")
@@ -116,7 +103,7 @@ for link in email_links:
         print(f"  Error processing link: {e}")
         continue
 
-driver.quit()
+pool.release(driver)
 
 print(f"\n\nSuccessfully extracted {len(staff_data)} staff members")
 
@@ -124,26 +111,13 @@ if staff_data:
     df = pd.DataFrame(staff_data)
     df.to_csv('ak_staff_temp.csv', index=False)
     print("Saved to ak_staff_temp.csv")
+    save_staff('AK', staff_data)
 
     # Update Excel
     print("\nUpdating AK tab in Excel...")
     try:
-        wb = load_workbook('state_meps.xlsx')
-        ak_sheet = wb['AK']
-
-        start_row = 4
-
-        for idx, staff in enumerate(staff_data):
-            current_row = start_row + idx
-            ak_sheet[f'A{current_row}'] = staff['Name']
-            ak_sheet[f'B{current_row}'] = staff['Title']
-            ak_sheet[f'C{current_row}'] = staff['Phone']
-            ak_sheet[f'D{current_row}'] = staff['Mobile']
-            ak_sheet[f'E{current_row}'] = staff['Email']
-            ak_sheet[f'F{current_row}'] = staff['Bio']
-
-        wb.save('state_meps.xlsx')
-        print(f"Successfully updated AK tab with {len(staff_data)} staff members!")
+        if write_state_tab('AK', staff_data):
+            print(f"Successfully updated AK tab with {len(staff_data)} staff members!")
     except Exception as e:
         print(f"Error updating Excel: {e}")
         print("Please close the Excel file if it's open.")
@@ -1,47 +1,40 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-import time
 import pandas as pd
-from openpyxl import load_workbook
-from bs4 import BeautifulSoup
+from workbook_writer import write_state_tab
+from staff_store import save_staff
+from html_parse import make_soup
 
-print("Setting up Chrome WebDriver for Arizona...")
+from driver_pool import get_pool
+from waits import scroll_to_bottom, timeout_for, wait_for_hidden, wait_for_selector, wait_for_text_change
+
+TIMEOUT = timeout_for('AZ')
 
-chrome_options = Options()
-chrome_options.add_argument('--headless')
-chrome_options.add_argument('--disable-gpu')
-chrome_options.add_argument('--no-sandbox')
-chrome_options.add_argument('--disable-dev-shm-usage')
-chrome_options.add_argument('--window-size=1920,1080')
+# Containers a person's details open in; the waits watch these (broad [class*=...]
+# patterns would match elements that are already on screen)
+DETAIL_SELECTORS = [".modal-content", ".popup-content", ".director-details", ".staff-details"]
+DETAIL_SELECTOR = ", ".join(DETAIL_SELECTORS)
 
-try:
-    driver = webdriver.Chrome(options=chrome_options)
-except:
-    print("Headless mode failed, trying with visible browser...")
-    chrome_options = Options()
-    driver = webdriver.Chrome(options=chrome_options)
+print("Setting up Chrome WebDriver for Arizona...")
+
+# Reuse a browser from the shared pool instead of starting a fresh Chrome
+pool = get_pool(size=1)
+driver = pool.acquire()
 
 url = "https://www.azcommerce.com/programs/arizona-mep/who-we-are/our-expert-staff/"
 print(f"Loading page: {url}")
-driver.get(url)
+pool.get(driver, url)
 
-# Wait for page to fully load
-time.sleep(5)
+# Wait for the staff list to render
+wait_for_selector(driver, ".directorsList", TIMEOUT)
 
 # Scroll to ensure all content loads
-driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-time.sleep(2)
-driver.execute_script("window.scrollTo(0, 0);")
-time.sleep(1)
+scroll_to_bottom(driver, timeout=TIMEOUT)
 
 staff_data = []
 
 # Get page source after JavaScript rendering
 html = driver.page_source
-soup = BeautifulSoup(html, 'html.parser')
+soup = make_soup(html)
 
 # Look for staff members in the directorsList
 directors_list = soup.find('div', class_='directorsList')
@@ -61,6 +54,7 @@ if directors_list:
 
     # If we found clickable elements, click each one to get details
     if staff_elements:
+        previous_details = ""
         for idx, element in enumerate(staff_elements, 1):
             try:
                 # Get the name from the element
@@ -73,19 +67,9 @@ if directors_list:
 
                 # Click the element
                 driver.execute_script("arguments[0].click();", element)
-                time.sleep(2)
-
-                # Look for modal or expanded section with details
-                # Check for common modal/popup patterns
-                modal_selectors = [
-                    ".modal-content",
-                    ".popup-content",
-                    ".director-details",
-                    ".staff-details",
-                    "[class*='modal']",
-                    "[class*='popup']",
-                    "[class*='detail']"
-                ]
+
+                # Wait for the details to show this person rather than the previous one
+                details_text = wait_for_text_change(driver, DETAIL_SELECTOR, previous_details, TIMEOUT)
 
                 title = ""
                 bio = ""
@@ -93,59 +77,66 @@ if directors_list:
                 mobile = ""
                 email = ""
 
-                # Try to find the details in modal/popup
-                for selector in modal_selectors:
-                    try:
-                        detail_element = driver.find_element(By.CSS_SELECTOR, selector)
-                        if detail_element.is_displayed():
-                            detail_html = detail_element.get_attribute('innerHTML')
-                            detail_soup = BeautifulSoup(detail_html, 'html.parser')
-
-                            # Extract title
-                            title_elem = detail_soup.find(['h3', 'h4', 'span'], class_=lambda x: x and ('title' in x.lower() or 'position' in x.lower()))
-                            if title_elem:
-                                title = title_elem.get_text(strip=True)
-
-                            # Extract bio
-                            bio_elem = detail_soup.find(['p', 'div'], class_=lambda x: x and ('bio' in x.lower() or 'description' in x.lower()))
-                            if bio_elem:
-                                bio = bio_elem.get_text(strip=True)
-                            else:
-                                # Get all paragraph text
-                                paragraphs = detail_soup.find_all('p')
-                                if paragraphs:
-                                    bio = ' '.join([p.get_text(strip=True) for p in paragraphs if len(p.get_text(strip=True)) > 50])
-
-                            # Extract email
-                            email_link = detail_soup.find('a', href=lambda x: x and 'mailto:' in x)
-                            if email_link:
-                                email = email_link.get('href', '').replace('mailto:', '').strip()
-
-                            # Extract phone numbers
-                            phone_links = detail_soup.find_all('a', href=lambda x: x and 'tel:' in x)
-                            for phone_link in phone_links:
-                                phone_text = phone_link.get_text(strip=True).lower()
-                                phone_num = phone_link.get('href', '').replace('tel:', '').strip()
-
-                                if 'mobile' in phone_text or 'cell' in phone_text:
-                                    mobile = phone_num
+                if not details_text:
+                    print("  Details never changed after the click - leaving them blank")
+                else:
+                    previous_details = details_text
+
+                    # Try to find the details in modal/popup
+                    for selector in DETAIL_SELECTORS + ["[class*='modal']", "[class*='popup']", "[class*='detail']"]:
+                        try:
+                            detail_element = driver.find_element(By.CSS_SELECTOR, selector)
+                            if detail_element.is_displayed():
+                                detail_html = detail_element.get_attribute('innerHTML')
+                                detail_soup = make_soup(detail_html)
+
+                                # Extract title
+                                title_elem = detail_soup.find(['h3', 'h4', 'span'], class_=lambda x: x and ('title' in x.lower() or 'position' in x.lower()))
+                                if title_elem:
+                                    title = title_elem.get_text(strip=True)
+
+                                # Extract bio
+                                bio_elem = detail_soup.find(['p', 'div'], class_=lambda x: x and ('bio' in x.lower() or 'description' in x.lower()))
+                                if bio_elem:
+                                    bio = bio_elem.get_text(strip=True)
                                 else:
-                                    phone = phone_num
-
-                            break
+                                    # Get all paragraph text
+                                    paragraphs = detail_soup.find_all('p')
+                                    if paragraphs:
+                                        bio = ' '.join([p.get_text(strip=True) for p in paragraphs if len(p.get_text(strip=True)) > 50])
+
+                                # Extract email
+                                email_link = detail_soup.find('a', href=lambda x: x and 'mailto:' in x)
+                                if email_link:
+                                    email = email_link.get('href', '').replace('mailto:', '').strip()
+
+                                # Extract phone numbers
+                                phone_links = detail_soup.find_all('a', href=lambda x: x and 'tel:' in x)
+                                for phone_link in phone_links:
+                                    phone_text = phone_link.get_text(strip=True).lower()
+                                    phone_num = phone_link.get('href', '').replace('tel:', '').strip()
+
+                                    if 'mobile' in phone_text or 'cell' in phone_text:
+                                        mobile = phone_num
+                                    else:
+                                        phone = phone_num
+
+                                break
+                        except:
+                            continue
+
+                    # Close modal if there's a close button
+                    try:
+                        close_buttons = driver.find_elements(By.CSS_SELECTOR, ".close, [class*='close'], .modal-close, [aria-label='Close']")
+                        for btn in close_buttons:
+                            if btn.is_displayed():
+                                btn.click()
+                                break
                     except:
-                        continue
-
-                # Close modal if there's a close button
-                try:
-                    close_buttons = driver.find_elements(By.CSS_SELECTOR, ".close, [class*='close'], .modal-close, [aria-label='Close']")
-                    for btn in close_buttons:
-                        if btn.is_displayed():
-                            btn.click()
-                            time.sleep(0.5)
-                            break
-                except:
-                    pass
+                        pass
+
+                    # Don't click the next person until this one's details are gone
+                    wait_for_hidden(driver, DETAIL_SELECTOR, TIMEOUT)
 
                 # Add staff data
                 staff_data.append({
@@ -181,7 +172,7 @@ if directors_list:
         for email in emails:
             print(f"  - {email}")
 
-driver.quit()
+pool.release(driver)
 
 print(f"\n\nSuccessfully extracted {len(staff_data)} staff members")
 
@@ -189,26 +180,13 @@ if staff_data:
     df = pd.DataFrame(staff_data)
     df.to_csv('az_staff_temp.csv', index=False)
     print("Saved to az_staff_temp.csv")
+    save_staff('AZ', staff_data)
 
     # Update Excel
     print("\nUpdating AZ tab in Excel...")
     try:
-        wb = load_workbook('state_meps.xlsx')
-        az_sheet = wb['AZ']
-
-        start_row = 4
-
-        for idx, staff in enumerate(staff_data):
-            current_row = start_row + idx
-            az_sheet[f'A{current_row}'] = staff['Name']
-            az_sheet[f'B{current_row}'] = staff['Title']
-            az_sheet[f'C{current_row}'] = staff['Phone']
-            az_sheet[f'D{current_row}'] = staff['Mobile']
-            az_sheet[f'E{current_row}'] = staff['Email']
-            az_sheet[f'F{current_row}'] = staff['Bio']
-
-        wb.save('state_meps.xlsx')
-        print(f"Successfully updated AZ tab with {len(staff_data)} staff members!")
+        if write_state_tab('AZ', staff_data):
+            print(f"Successfully updated AZ tab with {len(staff_data)} staff members!")
     except Exception as e:
         print(f"Error updating Excel: {e}")
         print("Please close the Excel file if it's open.")
@@ -1,23 +1,22 @@
-import requests
-from bs4 import BeautifulSoup
+import fetch
+from html_parse import make_soup
 import pandas as pd
+from staff_store import save_staff
 from openpyxl import load_workbook
-import time
 import re
 
+from async_fetch import fetch_all
+
 # Fetch the Arkansas staff page
 url = "https://www.mfgsolutions.org/our-team/"
 headers = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
 }
 
-def extract_profile_details(profile_url):
-    """Extract phone, mobile, email, and bio from individual profile page"""
+def extract_profile_details(content):
+    """Extract phone, mobile, email, and bio from a fetched profile page"""
     try:
-        print(f"  Fetching profile: {profile_url}")
-        response = requests.get(profile_url, headers=headers)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = make_soup(content)
 
         phone = ""
         mobile = ""
@@ -71,24 +70,20 @@ def extract_profile_details(profile_url):
 
         return phone, mobile, email, bio
     except Exception as e:
-        print(f"  Error fetching profile: {e}")
+        print(f"  Error parsing profile: {e}")
         return "", "", "", ""
 
-try:
-    response = requests.get(url, headers=headers)
-    response.raise_for_status()
-
-    soup = BeautifulSoup(response.content, 'html.parser')
-
-    # Find staff members based on the actual HTML structure
-    staff_data = []
-
+def extract_team_list(soup):
+    """Return [(name, title, profile_url)] from the team containers on the roster page"""
     # Look for team containers with class "team-container"
     team_containers = soup.find_all('div', class_='team-container')
 
     print(f"Found {len(team_containers)} team containers\n")
 
-    for idx, container in enumerate(team_containers, 1):
+    # Collect names, titles and profile links first; the caller fetches all profiles at once
+    people = []
+
+    for container in team_containers:
         # Find the name within team-author-name div
         name_div = container.find('div', class_='team-author-name')
         if name_div:
@@ -103,39 +98,61 @@ try:
                 title = title_p.get_text(strip=True) if title_p else ""
 
                 if name and profile_url:
-                    print(f"[{idx}/{len(team_containers)}] Processing: {name}")
-
-                    # Fetch detailed information from profile page
-                    phone, mobile, email, bio = extract_profile_details(profile_url)
-
-                    staff_data.append({
-                        'Name': name,
-                        'Title': title,
-                        'Phone': phone,
-                        'Mobile': mobile,
-                        'Email': email,
-                        'Bio': bio
-                    })
-                    print(f"  Complete\n")
-
-                    # Be polite - don't hammer the server
-                    time.sleep(1)
-
-    if staff_data:
-        print(f"\n\nSuccessfully extracted {len(staff_data)} staff members")
-
-        # Save to a temporary CSV for inspection
-        df = pd.DataFrame(staff_data)
-        df.to_csv('arkansas_staff_temp.csv', index=False)
-        print("Saved to arkansas_staff_temp.csv")
-    else:
-        print("\n\nNo staff data extracted. Manual inspection may be needed.")
-        print("Saving HTML content for analysis...")
-        with open('arkansas_page.html', 'w', encoding='utf-8') as f:
-            f.write(soup.prettify())
-        print("Saved page HTML to arkansas_page.html")
-
-except Exception as e:
-    print(f"Error: {e}")
-    import traceback
-    traceback.print_exc()
+                    people.append((name, title, profile_url))
+
+    return people
+
+if __name__ == "__main__":
+    try:
+        response = fetch.get(url, headers=headers)
+        response.raise_for_status()
+
+        soup = make_soup(response.content)
+
+        # Find staff members based on the actual HTML structure
+        staff_data = []
+
+        people = extract_team_list(soup)
+
+        # Fetch every profile page concurrently (rate-limited per domain)
+        profile_pages = fetch_all([profile_url for _, _, profile_url in people], headers)
+
+        for idx, (name, title, profile_url) in enumerate(people, 1):
+            print(f"[{idx}/{len(people)}] Processing: {name}")
+
+            # Extract detailed information from profile page
+            content = profile_pages.get(profile_url)
+            if content is not None:
+                phone, mobile, email, bio = extract_profile_details(content)
+            else:
+                phone, mobile, email, bio = "", "", "", ""
+
+            staff_data.append({
+                'Name': name,
+                'Title': title,
+                'Phone': phone,
+                'Mobile': mobile,
+                'Email': email,
+                'Bio': bio
+            })
+            print(f"  Complete\n")
+
+        if staff_data:
+            print(f"\n\nSuccessfully extracted {len(staff_data)} staff members")
+
+            # Save to a temporary CSV for inspection
+            df = pd.DataFrame(staff_data)
+            df.to_csv('arkansas_staff_temp.csv', index=False)
+            print("Saved to arkansas_staff_temp.csv")
+            save_staff('AR', staff_data)
+        else:
+            print("\n\nNo staff data extracted. Manual inspection may be needed.")
+            print("Saving HTML content for analysis...")
+            with open('arkansas_page.html', 'w', encoding='utf-8') as f:
+                f.write(soup.prettify())
+            print("Saved page HTML to arkansas_page.html")
+
+    except Exception as e:
+        print(f"Error: {e}")
+        import traceback
+        traceback.print_exc()
@@ -1,7 +1,8 @@
-import requests
-from bs4 import BeautifulSoup
+import fetch
+from html_parse import make_state_soup
 import pandas as pd
-from openpyxl import load_workbook
+from workbook_writer import write_state_tab
+from staff_store import save_staff
 import re
 
 headers = {
@@ -11,10 +12,11 @@ headers = {
 url = "https://www.cmtc.com/cmtc-leadership-team"
 
 print(f"Fetching California MEP leadership page...")
-response = requests.get(url, headers=headers)
+response = fetch.get(url, headers=headers)
 response.raise_for_status()
 
-soup = BeautifulSoup(response.content, 'html.parser')
+# Only the staff regions are parsed (see STATE_REGIONS in html_parse.py)
+soup = make_state_soup('CA', response.content)
 
 staff_data = []
 
@@ -88,26 +90,13 @@ if staff_data:
     df = pd.DataFrame(staff_data)
     df.to_csv('ca_staff_temp.csv', index=False)
     print("Saved to ca_staff_temp.csv")
+    save_staff('CA', staff_data)
 
     # Update Excel
     print("\nUpdating CA tab in Excel...")
     try:
-        wb = load_workbook('state_meps.xlsx')
-        ca_sheet = wb['CA']
-
-        start_row = 4
-
-        for idx, staff in enumerate(staff_data):
-            current_row = start_row + idx
-            ca_sheet[f'A{current_row}'] = staff['Name']
-            ca_sheet[f'B{current_row}'] = staff['Title']
-            ca_sheet[f'C{current_row}'] = staff['Phone']
-            ca_sheet[f'D{current_row}'] = staff['Mobile']
-            ca_sheet[f'E{current_row}'] = staff['Email']
-            ca_sheet[f'F{current_row}'] = staff['Bio']
-
-        wb.save('state_meps.xlsx')
-        print(f"Successfully updated CA tab with {len(staff_data)} staff members!")
+        if write_state_tab('CA', staff_data):
+            print(f"Successfully updated CA tab with {len(staff_data)} staff members!")
     except Exception as e:
         print(f"Error updating Excel: {e}")
         print("Please close the Excel file and try again.")
@@ -1,41 +1,107 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-import time
 import pandas as pd
-from openpyxl import load_workbook
-from bs4 import BeautifulSoup
+from workbook_writer import write_state_tab
+from staff_store import save_staff
+from html_parse import make_soup
+
+from bulk_extract import extract_modal_html
+from driver_pool import get_pool
+from waits import timeout_for, wait_for_any_visible, wait_for_hidden, wait_for_network_idle
+
+TIMEOUT = timeout_for('CO')
+
+# Collect every modal with one execute_script call instead of clicking per person
+BULK_MODE = True
+
+# Modal/popup containers that may hold a team member's details
+MODAL_SELECTORS = [
+    ".modal-content",
+    ".popup-content",
+    "[role='dialog']",
+    ".modal",
+    ".popup",
+    ".fancybox-content",
+    ".mfp-content"
+]
 
-print("Setting up Chrome WebDriver for Colorado...")
+CLOSE_SELECTOR = ".close, [aria-label='Close'], .modal-close, .mfp-close"
+
+def parse_modal(modal_soup):
+    """Extract name, title and bio from a team member modal"""
+    # Extract name
+    name = ""
+    name_tags = modal_soup.find_all(['h1', 'h2', 'h3', 'h4'])
+    for tag in name_tags:
+        text = tag.get_text(strip=True)
+        if text and len(text) < 100 and len(text) > 3:
+            name = text
+            break
 
-chrome_options = Options()
-chrome_options.add_argument('--headless')
-chrome_options.add_argument('--disable-gpu')
-chrome_options.add_argument('--no-sandbox')
-chrome_options.add_argument('--disable-dev-shm-usage')
-chrome_options.add_argument('--window-size=1920,1080')
+    if not name:
+        return None
 
-try:
-    driver = webdriver.Chrome(options=chrome_options)
-except:
-    print("Headless mode failed, trying with visible browser...")
-    chrome_options = Options()
-    driver = webdriver.Chrome(options=chrome_options)
+    # Extract title
+    title = ""
+    # Look for title patterns
+    title_patterns = [
+        modal_soup.find(class_=lambda x: x and 'title' in x.lower()),
+        modal_soup.find(class_=lambda x: x and 'position' in x.lower()),
+        modal_soup.find('p', class_=lambda x: x and 'job' in str(x).lower())
+    ]
+
+    for pattern in title_patterns:
+        if pattern:
+            title = pattern.get_text(strip=True)
+            break
+
+    # If no title found with class, look for text after name
+    if not title:
+        # Find all text and look for patterns
+        all_text = modal_soup.get_text()
+        lines = [l.strip() for l in all_text.split('\n') if l.strip()]
+        # Title is usually right after name
+        for i, line in enumerate(lines):
+            if name in line and i + 1 < len(lines):
+                potential_title = lines[i + 1]
+                if len(potential_title) < 100:
+                    title = potential_title
+                    break
+
+    # Extract bio
+    bio_parts = []
+    for p in modal_soup.find_all('p'):
+        text = p.get_text(strip=True)
+        # Skip if it's the name or title
+        if text and text != name and text != title and len(text) > 50:
+            bio_parts.append(text)
+
+    return {
+        'Name': name,
+        'Title': title,
+        'Phone': '',
+        'Mobile': '',
+        'Email': '',
+        'Bio': ' '.join(bio_parts)
+    }
+
+print("Setting up Chrome WebDriver for Colorado...")
+
+# Reuse a browser from the shared pool instead of starting a fresh Chrome
+pool = get_pool(size=1)
+driver = pool.acquire()
 
 url = "https://manufacturersedge.com/about/#team"
 print(f"Loading page: {url}")
-driver.get(url)
+pool.get(driver, url)
 
 # Wait for page to fully load
-time.sleep(5)
+wait_for_network_idle(driver, TIMEOUT)
 
 # Scroll to team section
 try:
     team_section = driver.find_element(By.ID, "team")
     driver.execute_script("arguments[0].scrollIntoView();", team_section)
-    time.sleep(2)
+    wait_for_network_idle(driver, TIMEOUT)
 except:
     print("Could not find team section, continuing anyway...")
 
@@ -69,7 +135,7 @@ if not team_elements:
     print("Trying to find clickable profile elements...")
 
     # Get page source and analyze
-    soup = BeautifulSoup(driver.page_source, 'html.parser')
+    soup = make_soup(driver.page_source)
 
     # Look for profile images or cards that might be clickable
     profile_selectors = [
@@ -107,145 +173,93 @@ if not team_elements:
 
 print(f"\nFound {len(team_elements)} team member elements to process")
 
-# Process each team member
-for idx, element in enumerate(team_elements, 1):
-    try:
-        print(f"\n{idx}. Processing team member...")
-
-        # Try to get name from element first
+# Bulk mode: open every modal inside the page and collect them all in one round-trip
+if BULK_MODE and team_elements:
+    print("Extracting all modals in a single JavaScript call...")
+    for modal_soup in extract_modal_html(driver, team_elements, MODAL_SELECTORS,
+                                         close_selector=CLOSE_SELECTOR, item_timeout=TIMEOUT):
+        record = parse_modal(modal_soup)
+        if record:
+            staff_data.append(record)
+            print(f"   Found: {record['Name']}")
+    print(f"Bulk mode extracted {len(staff_data)} staff members")
+
+# Fall back to clicking each team member in turn
+if not staff_data:
+    for idx, element in enumerate(team_elements, 1):
         try:
-            name_text = element.text.strip()
-            if name_text and len(name_text) < 100:
-                print(f"   Element text: {name_text[:50]}")
-        except:
-            name_text = ""
+            print(f"\n{idx}. Processing team member...")
 
-        # Click the element
-        try:
-            driver.execute_script("arguments[0].click();", element)
-            time.sleep(2)
-        except:
-            # Try regular click
+            # Try to get name from element first
             try:
-                element.click()
-                time.sleep(2)
+                name_text = element.text.strip()
+                if name_text and len(name_text) < 100:
+                    print(f"   Element text: {name_text[:50]}")
             except:
-                print(f"   Could not click element {idx}")
-                continue
+                name_text = ""
 
-        # Look for modal/popup with details
-        modal_found = False
-        modal_selectors = [
-            ".modal-content",
-            ".popup-content",
-            "[role='dialog']",
-            ".modal",
-            ".popup",
-            ".fancybox-content",
-            ".mfp-content"
-        ]
-
-        for modal_selector in modal_selectors:
+            # Click the element
             try:
-                modal = WebDriverWait(driver, 3).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, modal_selector))
-                )
-
-                if modal.is_displayed():
-                    modal_html = modal.get_attribute('innerHTML')
-                    modal_soup = BeautifulSoup(modal_html, 'html.parser')
-
-                    # Extract name
-                    name = ""
-                    name_tags = modal_soup.find_all(['h1', 'h2', 'h3', 'h4'])
-                    for tag in name_tags:
-                        text = tag.get_text(strip=True)
-                        if text and len(text) < 100 and len(text) > 3:
-                            name = text
-                            break
-
-                    # Extract title
-                    title = ""
-                    # Look for title patterns
-                    title_patterns = [
-                        modal_soup.find(class_=lambda x: x and 'title' in x.lower()),
-                        modal_soup.find(class_=lambda x: x and 'position' in x.lower()),
-                        modal_soup.find('p', class_=lambda x: x and 'job' in str(x).lower())
-                    ]
-
-                    for pattern in title_patterns:
-                        if pattern:
-                            title = pattern.get_text(strip=True)
-                            break
-
-                    # If no title found with class, look for text after name
-                    if not title and name:
-                        # Find all text and look for patterns
-                        all_text = modal_soup.get_text()
-                        lines = [l.strip() for l in all_text.split('\n') if l.strip()]
-                        # Title is usually right after name
-                        for i, line in enumerate(lines):
-                            if name in line and i + 1 < len(lines):
-                                potential_title = lines[i + 1]
-                                if len(potential_title) < 100:
-                                    title = potential_title
+                driver.execute_script("arguments[0].click();", element)
+            except:
+                # Try regular click
+                try:
+                    element.click()
+                except:
+                    print(f"   Could not click element {idx}")
+                    continue
+
+            # Look for modal/popup with details
+            modal_found = False
+
+            # Return as soon as any modal is showing instead of sleeping
+            wait_for_any_visible(driver, MODAL_SELECTORS, TIMEOUT)
+
+            for modal_selector in MODAL_SELECTORS:
+                try:
+                    modal = driver.find_element(By.CSS_SELECTOR, modal_selector)
+
+                    if modal.is_displayed():
+                        modal_html = modal.get_attribute('innerHTML')
+                        record = parse_modal(make_soup(modal_html))
+
+                        if record:
+                            staff_data.append(record)
+
+                            print(f"   Found: {record['Name']}")
+                            print(f"   Title: {record['Title']}")
+                            bio = record['Bio']
+                            print(f"   Bio: {bio[:80]}..." if len(bio) > 80 else f"   Bio: {bio}")
+
+                            modal_found = True
+
+                        # Close modal
+                        try:
+                            close_buttons = driver.find_elements(By.CSS_SELECTOR, CLOSE_SELECTOR)
+                            for btn in close_buttons:
+                                if btn.is_displayed():
+                                    btn.click()
                                     break
+                        except:
+                            # Try pressing ESC key
+                            from selenium.webdriver.common.keys import Keys
+                            driver.find_element(By.TAG_NAME, 'body').send_keys(Keys.ESCAPE)
 
-                    # Extract bio
-                    bio = ""
-                    bio_paragraphs = modal_soup.find_all('p')
-                    bio_parts = []
-                    for p in bio_paragraphs:
-                        text = p.get_text(strip=True)
-                        # Skip if it's the name or title
-                        if text and text != name and text != title and len(text) > 50:
-                            bio_parts.append(text)
-
-                    bio = ' '.join(bio_parts)
-
-                    if name:
-                        staff_data.append({
-                            'Name': name,
-                            'Title': title,
-                            'Phone': '',
-                            'Mobile': '',
-                            'Email': '',
-                            'Bio': bio
-                        })
-
-                        print(f"   Found: {name}")
-                        print(f"   Title: {title}")
-                        print(f"   Bio: {bio[:80]}..." if len(bio) > 80 else f"   Bio: {bio}")
-
-                        modal_found = True
-
-                    # Close modal
-                    try:
-                        close_buttons = driver.find_elements(By.CSS_SELECTOR, ".close, [aria-label='Close'], .modal-close, .mfp-close")
-                        for btn in close_buttons:
-                            if btn.is_displayed():
-                                btn.click()
-                                time.sleep(1)
-                                break
-                    except:
-                        # Try pressing ESC key
-                        from selenium.webdriver.common.keys import Keys
-                        driver.find_element(By.TAG_NAME, 'body').send_keys(Keys.ESCAPE)
-                        time.sleep(1)
+                        wait_for_hidden(driver, modal_selector, TIMEOUT)
 
-                    break
+                        break
 
-            except Exception as e:
-                continue
+                except Exception as e:
+                    continue
 
-        if not modal_found:
-            print(f"   No modal found for element {idx}")
+            if not modal_found:
+                print(f"   No modal found for element {idx}")
 
-    except Exception as e:
-        print(f"   Error processing element {idx}: {e}")
-        continue
+        except Exception as e:
+            print(f"   Error processing element {idx}: {e}")
+            continue
 
-driver.quit()
+pool.release(driver)
 
 print(f"\n\nSuccessfully extracted {len(staff_data)} staff members")
 
@@ -253,26 +267,13 @@ if staff_data:
     df = pd.DataFrame(staff_data)
     df.to_csv('co_staff_temp.csv', index=False)
     print("Saved to co_staff_temp.csv")
+    save_staff('CO', staff_data)
 
     # Update Excel
     print("\nUpdating CO tab in Excel...")
     try:
-        wb = load_workbook('state_meps.xlsx')
-        co_sheet = wb['CO']
-
-        start_row = 4
-
-        for idx, staff in enumerate(staff_data):
-            current_row = start_row + idx
-            co_sheet[f'A{current_row}'] = staff['Name']
-            co_sheet[f'B{current_row}'] = staff['Title']
-            co_sheet[f'C{current_row}'] = staff['Phone']
-            co_sheet[f'D{current_row}'] = staff['Mobile']
-            co_sheet[f'E{current_row}'] = staff['Email']
-            co_sheet[f'F{current_row}'] = staff['Bio']
-
-        wb.save('state_meps.xlsx')
-        print(f"Successfully updated CO tab with {len(staff_data)} staff members!")
+        if write_state_tab('CO', staff_data):
+            print(f"Successfully updated CO tab with {len(staff_data)} staff members!")
     except Exception as e:
         print(f"Error updating Excel: {e}")
         print("Please close the Excel file if it's open.")
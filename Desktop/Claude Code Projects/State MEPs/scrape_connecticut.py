@@ -1,43 +1,66 @@
-import requests
-from bs4 import BeautifulSoup
+import fetch
+from html_parse import make_soup
 import pandas as pd
-from openpyxl import load_workbook
+from workbook_writer import write_state_tab
+from staff_store import save_staff
 import re
-import time
+
+from async_fetch import fetch_all
+from wp_discovery import discover_roster, remember_records, unchanged_records
 
 headers = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
 }
 
-# First, get the team page to find all staff profile URLs
 team_url = "https://www.connstep.org/our-team/"
 
-print(f"Fetching Connecticut MEP team page...")
-response = requests.get(team_url, headers=headers)
-response.raise_for_status()
+# The REST API / sitemap lists every profile with its modification date
+roster = discover_roster('https://www.connstep.org', '/staff/')
+
+if roster:
+    staff_urls = [url for url, _ in roster]
+else:
+    # Otherwise get the team page to find all staff profile URLs
+    print(f"Fetching Connecticut MEP team page...")
+    response = fetch.get(team_url, headers=headers)
+    response.raise_for_status()
+
+    soup = make_soup(response.content)
 
-soup = BeautifulSoup(response.content, 'html.parser')
+    # Find all staff profile links
+    staff_links = soup.find_all('a', href=re.compile(r'/staff/'))
 
-# Find all staff profile links
-staff_links = soup.find_all('a', href=re.compile(r'/staff/'))
+    # Get unique URLs
+    staff_urls = list(set([link.get('href') for link in staff_links if link.get('href')]))
+    roster = [(url, '') for url in staff_urls]
 
-# Get unique URLs
-staff_urls = list(set([link.get('href') for link in staff_links if link.get('href')]))
+# Profiles not modified since the last run keep their saved records
+unchanged = unchanged_records(roster)
 
-print(f"\nFound {len(staff_urls)} staff members")
-print(f"\nVisiting each profile page to extract details...\n")
+print(f"\nFound {len(staff_urls)} staff members ({len(unchanged)} unchanged)")
+print(f"\nFetching changed profile pages to extract details...\n")
+
+# Fetch every changed profile page concurrently (rate-limited per domain)
+profile_pages = fetch_all([url for url in staff_urls if url not in unchanged], headers)
 
 staff_data = []
+parsed = {}  # url -> record, for profiles parsed this run
 
 for idx, profile_url in enumerate(staff_urls, 1):
     try:
-        print(f"{idx}. Fetching: {profile_url}")
+        if profile_url in unchanged:
+            print(f"{idx}. Unchanged: {profile_url}")
+            staff_data.append(unchanged[profile_url])
+            continue
+
+        print(f"{idx}. Parsing: {profile_url}")
 
-        # Fetch the profile page
-        profile_response = requests.get(profile_url, headers=headers)
-        profile_response.raise_for_status()
+        content = profile_pages.get(profile_url)
+        if content is None:
+            print()
+            continue
 
-        profile_soup = BeautifulSoup(profile_response.content, 'html.parser')
+        profile_soup = make_soup(content)
 
         # Extract name from page title
         name = ""
@@ -82,14 +105,16 @@ for idx, profile_url in enumerate(staff_urls, 1):
 
             bio = ' '.join(bio_parts)
 
-        staff_data.append({
+        record = {
             'Name': name,
             'Title': title,
             'Phone': phone,
             'Mobile': mobile,
             'Email': email,
             'Bio': bio
-        })
+        }
+        staff_data.append(record)
+        parsed[profile_url] = record
 
         print(f"   Name: {name}")
         print(f"   Title: {title}")
@@ -98,41 +123,26 @@ for idx, profile_url in enumerate(staff_urls, 1):
         print(f"   Bio: {len(bio)} characters")
         print()
 
-        # Small delay to be respectful to the server
-        time.sleep(0.5)
-
     except Exception as e:
         print(f"   Error processing {profile_url}: {e}")
         print()
         continue
 
 print(f"\nSuccessfully extracted {len(staff_data)} staff members")
+remember_records(roster, parsed)
 
 if staff_data:
     # Save to CSV
     df = pd.DataFrame(staff_data)
     df.to_csv('ct_staff_temp.csv', index=False)
     print("Saved to ct_staff_temp.csv")
+    save_staff('CT', staff_data)
 
     # Update Excel
     print("\nUpdating CT tab in Excel...")
     try:
-        wb = load_workbook('state_meps.xlsx')
-        ct_sheet = wb['CT']
-
-        start_row = 4
-
-        for idx, staff in enumerate(staff_data):
-            current_row = start_row + idx
-            ct_sheet[f'A{current_row}'] = staff['Name']
-            ct_sheet[f'B{current_row}'] = staff['Title']
-            ct_sheet[f'C{current_row}'] = staff['Phone']
-            ct_sheet[f'D{current_row}'] = staff['Mobile']
-            ct_sheet[f'E{current_row}'] = staff['Email']
-            ct_sheet[f'F{current_row}'] = staff['Bio']
-
-        wb.save('state_meps.xlsx')
-        print(f"Successfully updated CT tab with {len(staff_data)} staff members!")
+        if write_state_tab('CT', staff_data):
+            print(f"Successfully updated CT tab with {len(staff_data)} staff members!")
     except Exception as e:
         print(f"Error updating Excel: {e}")
         print("Please close the Excel file and try again.")
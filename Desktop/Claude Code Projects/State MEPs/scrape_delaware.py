@@ -1,20 +1,20 @@
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-import time
 import pandas as pd
-from openpyxl import load_workbook
-from bs4 import BeautifulSoup
+from workbook_writer import write_state_tab
+from staff_store import save_staff
+from html_parse import make_soup
+from dedup import merge_records
 import re
 
-print("Setting up Chrome WebDriver for Delaware...")
+from driver_pool import get_pool
+from waits import timeout_for, wait_for_network_idle
+
+TIMEOUT = timeout_for('DE')
 
-chrome_options = Options()
-chrome_options.add_argument('--headless')
-chrome_options.add_argument('--disable-gpu')
-chrome_options.add_argument('--no-sandbox')
+print("Setting up Chrome WebDriver for Delaware...")
 
-driver = webdriver.Chrome(options=chrome_options)
+# Reuse a browser from the shared pool instead of starting a fresh Chrome
+pool = get_pool(size=1)
+driver = pool.acquire()
 
 # Try different pages
 pages_to_check = [
@@ -27,11 +27,11 @@ staff_data = []
 
 for url, page_name in pages_to_check:
     print(f"\nChecking {page_name} page: {url}")
-    driver.get(url)
-    time.sleep(5)
+    pool.get(driver, url)
+    wait_for_network_idle(driver, TIMEOUT)
 
     html = driver.page_source
-    soup = BeautifulSoup(html, 'html.parser')
+    soup = make_soup(html)
 
     # Look for staff information patterns
     # Check for email addresses with names
@@ -124,29 +124,21 @@ for url, page_name in pages_to_check:
                         break
 
             if name and email:
-                # Check if not already added
-                if not any(s['Email'] == email for s in staff_data):
-                    staff_data.append({
-                        'Name': name,
-                        'Title': title,
-                        'Phone': '',
-                        'Mobile': '',
-                        'Email': email,
-                        'Bio': ''
-                    })
-                    print(f"    Found in text: {name} - {email}")
-
-driver.quit()
-
-# Remove duplicates based on email
-unique_staff = []
-seen_emails = set()
-for staff in staff_data:
-    if staff['Email'] not in seen_emails:
-        seen_emails.add(staff['Email'])
-        unique_staff.append(staff)
-
-staff_data = unique_staff
+                # Duplicates are merged once at the end
+                staff_data.append({
+                    'Name': name,
+                    'Title': title,
+                    'Phone': '',
+                    'Mobile': '',
+                    'Email': email,
+                    'Bio': ''
+                })
+                print(f"    Found in text: {name} - {email}")
+
+pool.release(driver)
+
+# Remove duplicates (same email, or same person by name within the state)
+staff_data = merge_records(staff_data, 'DE')
 
 print(f"\n\nSuccessfully extracted {len(staff_data)} unique staff members")
 
@@ -158,26 +150,13 @@ if staff_data:
     df = pd.DataFrame(staff_data)
     df.to_csv('de_staff_temp.csv', index=False)
     print("\nSaved to de_staff_temp.csv")
+    save_staff('DE', staff_data)
 
     # Update Excel
     print("\nUpdating DE tab in Excel...")
     try:
-        wb = load_workbook('state_meps.xlsx')
-        de_sheet = wb['DE']
-
-        start_row = 4
-
-        for idx, staff in enumerate(staff_data):
-            current_row = start_row + idx
-            de_sheet[f'A{current_row}'] = staff['Name']
-            de_sheet[f'B{current_row}'] = staff['Title']
-            de_sheet[f'C{current_row}'] = staff['Phone']
-            de_sheet[f'D{current_row}'] = staff['Mobile']
-            de_sheet[f'E{current_row}'] = staff['Email']
-            de_sheet[f'F{current_row}'] = staff['Bio']
-
-        wb.save('state_meps.xlsx')
-        print(f"Successfully updated DE tab with {len(staff_data)} staff members!")
+        if write_state_tab('DE', staff_data):
+            print(f"Successfully updated DE tab with {len(staff_data)} staff members!")
     except Exception as e:
         print(f"Error updating Excel: {e}")
         print("Please close the Excel file if it's open.")
@@ -187,9 +166,6 @@ else:
 
     # Create a note entry
     try:
-        wb = load_workbook('state_meps.xlsx')
-        de_sheet = wb['DE']
-        de_sheet['A4'] = 'No staff information publicly available'
-        wb.save('state_meps.xlsx')
+        write_state_tab('DE', [{'Name': 'No staff information publicly available'}])
     except Exception as e:
         print(f"Error updating Excel: {e}")
@@ -1,7 +1,8 @@
-import requests
-from bs4 import BeautifulSoup
+import fetch
+from html_parse import make_soup
 import pandas as pd
-from openpyxl import load_workbook
+from workbook_writer import write_state_tab
+from staff_store import save_staff
 import re
 
 headers = {
@@ -11,10 +12,10 @@ headers = {
 url = "https://www.demep.org/contact-us/"
 
 print(f"Fetching Delaware MEP contact page...")
-response = requests.get(url, headers=headers)
+response = fetch.get(url, headers=headers)
 response.raise_for_status()
 
-soup = BeautifulSoup(response.content, 'html.parser')
+soup = make_soup(response.content)
 
 # Get the main content
 content = soup.find('div', class_='entry-content')
@@ -105,31 +106,14 @@ if staff_data:
     df = pd.DataFrame(staff_data)
     df.to_csv('de_staff_temp.csv', index=False)
     print("Saved to de_staff_temp.csv")
+    save_staff('DE', staff_data)
 
     # Update Excel
     print("\nUpdating DE tab in Excel...")
     try:
-        wb = load_workbook('state_meps.xlsx')
-        de_sheet = wb['DE']
-
-        # Clear existing data first
-        for row_num in range(4, 20):
-            for col in ['A', 'B', 'C', 'D', 'E', 'F']:
-                de_sheet[f'{col}{row_num}'] = None
-
-        start_row = 4
-
-        for idx, staff in enumerate(staff_data):
-            current_row = start_row + idx
-            de_sheet[f'A{current_row}'] = staff['Name']
-            de_sheet[f'B{current_row}'] = staff['Title']
-            de_sheet[f'C{current_row}'] = staff['Phone']
-            de_sheet[f'D{current_row}'] = staff['Mobile']
-            de_sheet[f'E{current_row}'] = staff['Email']
-            de_sheet[f'F{current_row}'] = staff['Bio']
-
-        wb.save('state_meps.xlsx')
-        print(f"Successfully updated DE tab with {len(staff_data)} staff members!")
+        # Rows left over from a longer roster are cleared by the writer
+        if write_state_tab('DE', staff_data):
+            print(f"Successfully updated DE tab with {len(staff_data)} staff members!")
     except Exception as e:
         print(f"Error updating Excel: {e}")
         print("Please close the Excel file and try again.")
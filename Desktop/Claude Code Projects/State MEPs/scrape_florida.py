@@ -1,7 +1,8 @@
-import requests
-from bs4 import BeautifulSoup
+import fetch
+from html_parse import make_state_soup
 import pandas as pd
-from openpyxl import load_workbook
+from workbook_writer import write_state_tab
+from staff_store import save_staff
 import re
 
 headers = {
@@ -11,10 +12,11 @@ headers = {
 url = "https://www.floridamakes.com/about-us/our-team/staff"
 
 print(f"Fetching Florida MEP staff page...")
-response = requests.get(url, headers=headers)
+response = fetch.get(url, headers=headers)
 response.raise_for_status()
 
-soup = BeautifulSoup(response.content, 'html.parser')
+# Only the staff regions are parsed (see STATE_REGIONS in html_parse.py)
+soup = make_state_soup('FL', response.content)
 
 staff_data = []
 
@@ -87,26 +89,13 @@ if staff_data:
     df = pd.DataFrame(staff_data)
     df.to_csv('fl_staff_temp.csv', index=False)
     print("Saved to fl_staff_temp.csv")
+    save_staff('FL', staff_data)
 
     # Update Excel
     print("\nUpdating FL tab in Excel...")
     try:
-        wb = load_workbook('state_meps.xlsx')
-        fl_sheet = wb['FL']
-
-        start_row = 4
-
-        for idx, staff in enumerate(staff_data):
-            current_row = start_row + idx
-            fl_sheet[f'A{current_row}'] = staff['Name']
-            fl_sheet[f'B{current_row}'] = staff['Title']
-            fl_sheet[f'C{current_row}'] = staff['Phone']
-            fl_sheet[f'D{current_row}'] = staff['Mobile']
-            fl_sheet[f'E{current_row}'] = staff['Email']
-            fl_sheet[f'F{current_row}'] = staff['Bio']
-
-        wb.save('state_meps.xlsx')
-        print(f"Successfully updated FL tab with {len(staff_data)} staff members!")
+        if write_state_tab('FL', staff_data):
+            print(f"Successfully updated FL tab with {len(staff_data)} staff members!")
     except Exception as e:
         print(f"Error updating Excel: {e}")
         print("Please close the Excel file and try again.")
@@ -1,41 +1,37 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from bs4 import BeautifulSoup
+from html_parse import make_soup
 import pandas as pd
-from openpyxl import load_workbook
-import time
+from workbook_writer import write_state_tab
+from staff_store import save_staff
 import re
 
-# Setup headless Chrome
-chrome_options = Options()
-chrome_options.add_argument('--headless')
-chrome_options.add_argument('--disable-gpu')
-chrome_options.add_argument('--no-sandbox')
-chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
+from driver_pool import get_pool
+from waits import scroll_to_bottom, timeout_for, wait_for_network_idle
+
+TIMEOUT = timeout_for('GA')
 
 url = "https://gamep.org/meet-the-gamep-team/"
 
 print(f"Fetching Georgia MEP team page with Selenium...")
-driver = webdriver.Chrome(options=chrome_options)
-driver.get(url)
+# Reuse a browser from the shared pool instead of starting a fresh Chrome
+pool = get_pool(size=1)
+driver = pool.acquire()
+pool.get(driver, url)
 
 # Wait for page to load
-time.sleep(5)
+wait_for_network_idle(driver, TIMEOUT)
 
 # Scroll to load all content
-driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-time.sleep(2)
+scroll_to_bottom(driver, timeout=TIMEOUT)
 
 html = driver.page_source
-driver.quit()
+pool.release(driver)
 
 # Save HTML for inspection
 with open('georgia_rendered.html', 'w', encoding='utf-8') as f:
     f.write(html)
 print("Saved rendered HTML to georgia_rendered.html")
 
-soup = BeautifulSoup(html, 'html.parser')
+soup = make_soup(html)
 
 staff_data = []
 
@@ -107,26 +103,13 @@ if staff_data:
     df = pd.DataFrame(staff_data)
     df.to_csv('ga_staff_temp.csv', index=False)
     print("Saved to ga_staff_temp.csv")
+    save_staff('GA', staff_data)
 
     # Update Excel
     print("\nUpdating GA tab in Excel...")
     try:
-        wb = load_workbook('state_meps.xlsx')
-        ga_sheet = wb['GA']
-
-        start_row = 4
-
-        for idx, staff in enumerate(staff_data):
-            current_row = start_row + idx
-            ga_sheet[f'A{current_row}'] = staff['Name']
-            ga_sheet[f'B{current_row}'] = staff['Title']
-            ga_sheet[f'C{current_row}'] = staff['Phone']
-            ga_sheet[f'D{current_row}'] = staff['Mobile']
-            ga_sheet[f'E{current_row}'] = staff['Email']
-            ga_sheet[f'F{current_row}'] = staff['Bio']
-
-        wb.save('state_meps.xlsx')
-        print(f"Successfully updated GA tab with {len(staff_data)} staff members!")
+        if write_state_tab('GA', staff_data):
+            print(f"Successfully updated GA tab with {len(staff_data)} staff members!")
     except Exception as e:
         print(f"Error updating Excel: {e}")
         print("Please close the Excel file and try again.")
@@ -3,7 +3,8 @@
 # The website does not provide email addresses or phone numbers publicly
 
 import pandas as pd
-from openpyxl import load_workbook
+from workbook_writer import write_state_tab
+from staff_store import save_staff
 
 staff_data = [
     # Leadership
@@ -54,26 +55,13 @@ print(f"\nTotal: {len(staff_data)} staff members")
 df = pd.DataFrame(staff_data)
 df.to_csv('ga_staff_temp.csv', index=False)
 print("\nSaved to ga_staff_temp.csv")
+save_staff('GA', staff_data)
 
 # Update Excel
 print("\nUpdating GA tab in Excel...")
 try:
-    wb = load_workbook('state_meps.xlsx')
-    ga_sheet = wb['GA']
-
-    start_row = 4
-
-    for idx, staff in enumerate(staff_data):
-        current_row = start_row + idx
-        ga_sheet[f'A{current_row}'] = staff['Name']
-        ga_sheet[f'B{current_row}'] = staff['Title']
-        ga_sheet[f'C{current_row}'] = staff['Phone']
-        ga_sheet[f'D{current_row}'] = staff['Mobile']
-        ga_sheet[f'E{current_row}'] = staff['Email']
-        ga_sheet[f'F{current_row}'] = staff['Bio']
-
-    wb.save('state_meps.xlsx')
-    print(f"Successfully updated GA tab with {len(staff_data)} staff members!")
+    if write_state_tab('GA', staff_data):
+        print(f"Successfully updated GA tab with {len(staff_data)} staff members!")
 except Exception as e:
     print(f"Error updating Excel: {e}")
     print("Please close the Excel file and try again.")
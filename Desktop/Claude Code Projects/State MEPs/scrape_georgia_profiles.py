@@ -1,11 +1,13 @@
-import requests
-from bs4 import BeautifulSoup
+from html_parse import make_soup
 import pandas as pd
-from openpyxl import load_workbook
-import time
+from workbook_writer import write_state_tab
+from staff_store import save_staff
 import re
 
-# Profile URLs for all 25 staff members
+from async_fetch import fetch_all
+from wp_discovery import discover_roster, remember_records, unchanged_records
+
+# Saved profile URLs, used if the site's REST API and sitemaps don't list the team
 profile_urls = [
     "https://gamep.org/meet-the-team/cassia-baker/",
     "https://gamep.org/meet-the-team/michael-barker-2/",
@@ -39,17 +41,36 @@ headers = {
 }
 
 staff_data = []
+parsed = {}  # url -> record, for profiles parsed this run
+
+# One request lists the whole team with modification dates
+roster = discover_roster('https://gamep.org', '/meet-the-team/')
+if roster:
+    profile_urls = [url for url, _ in roster]
+else:
+    roster = [(url, '') for url in profile_urls]
+
+# Profiles not modified since the last run keep their saved records
+unchanged = unchanged_records(roster)
 
-print(f"Scraping {len(profile_urls)} Georgia MEP staff profiles...")
+print(f"Scraping {len(profile_urls)} Georgia MEP staff profiles ({len(unchanged)} unchanged)...")
 print(f"{'='*60}\n")
 
+# Fetch every changed profile page concurrently (rate-limited per domain)
+profile_pages = fetch_all([url for url in profile_urls if url not in unchanged], headers)
+
 for idx, url in enumerate(profile_urls, 1):
     try:
-        print(f"[{idx}/{len(profile_urls)}] Fetching: {url}")
-        response = requests.get(url, headers=headers, timeout=30)
+        if url in unchanged:
+            print(f"[{idx}/{len(profile_urls)}] Unchanged: {url}")
+            staff_data.append(unchanged[url])
+            continue
+
+        print(f"[{idx}/{len(profile_urls)}] Parsing: {url}")
+        content = profile_pages.get(url)
 
-        if response.status_code == 200:
-            soup = BeautifulSoup(response.content, 'html.parser')
+        if content is not None:
+            soup = make_soup(content)
 
             # Extract name from page title or h1
             name = ""
@@ -90,14 +111,16 @@ for idx, url in enumerate(profile_urls, 1):
                             bio_parts.append(text)
                 bio = ' '.join(bio_parts)
 
-            staff_data.append({
+            record = {
                 'Name': name,
                 'Title': title,
                 'Phone': phone,
                 'Mobile': '',
                 'Email': email,
                 'Bio': bio
-            })
+            }
+            staff_data.append(record)
+            parsed[url] = record
 
             print(f"  Name: {name}")
             print(f"  Title: {title}")
@@ -106,10 +129,8 @@ for idx, url in enumerate(profile_urls, 1):
             print(f"  Bio: {len(bio)} chars")
             print()
 
-            time.sleep(1)  # Be polite
-
         else:
-            print(f"  Error: Status {response.status_code}")
+            print(f"  Error: profile could not be fetched")
             print()
 
     except Exception as e:
@@ -119,32 +140,20 @@ for idx, url in enumerate(profile_urls, 1):
 
 print(f"\n{'='*60}")
 print(f"Successfully extracted {len(staff_data)} staff members")
+remember_records(roster, parsed)
 
 if staff_data:
     # Save to CSV
     df = pd.DataFrame(staff_data)
     df.to_csv('ga_staff_temp.csv', index=False)
     print("Saved to ga_staff_temp.csv")
+    save_staff('GA', staff_data)
 
     # Update Excel
     print("\nUpdating GA tab in Excel...")
     try:
-        wb = load_workbook('state_meps.xlsx')
-        ga_sheet = wb['GA']
-
-        start_row = 4
-
-        for idx, staff in enumerate(staff_data):
-            current_row = start_row + idx
-            ga_sheet[f'A{current_row}'] = staff['Name']
-            ga_sheet[f'B{current_row}'] = staff['Title']
-            ga_sheet[f'C{current_row}'] = staff['Phone']
-            ga_sheet[f'D{current_row}'] = staff['Mobile']
-            ga_sheet[f'E{current_row}'] = staff['Email']
-            ga_sheet[f'F{current_row}'] = staff['Bio']
-
-        wb.save('state_meps.xlsx')
-        print(f"Successfully updated GA tab with {len(staff_data)} staff members!")
+        if write_state_tab('GA', staff_data):
+            print(f"Successfully updated GA tab with {len(staff_data)} staff members!")
     except Exception as e:
         print(f"Error updating Excel: {e}")
         print("Please close the Excel file and try again.")
@@ -1,12 +1,12 @@
-import requests
-from bs4 import BeautifulSoup
+import fetch
+from html_parse import make_soup
 import pandas as pd
 from openpyxl import load_workbook
 import time
 import re
 
 # Create a session to maintain cookies
-session = requests.Session()
+session = fetch.new_session()
 
 headers = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -38,7 +38,7 @@ try:
             f.write(team_response.text)
         print(f"Saved HTML ({len(team_response.text)} chars)")
 
-        soup = BeautifulSoup(team_response.content, 'html.parser')
+        soup = make_soup(team_response.content)
 
         staff_data = []
 
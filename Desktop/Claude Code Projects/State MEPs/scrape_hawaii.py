@@ -3,7 +3,8 @@
 # The website does not provide individual email addresses or phone numbers publicly
 
 import pandas as pd
-from openpyxl import load_workbook
+from workbook_writer import write_state_tab
+from staff_store import save_staff
 
 staff_data = [
     # Executive Leadership
@@ -49,26 +50,13 @@ print(f"\nTotal: {len(staff_data)} staff members")
 df = pd.DataFrame(staff_data)
 df.to_csv('hi_staff_temp.csv', index=False)
 print("\nSaved to hi_staff_temp.csv")
+save_staff('HI', staff_data)
 
 # Update Excel
 print("\nUpdating HI tab in Excel...")
 try:
-    wb = load_workbook('state_meps.xlsx')
-    hi_sheet = wb['HI']
-
-    start_row = 4
-
-    for idx, staff in enumerate(staff_data):
-        current_row = start_row + idx
-        hi_sheet[f'A{current_row}'] = staff['Name']
-        hi_sheet[f'B{current_row}'] = staff['Title']
-        hi_sheet[f'C{current_row}'] = staff['Phone']
-        hi_sheet[f'D{current_row}'] = staff['Mobile']
-        hi_sheet[f'E{current_row}'] = staff['Email']
-        hi_sheet[f'F{current_row}'] = staff['Bio']
-
-    wb.save('state_meps.xlsx')
-    print(f"Successfully updated HI tab with {len(staff_data)} staff members!")
+    if write_state_tab('HI', staff_data):
+        print(f"Successfully updated HI tab with {len(staff_data)} staff members!")
 except Exception as e:
     print(f"Error updating Excel: {e}")
     print("Please close the Excel file and try again.")
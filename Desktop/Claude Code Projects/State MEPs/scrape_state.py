@@ -1,41 +1,22 @@
-import requests
-from bs4 import BeautifulSoup
+import fetch
+from html_parse import make_soup, parse_many
 import pandas as pd
-from openpyxl import load_workbook
-import time
-import re
 import sys
 
-def extract_profile_details(profile_url, headers):
-    """Extract phone, mobile, email, and bio from individual profile page"""
+from async_fetch import fetch_all
+from contact_extract import extract_contacts
+from fingerprint import page_fingerprint
+import metrics
+from workbook_writer import write_state_tab
+from staff_store import load_fingerprints, save_fingerprints, save_staff
+
+def extract_profile_details(content):
+    """Extract phone, mobile, email, and bio from a fetched profile page"""
     try:
-        print(f"  Fetching profile: {profile_url}")
-        response = requests.get(profile_url, headers=headers, timeout=30)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = make_soup(content)
 
-        phone = ""
-        mobile = ""
-        email = ""
         bio = ""
 
-        # Look for contact information - try various patterns
-        # Phone numbers are often in links with tel: or in text
-        phone_links = soup.find_all('a', href=re.compile(r'tel:'))
-        if phone_links:
-            for link in phone_links:
-                phone_text = link.get_text(strip=True)
-                if 'mobile' in link.get('title', '').lower() or 'cell' in link.get('title', '').lower():
-                    mobile = phone_text
-                elif not phone:
-                    phone = phone_text
-
-        # Email - look for mailto links
-        email_links = soup.find_all('a', href=re.compile(r'mailto:'))
-        if email_links:
-            email_href = email_links[0].get('href', '')
-            email = email_href.replace('mailto:', '')
-
         # Bio - look for content area, article body, or bio section
         bio_areas = soup.find_all(['div', 'article', 'section'], class_=lambda x: x and ('content' in str(x).lower() or 'bio' in str(x).lower() or 'description' in str(x).lower() or 'text' in str(x).lower()))
         if bio_areas:
@@ -46,35 +27,117 @@ def extract_profile_details(profile_url, headers):
                     bio = bio_text
                     break
 
-        # If phone/mobile/email not found in links, try to extract from bio text or page text
-        page_text = soup.get_text()
-
-        if not phone or not mobile:
-            # Extract phone numbers from text
-            phone_pattern = r'Phone:\s*\(?(\d{3})\)?[-.\s]?(\d{3})[-.\s]?(\d{4})'
-            mobile_pattern = r'(?:Mobile|Cell):\s*\(?(\d{3})\)?[-.\s]?(\d{3})[-.\s]?(\d{4})'
-
-            phone_match = re.search(phone_pattern, page_text)
-            if phone_match and not phone:
-                phone = f"({phone_match.group(1)}) {phone_match.group(2)}-{phone_match.group(3)}"
-
-            mobile_match = re.search(mobile_pattern, page_text)
-            if mobile_match and not mobile:
-                mobile = f"({mobile_match.group(1)}) {mobile_match.group(2)}-{mobile_match.group(3)}"
-
-        if not email:
-            email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-            email_match = re.search(email_pattern, page_text)
-            if email_match:
-                email = email_match.group(0)
+        # tel:/mailto: links first, then labelled numbers and emails in the page text
+        contacts = extract_contacts(soup)
+        phone, mobile, email = contacts['Phone'], contacts['Mobile'], contacts['Email']
 
         return phone, mobile, email, bio
     except Exception as e:
-        print(f"  Error fetching profile: {e}")
+        print(f"  Error parsing profile: {e}")
         return "", "", "", ""
 
-def scrape_state_staff(state_name, staff_url):
-    """Scrape staff information for a given state"""
+def profile_fields(details):
+    """(phone, mobile, email, bio) from extract_profile_details as record fields"""
+    return dict(zip(['Phone', 'Mobile', 'Email', 'Bio'], details))
+
+def extract_staff_list(soup, staff_url):
+    """Find staff on a parsed roster page; returns (staff_data, [(record, profile_url)]).
+
+    Records with a profile link are filled in later from the profile page.
+    """
+    staff_data = []
+    pending_profiles = []  # (record, profile_url) pairs, fetched together by the caller
+
+    # Try multiple patterns to find staff members
+    # Pattern 1: Team containers (like Arkansas)
+    team_containers = soup.find_all('div', class_=lambda x: x and 'team' in str(x).lower())
+
+    # Pattern 2: Staff/member cards
+    if not team_containers:
+        team_containers = soup.find_all(['div', 'article'], class_=lambda x: x and ('staff' in str(x).lower() or 'member' in str(x).lower() or 'person' in str(x).lower()))
+
+    # Pattern 3: Look for names in headers with associated info
+    if not team_containers:
+        team_containers = soup.find_all(['div', 'section'], class_=lambda x: x and ('card' in str(x).lower() or 'profile' in str(x).lower()))
+
+    print(f"Found {len(team_containers)} potential staff entries\n")
+
+    if team_containers:
+        for idx, container in enumerate(team_containers, 1):
+            # Try to find name
+            name = ""
+            profile_url = ""
+            title = ""
+
+            # Look for name in various heading levels
+            name_elem = container.find(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
+            if name_elem:
+                name_link = name_elem.find('a')
+                if name_link:
+                    name = name_link.get_text(strip=True)
+                    profile_url = name_link.get('href', '')
+                    if profile_url and not profile_url.startswith('http'):
+                        # Make absolute URL
+                        from urllib.parse import urljoin
+                        profile_url = urljoin(staff_url, profile_url)
+                else:
+                    name = name_elem.get_text(strip=True)
+
+            # Look for title
+            title_elem = container.find(['p', 'span', 'div'], class_=lambda x: x and ('title' in str(x).lower() or 'position' in str(x).lower() or 'role' in str(x).lower()))
+            if title_elem:
+                title = title_elem.get_text(strip=True)
+            elif name_elem:
+                # Title might be in next sibling
+                next_elem = name_elem.find_next(['p', 'span', 'div'])
+                if next_elem:
+                    title = next_elem.get_text(strip=True)
+
+            if name and len(name) < 100:  # Reasonable name length
+                print(f"[{idx}/{len(team_containers)}] Found: {name}")
+
+                phone = ""
+                mobile = ""
+                email = ""
+                bio = ""
+
+                # Profile pages are fetched together in one concurrent batch below;
+                # without one, try to extract from the current container
+                if not profile_url:
+                    contacts = extract_contacts(container)
+                    phone, mobile, email = contacts['Phone'], contacts['Mobile'], contacts['Email']
+
+                    # Bio
+                    bio_paras = container.find_all('p')
+                    bio = ' '.join([p.get_text(strip=True) for p in bio_paras if p.get_text(strip=True)])
+
+                record = {
+                    'Name': name,
+                    'Title': title,
+                    'Phone': phone,
+                    'Mobile': mobile,
+                    'Email': email,
+                    'Bio': bio
+                }
+                staff_data.append(record)
+
+                if profile_url:
+                    pending_profiles.append((record, profile_url))
+                else:
+                    print(f"  Phone: {phone}, Mobile: {mobile}, Email: {email}")
+                    print(f"  Complete\n")
+
+    return staff_data, pending_profiles
+
+def scrape_state_staff(state_name, staff_url, force=False, checkpoint=None):
+    """Scrape staff information for a given state.
+
+    Unless force is set, a staff page whose fingerprint matches the last run
+    reuses the last run's staff list without re-parsing it; profile pages are
+    still fetched and only the ones whose fingerprint changed are re-parsed.
+    With a checkpoint, each profile is parsed and saved as soon as its page
+    arrives, and profiles finished by an interrupted run aren't fetched again.
+    """
 
     headers = {
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
@@ -86,109 +149,89 @@ def scrape_state_staff(state_name, staff_url):
         print(f"Staff Page: {staff_url}")
         print(f"{'='*60}\n")
 
-        response = requests.get(staff_url, headers=headers, timeout=30)
+        response = fetch.get(staff_url, headers=headers)
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.content, 'html.parser')
-        staff_data = []
-
-        # Try multiple patterns to find staff members
-        # Pattern 1: Team containers (like Arkansas)
-        team_containers = soup.find_all('div', class_=lambda x: x and 'team' in str(x).lower())
-
-        # Pattern 2: Staff/member cards
-        if not team_containers:
-            team_containers = soup.find_all(['div', 'article'], class_=lambda x: x and ('staff' in str(x).lower() or 'member' in str(x).lower() or 'person' in str(x).lower()))
-
-        # Pattern 3: Look for names in headers with associated info
-        if not team_containers:
-            team_containers = soup.find_all(['div', 'section'], class_=lambda x: x and ('card' in str(x).lower() or 'profile' in str(x).lower()))
-
-        print(f"Found {len(team_containers)} potential staff entries\n")
-
-        if team_containers:
-            for idx, container in enumerate(team_containers, 1):
-                # Try to find name
-                name = ""
-                profile_url = ""
-                title = ""
-
-                # Look for name in various heading levels
-                name_elem = container.find(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
-                if name_elem:
-                    name_link = name_elem.find('a')
-                    if name_link:
-                        name = name_link.get_text(strip=True)
-                        profile_url = name_link.get('href', '')
-                        if profile_url and not profile_url.startswith('http'):
-                            # Make absolute URL
-                            from urllib.parse import urljoin
-                            profile_url = urljoin(staff_url, profile_url)
-                    else:
-                        name = name_elem.get_text(strip=True)
-
-                # Look for title
-                title_elem = container.find(['p', 'span', 'div'], class_=lambda x: x and ('title' in str(x).lower() or 'position' in str(x).lower() or 'role' in str(x).lower()))
-                if title_elem:
-                    title = title_elem.get_text(strip=True)
-                elif name_elem:
-                    # Title might be in next sibling
-                    next_elem = name_elem.find_next(['p', 'span', 'div'])
-                    if next_elem:
-                        title = next_elem.get_text(strip=True)
-
-                if name and len(name) < 100:  # Reasonable name length
-                    print(f"[{idx}/{len(team_containers)}] Found: {name}")
-
-                    phone = ""
-                    mobile = ""
-                    email = ""
-                    bio = ""
-
-                    # If there's a profile URL, fetch details
-                    if profile_url:
-                        phone, mobile, email, bio = extract_profile_details(profile_url, headers)
-                        time.sleep(1)  # Be polite
-                    else:
-                        # Try to extract from current container
-                        container_text = container.get_text()
-
-                        # Phone
-                        phone_match = re.search(r'(?:Phone|Tel|Office):\s*\(?(\d{3})\)?[-.\s]?(\d{3})[-.\s]?(\d{4})', container_text)
-                        if phone_match:
-                            phone = f"({phone_match.group(1)}) {phone_match.group(2)}-{phone_match.group(3)}"
-
-                        # Mobile
-                        mobile_match = re.search(r'(?:Mobile|Cell):\s*\(?(\d{3})\)?[-.\s]?(\d{3})[-.\s]?(\d{4})', container_text)
-                        if mobile_match:
-                            mobile = f"({mobile_match.group(1)}) {mobile_match.group(2)}-{mobile_match.group(3)}"
-
-                        # Email
-                        email_link = container.find('a', href=re.compile(r'mailto:'))
-                        if email_link:
-                            email = email_link.get('href', '').replace('mailto:', '')
-                        else:
-                            email_match = re.search(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', container_text)
-                            if email_match:
-                                email = email_match.group(0)
-
-                        # Bio
-                        bio_paras = container.find_all('p')
-                        bio = ' '.join([p.get_text(strip=True) for p in bio_paras if p.get_text(strip=True)])
-
-                    staff_data.append({
-                        'Name': name,
-                        'Title': title,
-                        'Phone': phone,
-                        'Mobile': mobile,
-                        'Email': email,
-                        'Bio': bio
-                    })
-                    print(f"  Phone: {phone}, Mobile: {mobile}, Email: {email}")
-                    print(f"  Complete\n")
+        # The roster is remembered as [[record, profile_url], ...] so a hit can still revalidate profiles
+        roster_fingerprint = page_fingerprint(response.content)
+        previous = None if force else load_fingerprints([staff_url]).get(staff_url)
+        if previous and previous[0] == roster_fingerprint and previous[1] and isinstance(previous[1][0], list):
+            print(f"Staff page unchanged since last run - reusing {len(previous[1])} staff, checking profiles")
+            staff_data = [record for record, _ in previous[1]]
+            pending_profiles = [(record, profile_url) for record, profile_url in previous[1] if profile_url]
+        else:
+            soup = make_soup(response.content)
+            with metrics.span('extract'):
+                staff_data, pending_profiles = extract_staff_list(soup, staff_url)
+
+        profile_urls = {id(record): profile_url for record, profile_url in pending_profiles}
+        incomplete = 0
+
+        if pending_profiles and checkpoint is not None:
+            done = checkpoint.records()
+            remaining = []
+            for record, profile_url in pending_profiles:
+                if profile_url in done:
+                    record.update(done[profile_url])
+                else:
+                    remaining.append((record, profile_url))
+            if len(remaining) < len(pending_profiles):
+                print(f"Resumed {len(pending_profiles) - len(remaining)} profiles from checkpoint")
+            pending_profiles = remaining
+
+        if pending_profiles:
+            print(f"\nFetching {len(pending_profiles)} profile pages...")
+            records_for = {}
+            for record, profile_url in pending_profiles:
+                records_for.setdefault(profile_url, []).append(record)
+
+            # Profiles whose fingerprint hasn't changed reuse last run's details
+            known = {} if force else load_fingerprints(records_for)
+            fingerprints = {}
+            changed = []
+
+            def finish(profile_url, fingerprint, profile):
+                for record in records_for[profile_url]:
+                    record.update(profile)
+                    print(f"{record['Name']}: Phone: {profile['Phone']}, Mobile: {profile['Mobile']}, Email: {profile['Email']}")
+                fingerprints[profile_url] = (fingerprint, profile)
+                if checkpoint is not None:
+                    checkpoint.save(profile_url, profile)
+
+            def on_page(profile_url, content):
+                if content is None:
+                    return
+                fingerprint = page_fingerprint(content)
+                previous = known.get(profile_url)
+                if previous and previous[0] == fingerprint and previous[1]:
+                    finish(profile_url, fingerprint, previous[1])
+                elif checkpoint is not None:
+                    # Parse as each page lands so an interrupted run keeps every profile finished so far
+                    finish(profile_url, fingerprint, profile_fields(extract_profile_details(content)))
+                else:
+                    changed.append((profile_url, content, fingerprint))
+
+            pages = fetch_all(list(records_for), headers, on_page=on_page)
+            incomplete = sum(len(records) for profile_url, records in records_for.items()
+                             if pages.get(profile_url) is None)
+
+            print(f"{len(fingerprints)} profiles done as they arrived, parsing {len(changed)}")
+
+            # Without a checkpoint, changed profiles are parsed together on worker processes
+            details = parse_many(extract_profile_details, [content for _, content, _ in changed])
+            for (profile_url, _, fingerprint), parsed in zip(changed, details):
+                finish(profile_url, fingerprint, profile_fields(parsed))
+
+            save_fingerprints(fingerprints)
 
         if staff_data:
             print(f"\nSuccessfully extracted {len(staff_data)} staff members")
+            if incomplete:
+                # A failed profile fetch leaves blanks; don't let the next run reuse them
+                print(f"{incomplete} profile pages could not be fetched - staff page will be re-checked next run")
+            else:
+                roster = [[record, profile_urls.get(id(record), '')] for record in staff_data]
+                save_fingerprints({staff_url: (roster_fingerprint, roster)})
             return staff_data
         else:
             print("\nNo staff data extracted. The page structure may need manual review.")
@@ -203,30 +246,9 @@ def scrape_state_staff(state_name, staff_url):
 def update_excel_tab(state_abbrev, staff_data):
     """Update the Excel file with staff data for a specific state tab"""
     try:
-        # Load the Excel workbook
-        wb = load_workbook('state_meps.xlsx')
-
-        # Access the state sheet
-        if state_abbrev not in wb.sheetnames:
-            print(f"Warning: Sheet {state_abbrev} not found in workbook")
+        if not write_state_tab(state_abbrev, staff_data):
             return False
 
-        state_sheet = wb[state_abbrev]
-
-        # Starting at Row 4
-        start_row = 4
-
-        for idx, staff in enumerate(staff_data):
-            current_row = start_row + idx
-            state_sheet[f'A{current_row}'] = staff['Name']
-            state_sheet[f'B{current_row}'] = staff['Title']
-            state_sheet[f'C{current_row}'] = staff['Phone'] if staff['Phone'] else ""
-            state_sheet[f'D{current_row}'] = staff['Mobile'] if staff['Mobile'] else ""
-            state_sheet[f'E{current_row}'] = staff['Email'] if staff['Email'] else ""
-            state_sheet[f'F{current_row}'] = staff['Bio'] if staff['Bio'] else ""
-
-        # Save the workbook
-        wb.save('state_meps.xlsx')
         print(f"\nSuccessfully updated {state_abbrev} tab in state_meps.xlsx!")
         return True
 
@@ -255,6 +277,7 @@ if __name__ == "__main__":
         csv_filename = f"{state_abbrev.lower()}_staff_temp.csv"
         df.to_csv(csv_filename, index=False)
         print(f"Saved to {csv_filename}")
+        save_staff(state_abbrev, staff_data)
 
         # Update Excel
         update_excel_tab(state_abbrev, staff_data)
@@ -0,0 +1,229 @@
+import json
+import os
+import re
+import sqlite3
+import sys
+import time
+import uuid
+
+import metrics
+
+DB_PATH = 'staff.db'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS staff (
+    state       TEXT NOT NULL,
+    staff_key   TEXT NOT NULL,
+    name        TEXT,
+    title       TEXT COLLATE NOCASE,
+    phone       TEXT,
+    mobile      TEXT,
+    email       TEXT COLLATE NOCASE,
+    bio         TEXT,
+    position    INTEGER,
+    run_id      TEXT,
+    first_seen  TEXT,
+    last_seen   TEXT,
+    changed_at  TEXT,
+    PRIMARY KEY (state, staff_key)
+);
+CREATE INDEX IF NOT EXISTS idx_staff_email ON staff(email);
+CREATE INDEX IF NOT EXISTS idx_staff_state_run ON staff(state, run_id);
+CREATE INDEX IF NOT EXISTS idx_staff_title ON staff(title);
+CREATE INDEX IF NOT EXISTS idx_staff_changed ON staff(changed_at);
+
+CREATE TABLE IF NOT EXISTS runs (
+    run_id      TEXT PRIMARY KEY,
+    state       TEXT NOT NULL,
+    source      TEXT,
+    started_at  TEXT,
+    staff_count INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_runs_state ON runs(state, started_at);
+
+CREATE TABLE IF NOT EXISTS page_fingerprints (
+    url         TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    records     TEXT,
+    checked_at  TEXT
+);
+"""
+
+# Record columns in the order they appear in the workbook
+FIELDS = [('Name', 'name'), ('Title', 'title'), ('Phone', 'phone'),
+          ('Mobile', 'mobile'), ('Email', 'email'), ('Bio', 'bio')]
+
+# Content changes bump changed_at; re-seeing an identical record only bumps last_seen
+UPSERT_SQL = """
+INSERT INTO staff (state, staff_key, name, title, phone, mobile, email, bio,
+                   position, run_id, first_seen, last_seen, changed_at)
+VALUES (:state, :staff_key, :name, :title, :phone, :mobile, :email, :bio,
+        :position, :run_id, :now, :now, :now)
+ON CONFLICT(state, staff_key) DO UPDATE SET
+    changed_at = CASE WHEN name IS NOT excluded.name OR title IS NOT excluded.title
+                        OR phone IS NOT excluded.phone OR mobile IS NOT excluded.mobile
+                        OR email IS NOT excluded.email OR bio IS NOT excluded.bio
+                      THEN excluded.changed_at ELSE changed_at END,
+    name = excluded.name, title = excluded.title, phone = excluded.phone,
+    mobile = excluded.mobile, email = excluded.email, bio = excluded.bio,
+    position = excluded.position, run_id = excluded.run_id,
+    last_seen = excluded.last_seen
+"""
+
+def connect(path=DB_PATH):
+    """Open the store, creating the tables and indexes on first use"""
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.executescript(SCHEMA)
+    return conn
+
+def _text(value):
+    # None/NaN/blank all become "" so comparisons in the upsert are stable
+    if value is None or value != value:
+        return ''
+    return str(value).strip()
+
+def staff_key(staff):
+    """Identity of a person within a state: their email if known, otherwise their normalized name"""
+    email = _text(staff.get('Email')).lower()
+    if email:
+        return f"email:{email}"
+    name = re.sub(r'[^a-z0-9]+', ' ', _text(staff.get('Name')).lower()).strip()
+    return f"name:{name}"
+
+def new_run_id():
+    return f"{time.strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:6]}"
+
+def save_staff(state_abbrev, staff_data, source=None, path=DB_PATH):
+    """Upsert one scrape of a state's roster and return its run id"""
+    run_id = new_run_id()
+    now = time.strftime('%Y-%m-%d %H:%M:%S')
+    source = source or os.path.basename(sys.argv[0])
+
+    rows = []
+    for position, staff in enumerate(staff_data):
+        row = {column: _text(staff.get(key)) for key, column in FIELDS}
+        if not row['name']:
+            continue
+        row.update(state=state_abbrev, staff_key=staff_key(staff),
+                   position=position, run_id=run_id, now=now)
+        rows.append(row)
+
+    conn = connect(path)
+    try:
+        with conn, metrics.span('store_save', state=state_abbrev):
+            conn.execute(
+                "INSERT INTO runs (run_id, state, source, started_at, staff_count) VALUES (?, ?, ?, ?, ?)",
+                (run_id, state_abbrev, source, now, len(rows)))
+            conn.executemany(UPSERT_SQL, rows)
+    finally:
+        conn.close()
+
+    print(f"Saved {len(rows)} {state_abbrev} staff to {path} (run {run_id})")
+    return run_id
+
+def _to_record(row):
+    record = {key: row[column] or '' for key, column in FIELDS}
+    record['State'] = row['state']
+    return record
+
+def load_staff(state_abbrev=None, changed_since=None, path=DB_PATH):
+    """Return the current roster (rows seen in each state's latest run) as staff records.
+
+    changed_since ('YYYY-MM-DD HH:MM:SS') limits the result to records whose
+    content changed after that time, for incremental exports.
+    """
+    sql = """
+        SELECT s.* FROM staff s
+        WHERE s.run_id = (SELECT r.run_id FROM runs r WHERE r.state = s.state
+                          ORDER BY r.started_at DESC, r.rowid DESC LIMIT 1)
+    """
+    params = []
+    if state_abbrev:
+        sql += " AND s.state = ?"
+        params.append(state_abbrev)
+    if changed_since:
+        sql += " AND s.changed_at > ?"
+        params.append(changed_since)
+    sql += " ORDER BY s.state, s.position"
+
+    conn = connect(path)
+    try:
+        return [_to_record(row) for row in conn.execute(sql, params)]
+    finally:
+        conn.close()
+
+def find_staff(email=None, title=None, state_abbrev=None, path=DB_PATH):
+    """Cross-state lookup by exact (case-insensitive) email and/or title"""
+    clauses, params = [], []
+    if email:
+        clauses.append("email = ?")
+        params.append(email)
+    if title:
+        clauses.append("title = ?")
+        params.append(title)
+    if state_abbrev:
+        clauses.append("state = ?")
+        params.append(state_abbrev)
+
+    sql = "SELECT * FROM staff"
+    if clauses:
+        sql += " WHERE " + " AND ".join(clauses)
+    sql += " ORDER BY state, position"
+
+    conn = connect(path)
+    try:
+        return [_to_record(row) for row in conn.execute(sql, params)]
+    finally:
+        conn.close()
+
+def latest_runs(path=DB_PATH):
+    """Return {state: (run_id, started_at, staff_count)} for each state's most recent scrape"""
+    conn = connect(path)
+    try:
+        runs = {}
+        for row in conn.execute("SELECT * FROM runs ORDER BY started_at, rowid"):
+            runs[row['state']] = (row['run_id'], row['started_at'], row['staff_count'])
+        return runs
+    finally:
+        conn.close()
+
+def load_fingerprints(urls, path=DB_PATH):
+    """Return {url: (fingerprint, records)} for the urls seen before; records is whatever was saved"""
+    urls = list(urls)
+    found = {}
+    conn = connect(path)
+    try:
+        # SQLite caps bound parameters, so look them up in chunks
+        for start in range(0, len(urls), 500):
+            chunk = urls[start:start + 500]
+            placeholders = ', '.join('?' * len(chunk))
+            for row in conn.execute(f"SELECT url, fingerprint, records FROM page_fingerprints WHERE url IN ({placeholders})", chunk):
+                found[row['url']] = (row['fingerprint'], json.loads(row['records']) if row['records'] else None)
+    finally:
+        conn.close()
+    return found
+
+def save_fingerprints(pages, path=DB_PATH):
+    """Store {url: (fingerprint, records)} for the next run's change check"""
+    if not pages:
+        return
+    now = time.strftime('%Y-%m-%d %H:%M:%S')
+    rows = [(url, fingerprint, json.dumps(records), now) for url, (fingerprint, records) in pages.items()]
+
+    conn = connect(path)
+    try:
+        with conn:
+            conn.executemany("""
+                INSERT INTO page_fingerprints (url, fingerprint, records, checked_at) VALUES (?, ?, ?, ?)
+                ON CONFLICT(url) DO UPDATE SET fingerprint = excluded.fingerprint,
+                    records = excluded.records, checked_at = excluded.checked_at
+            """, rows)
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    # Quick summary of what's in the store
+    for state, (run_id, started_at, staff_count) in sorted(latest_runs().items()):
+        print(f"{state}: {staff_count} staff (run {run_id}, {started_at})")
@@ -0,0 +1,6 @@
+import os
+import sys
+
+# The scrapers are flat scripts; make them importable and keep test runs out of metrics.jsonl
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('SCRAPE_METRICS', 'off')
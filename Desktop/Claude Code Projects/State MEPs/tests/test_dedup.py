@@ -0,0 +1,51 @@
+from dedup import StaffIndex, cross_mep_people, merge_records, possible_duplicate, same_person
+
+def test_honorifics_and_credentials_merge():
+    merged = merge_records([
+        {'Name': 'Dr. Rachel Anderson', 'Title': 'Director'},
+        {'Name': 'Rachel Anderson, PhD', 'Phone': '555-0100'},
+    ])
+    assert len(merged) == 1
+    assert merged[0]['Title'] == 'Director'
+    assert merged[0]['Phone'] == '555-0100'
+
+def test_shared_title_does_not_merge_different_first_names():
+    staff = [
+        {'Name': 'Dan Lee', 'Title': 'Project Manager', 'Phone': '(555) 010-0200'},
+        {'Name': 'Don Lee', 'Title': 'Project Manager', 'Phone': '555.010.0200'},
+    ]
+    assert not same_person(*staff)
+    assert possible_duplicate(*staff)
+    assert [record['Name'] for record in merge_records(staff)] == ['Dan Lee', 'Don Lee']
+
+def test_same_personal_email_merges():
+    merged = merge_records([
+        {'Name': 'Bob Smith', 'Email': 'rsmith@mep.org'},
+        {'Name': 'Robert Smith', 'Email': 'mailto:RSmith@mep.org', 'Bio': 'Longer bio'},
+    ])
+    assert len(merged) == 1
+    assert merged[0]['Bio'] == 'Longer bio'
+
+def test_generic_mailbox_does_not_merge():
+    merged = merge_records([
+        {'Name': 'Ann Park', 'Email': 'info@mep.org'},
+        {'Name': 'Tom Reyes', 'Email': 'info@mep.org'},
+    ])
+    assert len(merged) == 2
+
+def test_different_emails_stay_apart():
+    index = StaffIndex()
+    index.add({'Name': 'Chris Young', 'Email': 'cyoung@a.org'})
+    _, is_new = index.add({'Name': 'Chris Young', 'Email': 'cyoung@b.org'})
+    assert is_new
+
+def test_cross_mep_people():
+    rosters = {
+        'AL': [{'Name': 'John Smith', 'Title': 'Business Advisor'}],
+        'GA': [{'Name': 'Jane Smith', 'Title': 'Business Advisor'}],
+    }
+    assert cross_mep_people(rosters) == []
+
+    rosters['GA'].append({'Name': 'John Smith', 'Title': 'Advisor'})
+    people = cross_mep_people(rosters)
+    assert [(person['Name'], states) for person, states in people] == [('John Smith', ['AL', 'GA'])]
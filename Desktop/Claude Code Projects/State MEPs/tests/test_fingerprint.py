@@ -0,0 +1,38 @@
+from fingerprint import normalize_page, page_fingerprint
+
+PAGE = """<html><head>
+<link rel="stylesheet" href="/wp-content/style.css?ver={ver}">
+<meta name="csrf-token" content="{token}">
+<script nonce="{token}">var now = {epoch};</script>
+</head><body>
+<!-- generated {stamp} -->
+<form><input type="hidden" name="_wpnonce" value="{token}"></form>
+<div class="staff" data-nonce="{token}">
+  <h3>Ann Park</h3><p>{title}</p>
+</div>
+<footer>Updated {stamp}</footer>
+</body></html>"""
+
+def render(ver='6.4.2', token='a1b2c3', epoch=1700000000, stamp='2024-05-01T10:15:00Z', title='Director'):
+    return PAGE.format(ver=ver, token=token, epoch=epoch, stamp=stamp, title=title)
+
+def test_volatile_markup_is_ignored():
+    first = render()
+    second = render(ver='6.5.0', token='zz9y8x', epoch=1712345678123, stamp='2024-06-02 08:00:01')
+    assert first != second
+    assert page_fingerprint(first) == page_fingerprint(second)
+
+def test_whitespace_is_ignored():
+    assert page_fingerprint(render()) == page_fingerprint(render().replace('\n', '\n    '))
+
+def test_content_change_changes_fingerprint():
+    assert page_fingerprint(render()) != page_fingerprint(render(title='Executive Director'))
+
+def test_bytes_and_str_agree():
+    assert page_fingerprint(render().encode('utf-8')) == page_fingerprint(render())
+
+def test_normalized_page_keeps_staff_text():
+    normalized = normalize_page(render())
+    assert 'Ann Park' in normalized
+    assert 'Director' in normalized
+    assert 'a1b2c3' not in normalized
@@ -0,0 +1,80 @@
+import pytest
+import requests
+
+import replay
+
+@pytest.fixture
+def fixtures(tmp_path):
+    path = str(tmp_path / 'fixtures.zip')
+    yield path
+    replay.set_mode(None)
+
+class FakeResponse:
+    status_code = 200
+    url = 'https://mep.org/staff?page=2'
+    headers = {'Content-Type': 'text/html; charset=utf-8', 'Set-Cookie': 'session=1'}
+    content = b'<h3>Ann Park</h3>'
+
+class FakeChrome:
+    page_source = '<div class="staff"><h3>Ann Park</h3><p>Director</p></div>'
+
+    def get(self, url):
+        pass
+
+    def execute_script(self, script, *args):
+        return 3
+
+def test_request_key_includes_params():
+    assert replay.request_key('GET', 'https://mep.org/staff', {'page': 2}) == 'GET https://mep.org/staff?page=2'
+    assert replay.request_key('GET', 'https://mep.org/staff') == 'GET https://mep.org/staff'
+
+def test_archive_round_trip(fixtures):
+    archive = replay.FixtureArchive(fixtures)
+    archive.put('GET https://mep.org/a', {'status': 200}, b'same body')
+    archive.put('GET https://mep.org/b', {'status': 200}, b'same body')
+    archive.save()
+
+    reopened = replay.FixtureArchive(fixtures)
+    assert 'GET https://mep.org/a' in reopened
+    meta, body = reopened.get('GET https://mep.org/b')
+    assert (meta['status'], body) == (200, b'same body')
+    # Identical bodies are stored once
+    assert meta['body'] == reopened.index['GET https://mep.org/a']['body']
+    assert reopened.get('GET https://mep.org/c') is None
+
+def test_response_replays_by_params(fixtures):
+    replay.set_mode('record', fixtures)
+    replay.record_response('GET', 'https://mep.org/staff', FakeResponse(), {'page': 2})
+    replay.archive().save()
+
+    replay.set_mode('replay', fixtures)
+    response = replay.replay_response('GET', 'https://mep.org/staff', {'page': 2})
+    assert response.status_code == 200
+    assert response.text == '<h3>Ann Park</h3>'
+    assert response.headers['content-type'] == 'text/html; charset=utf-8'
+    # Only KEPT_HEADERS are recorded
+    assert 'Set-Cookie' not in response.headers
+
+    with pytest.raises(requests.ConnectionError):
+        replay.replay_response('GET', 'https://mep.org/staff', {'page': 3})
+
+def test_driver_replays_recorded_pages(fixtures):
+    from selenium.common.exceptions import WebDriverException
+
+    replay.set_mode('record', fixtures)
+    recording = replay.RecordingDriver(FakeChrome())
+    recording.get('https://mep.org/staff')
+    assert recording.execute_script('return 1 + 2') == 3
+    replay.archive().save()
+
+    replay.set_mode('replay', fixtures)
+    driver = replay.ReplayDriver()
+    driver.get('https://mep.org/staff')
+    assert [element.text for element in driver.find_elements('css selector', '.staff h3')] == ['Ann Park']
+    assert driver.execute_script('return 1 + 2') == 3
+
+    with pytest.raises(WebDriverException):
+        driver.execute_script('return 1 + 2')
+    with pytest.raises(WebDriverException):
+        driver.get('https://mep.org/other')
+        driver.page_source
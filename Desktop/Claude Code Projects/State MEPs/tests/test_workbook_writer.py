@@ -0,0 +1,69 @@
+from openpyxl import Workbook, load_workbook
+
+from workbook_writer import COLUMNS, START_ROW, WorkbookWriter, staff_row, write_state_tab
+
+def person(name, title='Advisor'):
+    return {'Name': name, 'Title': title, 'Email': f"{name.split()[0].lower()}@mep.org"}
+
+def make_sheet(staff):
+    sheet = Workbook().active
+    WorkbookWriter()._write_sheet(sheet, [staff_row(record) for record in staff])
+    return sheet
+
+def names(sheet):
+    return [sheet.cell(row=row, column=1).value for row in range(START_ROW, sheet.max_row + 1)]
+
+def test_empty_sheet_gets_every_cell():
+    staff = [person('Ann Park'), person('Tom Reyes')]
+    sheet = Workbook().active
+    changed, cleared = WorkbookWriter()._write_sheet(sheet, [staff_row(record) for record in staff])
+    # Name, Title and Email per person; blank fields aren't written
+    assert (changed, cleared) == (6, 0)
+    assert names(sheet) == ['Ann Park', 'Tom Reyes']
+
+def test_unchanged_roster_writes_nothing():
+    staff = [person('Ann Park'), person('Tom Reyes')]
+    sheet = make_sheet(staff)
+    assert WorkbookWriter()._write_sheet(sheet, [staff_row(record) for record in staff]) == (0, 0)
+
+def test_new_hire_at_top_keeps_existing_rows():
+    staff = [person(name) for name in ('Ann Park', 'Tom Reyes', 'Lee Chan', 'Sam Ortiz')]
+    sheet = make_sheet(staff)
+
+    rows = [staff_row(record) for record in [person('Kim Wells')] + staff]
+    changed, cleared = WorkbookWriter()._write_sheet(sheet, rows)
+
+    # Only the new row is written; nobody below is shifted down
+    assert (changed, cleared) == (3, 0)
+    assert names(sheet) == ['Ann Park', 'Tom Reyes', 'Lee Chan', 'Sam Ortiz', 'Kim Wells']
+
+def test_title_change_touches_one_cell():
+    staff = [person('Ann Park'), person('Tom Reyes')]
+    sheet = make_sheet(staff)
+
+    staff[1]['Title'] = 'Director'
+    assert WorkbookWriter()._write_sheet(sheet, [staff_row(record) for record in staff]) == (1, 0)
+    assert sheet.cell(row=START_ROW + 1, column=COLUMNS.index('Title') + 1).value == 'Director'
+
+def test_departure_fills_gap_and_clears_stale_rows():
+    staff = [person(name) for name in ('Ann Park', 'Tom Reyes', 'Lee Chan')]
+    sheet = make_sheet(staff)
+
+    changed, cleared = WorkbookWriter()._write_sheet(sheet, [staff_row(staff[0]), staff_row(staff[2])])
+
+    # Lee Chan moves up into Tom Reyes's row and the last row is emptied
+    assert cleared == 1
+    assert names(sheet)[:2] == ['Ann Park', 'Lee Chan']
+    assert all(sheet.cell(row=START_ROW + 2, column=col).value is None for col in range(1, len(COLUMNS) + 1))
+    # Name and Email move (the titles match); the old row's three cells are emptied
+    assert changed == 5
+
+def test_write_state_tab_skips_missing_sheet(tmp_path):
+    path = str(tmp_path / 'meps.xlsx')
+    wb = Workbook()
+    wb.active.title = 'AL'
+    wb.save(path)
+
+    assert write_state_tab('ZZ', [person('Ann Park')], path) == {}
+    assert write_state_tab('AL', [person('Ann Park')], path) == {'AL': (3, 0)}
+    assert load_workbook(path)['AL'].cell(row=START_ROW, column=1).value == 'Ann Park'
@@ -0,0 +1,145 @@
+import time
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+
+import metrics
+
+# Default number of seconds to wait for any one condition
+DEFAULT_TIMEOUT = 10
+
+# Per-state overrides for slow sites
+STATE_TIMEOUTS = {
+    'AL': 15,
+    'AZ': 15,
+    'GA': 20,
+}
+
+POLL_INTERVAL = 0.1
+
+def timeout_for(state_abbrev):
+    """Return the wait timeout configured for a state"""
+    return STATE_TIMEOUTS.get(state_abbrev, DEFAULT_TIMEOUT)
+
+def _replaying(driver):
+    # A replayed page is already final, so there's nothing to wait for
+    return getattr(driver, 'replaying', False)
+
+def _wait(driver, condition, timeout):
+    if _replaying(driver):
+        try:
+            return condition(driver) or None
+        except Exception:
+            return None
+    with metrics.span('wait') as info:
+        try:
+            return WebDriverWait(driver, timeout, poll_frequency=POLL_INTERVAL).until(condition)
+        except TimeoutException:
+            info['timed_out'] = True
+            metrics.count('wait_timeouts')
+            return None
+
+def wait_for_selector(driver, selector, timeout=DEFAULT_TIMEOUT):
+    """Wait until an element matching a CSS selector is in the DOM; returns it or None"""
+    return _wait(driver, EC.presence_of_element_located((By.CSS_SELECTOR, selector)), timeout)
+
+def wait_for_visible(driver, selector, timeout=DEFAULT_TIMEOUT):
+    """Wait until an element (e.g. a modal) is displayed; returns it or None"""
+    return _wait(driver, EC.visibility_of_element_located((By.CSS_SELECTOR, selector)), timeout)
+
+def wait_for_any_visible(driver, selectors, timeout=DEFAULT_TIMEOUT):
+    """Wait until any of several selectors is displayed; returns the first match or None"""
+    def condition(d):
+        for selector in selectors:
+            for element in d.find_elements(By.CSS_SELECTOR, selector):
+                try:
+                    if element.is_displayed():
+                        return element
+                except Exception:
+                    continue
+        return False
+
+    return _wait(driver, condition, timeout)
+
+def wait_for_hidden(driver, selector, timeout=DEFAULT_TIMEOUT):
+    """Wait until an element (e.g. a closing modal) is hidden or removed"""
+    return _wait(driver, EC.invisibility_of_element_located((By.CSS_SELECTOR, selector)), timeout) is not None
+
+def wait_for_text_change(driver, selector, previous_text, timeout=DEFAULT_TIMEOUT):
+    """Wait until an element has non-empty text different from previous_text; returns the text"""
+    def condition(d):
+        elements = d.find_elements(By.CSS_SELECTOR, selector)
+        if not elements:
+            return False
+        text = elements[0].text.strip()
+        return text if text and text != previous_text else False
+
+    return _wait(driver, condition, timeout)
+
+def wait_for_count_stable(driver, selector, timeout=DEFAULT_TIMEOUT, settle=0.5):
+    """Wait until the number of matching elements is non-zero and stops changing.
+
+    Returns the final count (0 if nothing ever matched before the timeout).
+    """
+    if _replaying(driver):
+        return len(driver.find_elements(By.CSS_SELECTOR, selector))
+
+    deadline = time.monotonic() + timeout
+    last_count = -1
+    stable_since = time.monotonic()
+
+    with metrics.span('wait', selector=selector):
+        while time.monotonic() < deadline:
+            count = len(driver.find_elements(By.CSS_SELECTOR, selector))
+            if count != last_count:
+                last_count = count
+                stable_since = time.monotonic()
+            elif count and time.monotonic() - stable_since >= settle:
+                return count
+            time.sleep(POLL_INTERVAL)
+
+    metrics.count('wait_timeouts')
+    return max(last_count, 0)
+
+def wait_for_network_idle(driver, timeout=DEFAULT_TIMEOUT, idle_time=0.5):
+    """Wait until the page has loaded and no new resources or jQuery requests start for idle_time"""
+    script = """
+        return [
+            document.readyState,
+            (window.jQuery && window.jQuery.active) || 0,
+            performance.getEntriesByType('resource').length
+        ];
+    """
+    if _replaying(driver):
+        return True
+
+    deadline = time.monotonic() + timeout
+    last_resources = -1
+    idle_since = time.monotonic()
+
+    with metrics.span('wait', kind='network_idle'):
+        while time.monotonic() < deadline:
+            try:
+                ready_state, active, resources = driver.execute_script(script)
+            except Exception:
+                return False
+
+            if ready_state != 'complete' or active or resources != last_resources:
+                last_resources = resources
+                idle_since = time.monotonic()
+            elif time.monotonic() - idle_since >= idle_time:
+                return True
+            time.sleep(POLL_INTERVAL)
+
+    metrics.count('wait_timeouts')
+    return False
+
+def scroll_to_bottom(driver, selector=None, timeout=DEFAULT_TIMEOUT):
+    """Scroll to the bottom to trigger lazy-loading, then wait for the content to settle"""
+    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+    if selector:
+        wait_for_count_stable(driver, selector, timeout)
+    else:
+        wait_for_network_idle(driver, timeout)
+    driver.execute_script("window.scrollTo(0, 0);")
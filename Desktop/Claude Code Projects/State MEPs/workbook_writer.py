@@ -0,0 +1,136 @@
+from openpyxl import load_workbook
+
+import metrics
+
+WORKBOOK = 'state_meps.xlsx'
+
+# Staff rows start below the 3 header rows on every state tab
+START_ROW = 4
+
+# Column A-F layout of every state tab
+COLUMNS = ['Name', 'Title', 'Phone', 'Mobile', 'Email', 'Bio']
+
+def staff_row(staff):
+    """Turn a staff record into the A-F cell values (missing/NaN fields become "")"""
+    values = []
+    for column in COLUMNS:
+        value = staff.get(column)
+        if value is None or value != value:  # NaN from pandas is != itself
+            value = ""
+        values.append(value)
+    return values
+
+def _cell_value(cell):
+    # Empty cells read back as None; rows are built with "" for blanks
+    return "" if cell.value is None else cell.value
+
+def row_key(values):
+    """Identify a row's person: normalized email, else normalized name ("" for an empty row)"""
+    email = str(values[COLUMNS.index('Email')]).strip().lower()
+    if email.startswith('mailto:'):
+        email = email[7:]
+    if '@' in email:
+        return email
+    return ' '.join(str(values[COLUMNS.index('Name')]).lower().split())
+
+class WorkbookWriter:
+    """Collects staff rows for any number of state tabs and writes them with one load and one save"""
+
+    def __init__(self, path=WORKBOOK):
+        self.path = path
+        self.batches = {}
+
+    def add(self, state_abbrev, staff_data):
+        """Queue a state's rows; a later batch for the same state replaces the earlier one"""
+        self.batches[state_abbrev] = [staff_row(staff) for staff in staff_data]
+
+    def _write_sheet(self, sheet, rows):
+        """Match rows to the people already in the sheet and write only the differences.
+
+        Returns (cells changed, stale rows cleared). People already on the tab keep
+        their row (matched by email, else name), so one hire or departure near the
+        top touches a row or two rather than shifting everyone below. New people take
+        the rows of people who left; rows past the end of the new roster are moved
+        up into any remaining gaps and then emptied. The tab's order therefore
+        follows first appearance, not the scraped order.
+        """
+        current = [[_cell_value(cell) for cell in row_cells]
+                   for row_cells in sheet.iter_rows(min_row=START_ROW, max_row=max(sheet.max_row, START_ROW),
+                                                    min_col=1, max_col=len(COLUMNS))]
+        while current and not any(value != "" for value in current[-1]):
+            current.pop()
+        if not current and not rows:
+            return 0, 0
+
+        slots = {}
+        for idx, values in enumerate(current):
+            key = row_key(values)
+            if key:
+                slots.setdefault(key, []).append(idx)
+
+        # Same person -> same row; everyone else needs a row inside the new roster's range
+        placed = [None] * len(rows)
+        homeless = []
+        for idx, values in enumerate(rows):
+            existing = slots.get(row_key(values))
+            if existing:
+                placed[idx] = existing.pop(0)
+            if placed[idx] is None or placed[idx] >= len(rows):
+                homeless.append(idx)
+
+        taken = {slot for slot in placed if slot is not None and slot < len(rows)}
+        free = (slot for slot in range(len(rows)) if slot not in taken)
+        for idx in homeless:
+            placed[idx] = next(free)
+
+        target = [[""] * len(COLUMNS) for _ in range(max(len(current), len(rows)))]
+        for idx, slot in enumerate(placed):
+            target[slot] = rows[idx]
+
+        changed = 0
+        cleared = 0
+        for offset, values in enumerate(target):
+            old = current[offset] if offset < len(current) else [""] * len(COLUMNS)
+            if old == values:
+                continue
+            if offset >= len(rows):
+                cleared += 1
+            for col, (old_value, value) in enumerate(zip(old, values), 1):
+                if old_value != value:
+                    sheet.cell(row=START_ROW + offset, column=col).value = value if value != "" else None
+                    changed += 1
+
+        return changed, cleared
+
+    def flush(self):
+        """Apply every queued batch and save; returns {state: (cells changed, stale rows cleared)}.
+
+        Raises if the workbook can't be loaded or saved (e.g. it's open in Excel).
+        """
+        if not self.batches:
+            return {}
+
+        with metrics.span('excel_load'):
+            wb = load_workbook(self.path)
+
+        results = {}
+        for state_abbrev, rows in sorted(self.batches.items()):
+            if state_abbrev not in wb.sheetnames:
+                print(f"Warning: Sheet {state_abbrev} not found in workbook")
+                continue
+            results[state_abbrev] = self._write_sheet(wb[state_abbrev], rows)
+            changed, cleared = results[state_abbrev]
+            print(f"{state_abbrev}: {changed} cells changed, {cleared} stale rows cleared")
+
+        # Nothing differs from what's on disk - skip rewriting the file
+        if any(changed for changed, _ in results.values()):
+            with metrics.span('excel_save'):
+                wb.save(self.path)
+        self.batches = {}
+        return results
+
+def write_state_tab(state_abbrev, staff_data, path=WORKBOOK):
+    """Write one state's rows to its tab (a one-batch WorkbookWriter)"""
+    writer = WorkbookWriter(path)
+    writer.add(state_abbrev, staff_data)
+    return writer.flush()
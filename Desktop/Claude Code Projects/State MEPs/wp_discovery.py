@@ -0,0 +1,177 @@
+import json
+import sys
+import xml.etree.ElementTree as ET
+from urllib.parse import urljoin, urlparse
+
+import fetch
+from async_fetch import fetch_all
+from staff_store import load_fingerprints, save_fingerprints
+
+# Custom post types WordPress staff plugins/themes commonly register
+STAFF_POST_TYPES = ['staff', 'team', 'team-member', 'team_member', 'team-members',
+                    'people', 'person', 'employee', 'employees']
+
+SITEMAPS = ['/wp-sitemap.xml', '/sitemap.xml', '/sitemap_index.xml']
+
+# Most sitemap indexes are small; this keeps a huge blog from being crawled
+MAX_CHILD_SITEMAPS = 20
+
+REST_PAGE_SIZE = 100
+
+# page_fingerprints rows are keyed by URL; scrape_state.py stores content hashes
+# there for the same profile URLs, so modified dates live under their own prefix
+ROW_PREFIX = 'wp:'
+
+def _path_matches(url, path_prefix):
+    path = urlparse(url).path
+    # The roster page itself (e.g. /staff/) isn't a profile
+    return path.startswith(path_prefix) and path.rstrip('/') != path_prefix.rstrip('/')
+
+def _get(url):
+    """GET url and return the response, or None for anything but a 200"""
+    try:
+        response = fetch.get(url)
+        return response if response.status_code == 200 else None
+    except Exception as e:
+        print(f"  Error fetching {url}: {e}")
+        return None
+
+def parse_sitemap(xml):
+    """Return (is_index, [(loc, lastmod)]) for a sitemap or sitemap index"""
+    root = ET.fromstring(xml)
+    entries = []
+    for node in root:
+        loc = lastmod = ''
+        for child in node:
+            tag = child.tag.rsplit('}', 1)[-1]
+            if tag == 'loc':
+                loc = (child.text or '').strip()
+            elif tag == 'lastmod':
+                lastmod = (child.text or '').strip()
+        if loc:
+            entries.append((loc, lastmod))
+    return root.tag.endswith('sitemapindex'), entries
+
+def roster_from_rest(base_url, path_prefix, post_types=None):
+    """List profiles through the WP REST API: [(url, modified)] or [] if unavailable"""
+    candidates = list(post_types or []) + STAFF_POST_TYPES
+
+    # /types maps each post type to the rest_base its endpoint actually lives at
+    # (no /types means the REST API is off or blocked, so don't guess at endpoints)
+    response = _get(urljoin(base_url, '/wp-json/wp/v2/types'))
+    if response is None:
+        return []
+
+    rest_bases = []
+    try:
+        for slug, info in response.json().items():
+            rest_base = info.get('rest_base') or slug
+            if slug in candidates or rest_base in candidates:
+                rest_bases.append(rest_base)
+    except (ValueError, AttributeError):
+        return []
+
+    for rest_base in rest_bases:
+        roster = []
+        page, total_pages = 1, 1
+        while page <= total_pages:
+            url = urljoin(base_url, f'/wp-json/wp/v2/{rest_base}?per_page={REST_PAGE_SIZE}'
+                                    f'&page={page}&_fields=link,modified_gmt')
+            response = _get(url)
+            if response is None:
+                break
+            try:
+                items = response.json()
+            except ValueError:
+                break
+            if not isinstance(items, list):
+                break
+            roster.extend((item['link'], item.get('modified_gmt', ''))
+                          for item in items if isinstance(item, dict) and item.get('link'))
+            total_pages = int(response.headers.get('X-WP-TotalPages', 1) or 1)
+            page += 1
+
+        roster = [(url, modified) for url, modified in roster if _path_matches(url, path_prefix)]
+        if roster:
+            print(f"  {len(roster)} profiles from /wp-json/wp/v2/{rest_base}")
+            return roster
+
+    return []
+
+def roster_from_sitemaps(base_url, path_prefix, post_types=None):
+    """List profiles from wp-sitemap.xml / sitemap.xml: [(url, lastmod)] or [] if none match"""
+    hints = [hint.strip('/') for hint in [path_prefix] + list(post_types or []) + STAFF_POST_TYPES]
+    hints = [hint.rsplit('/', 1)[-1] for hint in hints if hint]
+
+    for sitemap in SITEMAPS:
+        response = _get(urljoin(base_url, sitemap))
+        if response is None:
+            continue
+        try:
+            is_index, entries = parse_sitemap(response.content)
+        except ET.ParseError:
+            continue
+
+        if is_index:
+            # Prefer child sitemaps named after the post type (wp-sitemap-posts-team-1.xml, staff-sitemap.xml)
+            children = [loc for loc, _ in entries if any(hint in loc for hint in hints)]
+            children = (children or [loc for loc, _ in entries])[:MAX_CHILD_SITEMAPS]
+            entries = []
+            for body in fetch_all(children).values():
+                if body is None:
+                    continue
+                try:
+                    entries.extend(parse_sitemap(body)[1])
+                except ET.ParseError:
+                    continue
+
+        roster = [(loc, lastmod) for loc, lastmod in entries if _path_matches(loc, path_prefix)]
+        if roster:
+            print(f"  {len(roster)} profiles from {sitemap}")
+            return roster
+
+    return []
+
+def discover_roster(base_url, path_prefix, post_types=None):
+    """Find every profile URL under path_prefix without crawling HTML.
+
+    Tries the WP REST API, then wp-sitemap.xml / sitemap.xml. Returns
+    [(url, last_modified)] in the site's order, or [] so the caller can fall
+    back to scraping links from the team page.
+    """
+    print(f"Discovering {path_prefix} profiles on {base_url}...")
+    roster = roster_from_rest(base_url, path_prefix, post_types) or \
+        roster_from_sitemaps(base_url, path_prefix, post_types)
+
+    if not roster:
+        print("  No REST or sitemap roster found")
+    return list(dict(roster).items())
+
+def _modified_key(modified):
+    return f"modified:{modified}"
+
+def unchanged_records(roster):
+    """Return {url: record} for profiles whose last-modified date matches the last run"""
+    dated = {url: modified for url, modified in roster if modified}
+    known = load_fingerprints(ROW_PREFIX + url for url in dated)
+    unchanged = {}
+    for url, modified in dated.items():
+        key, records = known.get(ROW_PREFIX + url, (None, None))
+        if records and key == _modified_key(modified):
+            unchanged[url] = records
+    return unchanged
+
+def remember_records(roster, records_by_url):
+    """Store each freshly parsed profile under its last-modified date for the next run"""
+    modified = dict(roster)
+    save_fingerprints({ROW_PREFIX + url: (_modified_key(modified[url]), record)
+                       for url, record in records_by_url.items() if modified.get(url)})
+
+if __name__ == "__main__":
+    # Usage: python wp_discovery.py <site> <profile path prefix>, e.g. https://gamep.org /meet-the-team/
+    if len(sys.argv) != 3:
+        print("Usage: python wp_discovery.py <site> <profile path prefix>")
+        sys.exit(1)
+
+    roster = discover_roster(sys.argv[1], sys.argv[2])
+    print(json.dumps(roster, indent=2))